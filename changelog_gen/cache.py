@@ -0,0 +1,115 @@
+"""Persistent cache of parsed commit logs, stored in the repository's git directory."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import typing
+
+from changelog_gen.extractor import Change
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+    from changelog_gen.config import CommitType
+    from changelog_gen.vcs import Git
+
+logger = logging.getLogger(__name__)
+
+# Bump when the serialized format of cache entries changes, invalidates existing caches.
+CACHE_VERSION = 4
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+def fingerprint(commit_types: dict[str, CommitType]) -> str:
+    """Generate a stable fingerprint of the commit type configuration."""
+    data = {k: dataclasses.asdict(v) for k, v in commit_types.items()}
+    content = json.dumps([CACHE_VERSION, data], sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class ParseCache:
+    """Map commit hashes to parsed changes, `None` for non conventional commits.
+
+    Entries are kept in least recently used order, entries no longer reachable
+    from HEAD, or beyond `max_entries`, are evicted on save.
+    """
+
+    def __init__(self: typing.Self, path: Path, fingerprint: str, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.entries: dict[str, dict | None] = {}
+        self.seen: set[str] = set()
+        self.changed = False
+
+    @classmethod
+    def load(
+        cls: type[ParseCache],
+        path: Path,
+        fingerprint: str,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> ParseCache:
+        """Load an existing cache, discarding it if unreadable or built from different configuration."""
+        cache = cls(path, fingerprint, max_entries=max_entries)
+        if not path.exists():
+            return cache
+
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            logger.info("  Discarding unreadable parse cache '%s'", path)
+            return cache
+
+        if data.get("fingerprint") != fingerprint:
+            logger.info("  Configuration changed, discarding parse cache.")
+            cache.changed = True
+            return cache
+
+        cache.entries = data.get("entries", {})
+        return cache
+
+    def __contains__(self: typing.Self, commit_hash: str) -> bool:  # noqa: D105
+        return commit_hash in self.entries
+
+    def __getitem__(self: typing.Self, commit_hash: str) -> Change | None:  # noqa: D105
+        # Reinsert to mark as most recently used.
+        data = self.entries.pop(commit_hash)
+        self.entries[commit_hash] = data
+        self.seen.add(commit_hash)
+        return Change(**data) if data is not None else None
+
+    def __setitem__(self: typing.Self, commit_hash: str, change: Change | None) -> None:  # noqa: D105
+        self.entries.pop(commit_hash, None)
+        self.entries[commit_hash] = change.to_dict() if change is not None else None
+        self.seen.add(commit_hash)
+        self.changed = True
+
+    def evict(self: typing.Self, git: Git) -> None:
+        """Drop unreachable entries, and least recently used entries over the size limit."""
+        unseen = [commit_hash for commit_hash in self.entries if commit_hash not in self.seen]
+        for commit_hash in git.unreachable_commits(unseen):
+            self.entries.pop(commit_hash, None)
+            self.changed = True
+
+        overflow = len(self.entries) - self.max_entries
+        if overflow > 0:
+            for commit_hash in list(self.entries)[:overflow]:
+                del self.entries[commit_hash]
+            self.changed = True
+
+    def save(self: typing.Self, git: Git) -> None:
+        """Evict stale entries and persist the cache if it has changed."""
+        self.evict(git)
+        if not self.changed:
+            return
+
+        logger.info("  Writing parse cache '%s'", self.path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"fingerprint": self.fingerprint, "entries": self.entries}))
+        tmp.replace(self.path)
+        self.changed = False
@@ -6,13 +6,10 @@ import logging
 import logging.config
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from warnings import warn
 
-import click
-import rtoml
 import typer
-from rich.logging import RichHandler
 
 from changelog_gen import (
     config,
@@ -22,9 +19,15 @@ from changelog_gen import (
 )
 from changelog_gen.cli import util
 from changelog_gen.extractor import extract_version_tag
-from changelog_gen.post_processor import per_issue_post_process
-from changelog_gen.vcs import Git
-from changelog_gen.version import BumpVersion
+from changelog_gen.profiler import Profiler
+from changelog_gen.vcs import Git, NativeGit
+
+if TYPE_CHECKING:
+    from changelog_gen.post_processor import Journal
+    from changelog_gen.version import BumpVersion
+
+# httpx, bumpversion, rtoml, rich and asyncio are imported inside the commands that
+# use them, so that `changelog --version` and git hooks don't pay their import cost.
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +41,9 @@ VERBOSITY = {
 
 def setup_logging(verbose: int = 0) -> None:
     """Configure the logging."""
+    import click
+    from rich.logging import RichHandler
+
     logging.basicConfig(
         level=VERBOSITY.get(verbose, logging.DEBUG),
         format="%(message)s",
@@ -80,6 +86,10 @@ def _callback(
 app = typer.Typer(name="changelog", callback=_callback)
 init_app = typer.Typer(name="init")
 gen_app = typer.Typer(name="generate")
+hook_app = typer.Typer(name="hook", help="Manage the git hook recording parsed changes as git notes.")
+app.add_typer(hook_app)
+
+HOOK_MARKER = "# Installed by changelog-gen."
 
 
 def process_info(info: dict, cfg: config.Config, *, dry_run: bool) -> None:
@@ -141,9 +151,109 @@ def migrate(
     config.check_deprecations(cfg)
     if "post_process" in cfg and "headers" in cfg["post_process"]:
         cfg["post_process"]["headers"] = json.loads(cfg["post_process"]["headers"])
+    import rtoml
+
     typer.echo(rtoml.dumps({"tool": {"changelog_gen": cfg}}))
 
 
+@app.command("backfill")
+def backfill(
+    file_format: writer.Extension = typer.Option("md", help="File format to generate."),
+    *,
+    dry_run: bool = typer.Option(False, help="Don't write release notes, check for errors."),  # noqa: FBT003
+    verbose: int = typer.Option(0, "-v", "--verbose", help="Set output verbosity.", count=True, max=3),
+) -> None:
+    """Generate a CHANGELOG file for all existing version tags.
+
+    Walk the commit history once, splitting changes into releases at version
+    tags, and write every release section to a new CHANGELOG.
+    """
+    setup_logging(verbose)
+    cfg = config.read(verbose=verbose)
+    extension = util.detect_extension()
+    if extension is not None:
+        logger.error("CHANGELOG.%s detected.", extension.value)
+        raise typer.Exit(code=1)
+
+    git = _git(cfg, dry_run=dry_run)
+    e = extractor.ReleaseNoteExtractor(cfg=cfg, git=git, dry_run=dry_run)
+    try:
+        releases = e.extract_releases()
+    except errors.ChangelogException as ex:
+        logger.error("%s", ex)  # noqa: TRY400
+        raise typer.Exit(code=1) from ex
+
+    if not releases:
+        logger.error("No version tags found.")
+        raise typer.Exit(code=1)
+
+    w = writer.new_writer(file_format, cfg, dry_run=dry_run)
+    for release in releases:
+        version_string = cfg.version_string.format(new_version=release.version)
+        if cfg.date_format:
+            release_date = datetime.fromtimestamp(release.timestamp, timezone.utc)
+            version_string += f" {release_date.strftime(cfg.date_format)}"
+
+        w.add_version(version_string)
+        w.consume(cfg.type_headers, release.sections)
+
+    if dry_run:
+        logger.error(str(w))
+    w.write()
+
+
+@app.command("post-process")
+def post_process(
+    resume: str = typer.Option(..., help="Resume interrupted post processing for a released version."),
+    post_process_url: Optional[str] = typer.Option(
+        None,
+        help="Rest API endpoint to post release version notifications to.",
+    ),
+    post_process_auth_env: Optional[str] = typer.Option(
+        None,
+        help="Name of the ENV variable that contains the rest API basic auth content.",
+    ),
+    *,
+    dry_run: bool = typer.Option(False, help="Don't send requests, list outstanding requests."),  # noqa: FBT003
+    verbose: int = typer.Option(0, "-v", "--verbose", help="Set output verbosity.", count=True, max=3),
+) -> None:
+    """Resume post processing of a release.
+
+    Send only the requests not recorded as successful in the post process journal.
+    """
+    setup_logging(verbose)
+    cfg = config.read(
+        post_process_url=post_process_url,
+        post_process_auth_env=post_process_auth_env,
+        verbose=verbose,
+    )
+    if not cfg.post_process or not cfg.post_process.url:
+        logger.error("No post_process url configured.")
+        raise typer.Exit(code=1)
+
+    from changelog_gen.post_processor import batch_post_process, per_issue_post_process
+
+    journal = _journal(Git(dry_run=dry_run))
+    outstanding = journal.outstanding(resume)
+    if not outstanding:
+        logger.error("No outstanding post process requests for %s.", resume)
+        return
+
+    post_process_func = batch_post_process if cfg.post_process.batch else per_issue_post_process
+    post_process_func(cfg.post_process, outstanding, resume, dry_run=dry_run, journal=journal)
+
+
+def _journal(git: Git) -> Journal:
+    from changelog_gen.post_processor import Journal
+
+    return Journal(git.get_git_dir() / "changelog_gen" / "post_process.jsonl")
+
+
+def _git(cfg: config.Config, *, dry_run: bool) -> Git:
+    git_cls = NativeGit if cfg.git_backend == "native" else Git
+    return git_cls(dry_run=dry_run)
+
+
 @gen_app.command("changelog-gen")
 @app.command("generate")
 def gen(  # noqa: PLR0913
@@ -165,6 +275,15 @@ def gen(  # noqa: PLR0913
     release: Optional[bool] = typer.Option(None, help="Use bumpversion to tag the release."),
     commit: Optional[bool] = typer.Option(None, help="Commit changes made to changelog after writing."),
     reject_empty: Optional[bool] = typer.Option(None, help="Don't accept changes if there are no release notes."),
+    max_commits: Optional[int] = typer.Option(None, help="Read at most this many commits when no tag is found."),
+    since: Optional[str] = typer.Option(None, help="Only read commits more recent than a date when no tag is found."),
+    stop_at_changelog: Optional[bool] = typer.Option(
+        None,
+        help="Stop reading commits at the last CHANGELOG change when no tag is found.",
+    ),
+    profile: bool = typer.Option(False, help="Print wall time and subprocess count for each phase."),  # noqa: FBT003
+    profile_json: Optional[Path] = typer.Option(None, help="Write wall time and subprocess count trace to a file."),
+    trace_file: Optional[Path] = typer.Option(None, help="Write a JSON line per extracted commit to a file."),
     verbose: int = typer.Option(0, "-v", "--verbose", help="Set output verbosity.", count=True, max=3),
     _version: Optional[bool] = typer.Option(
         None,
@@ -190,16 +309,26 @@ def gen(  # noqa: PLR0913
         commit=commit,
         reject_empty=reject_empty,
         date_format=date_format,
+        max_commits=max_commits,
+        since=since,
+        stop_at_changelog=stop_at_changelog,
+        trace_file=str(trace_file) if trace_file else None,
         post_process_url=post_process_url,
         post_process_auth_env=post_process_auth_env,
         verbose=verbose,
     )
 
+    profiler = Profiler(enabled=profile or profile_json is not None)
     try:
-        _gen(cfg, version_part, version_tag, dry_run=dry_run)
+        _gen(cfg, version_part, version_tag, dry_run=dry_run, profiler=profiler)
     except errors.ChangelogException as ex:
         logger.error("%s", ex)  # noqa: TRY400
         raise typer.Exit(code=1) from ex
+    finally:
+        if profile:
+            typer.echo(profiler.table(), err=True)
+        if profile_json is not None:
+            profiler.write_json(profile_json, importlib.metadata.version("changelog-gen"))
 
 
 def _gen(
@@ -208,9 +337,22 @@ def _gen(
     version_tag: str | None = None,
     *,
     dry_run: bool = False,
+    profiler: Profiler | None = None,
 ) -> None:
+    import asyncio
+
+    from changelog_gen.version import BumpVersion
+
+    profiler = profiler or Profiler()
+    if cfg.packages:
+        if version_tag is not None:
+            logger.error("--version-tag is not supported for monorepo packages, use --version-part.")
+            raise typer.Exit(code=1)
+        _gen_packages(cfg, version_part, dry_run=dry_run, profiler=profiler)
+        return
+
     bv = BumpVersion(verbose=cfg.verbose, dry_run=dry_run)
-    git = Git(dry_run=dry_run)
+    git = _git(cfg, dry_run=dry_run)
 
     extension = util.detect_extension()
 
@@ -218,23 +360,25 @@ def _gen(
         logger.error("No CHANGELOG file detected, run `changelog init`")
         raise typer.Exit(code=1)
 
-    process_info(git.get_current_info(), cfg, dry_run=dry_run)
+    with profiler.span("probes"):
+        (version_info_,) = asyncio.run(_probe(git, [bv], cfg, dry_run=dry_run))
 
-    version_info_ = bv.get_version_info("patch")
-    e = extractor.ReleaseNoteExtractor(cfg=cfg, git=git, dry_run=dry_run)
-    sections = e.extract(version_info_["current"])
+    with profiler.span("extract"):
+        e = extractor.ReleaseNoteExtractor(cfg=cfg, git=git, dry_run=dry_run)
+        sections = e.extract(version_info_["current"])
 
     unique_issues = e.unique_issues(sections)
     if not unique_issues and cfg.reject_empty:
         logger.error("No changes present and reject_empty configured.")
         raise typer.Exit(code=0)
 
-    if version_part is not None:
-        version_info_ = bv.get_version_info(version_part)
-        version_tag = version_info_["new"]
+    with profiler.span("version_tag"):
+        if version_part is not None:
+            version_info_ = bv.get_version_info(version_part)
+            version_tag = version_info_["new"]
 
-    if version_tag is None:
-        version_tag = extract_version_tag(sections, cfg, bv)
+        if version_tag is None:
+            version_tag = extract_version_tag(sections, cfg, bv)
 
     version_string = cfg.version_string.format(new_version=version_tag)
 
@@ -242,51 +386,266 @@ def _gen(
     if date_fmt:
         version_string += f" {datetime.now(timezone.utc).strftime(date_fmt)}"
 
-    w = writer.new_writer(extension, cfg, dry_run=dry_run)
+    with profiler.span("render"):
+        w = writer.new_writer(extension, cfg, dry_run=dry_run)
 
-    w.add_version(version_string)
-    w.consume(cfg.type_headers, sections)
+        w.add_version(version_string)
+        w.consume(cfg.type_headers, sections)
 
     logger.error(str(w))
 
-    processed = _finalise(w, e, version_tag, extension, cfg, dry_run=dry_run)
+    processed = _finalise({"": w}, {"": version_tag}, cfg, extractor=e, dry_run=dry_run, profiler=profiler)
 
     post_process = cfg.post_process
     if post_process and processed:
+        from changelog_gen.post_processor import batch_post_process, per_issue_post_process
+
         unique_issues = [r for r in unique_issues if not r.startswith("__")]
-        per_issue_post_process(post_process, sorted(unique_issues), version_tag, dry_run=dry_run)
+        post_process_func = batch_post_process if post_process.batch else per_issue_post_process
+        with profiler.span("post_process"):
+            post_process_func(
+                post_process,
+                sorted(unique_issues),
+                version_tag,
+                dry_run=dry_run,
+                journal=_journal(git),
+            )
+
+
+async def _probe(
+    git: Git,
+    bvs: list[BumpVersion],
+    cfg: config.Config,
+    *,
+    dry_run: bool,
+) -> list[dict[str, str]]:
+    """Run the independent git status, version and tag index probes concurrently.
+
+    Errors are raised in the order the probes would have run sequentially.
+
+    Returns:
+        version info for each BumpVersion.
+    """
+    import asyncio
+
+    info, tag_index, *version_infos = await asyncio.gather(
+        git.get_current_info_async(untracked_files=cfg.untracked_files),
+        git.tag_index_async(),
+        *(bv.get_version_info_async("patch") for bv in bvs),
+        return_exceptions=True,
+    )
+    if isinstance(info, BaseException):
+        raise info
+    process_info(info, cfg, dry_run=dry_run)
+
+    for result in (*version_infos, tag_index):
+        if isinstance(result, BaseException):
+            raise result
+    return version_infos
+
+
+def _gen_packages(
+    cfg: config.Config,
+    version_part: str | None,
+    *,
+    dry_run: bool,
+    profiler: Profiler,
+) -> None:
+    """Generate a changelog entry for each monorepo package from a single history walk.
+
+    Packages without changes are skipped, all CHANGELOGs are written in a
+    single commit and each package is then released independently.
+    """
+    import asyncio
+
+    from changelog_gen.version import BumpVersion
+
+    git = _git(cfg, dry_run=dry_run)
+    bvs = {
+        name: BumpVersion(verbose=cfg.verbose, dry_run=dry_run, path=Path(package.path))
+        for name, package in cfg.packages.items()
+    }
+
+    extensions = {name: util.detect_extension(Path(package.path)) for name, package in cfg.packages.items()}
+    missing = [name for name, extension in extensions.items() if extension is None]
+    if missing:
+        logger.error("No CHANGELOG file detected for %s, run `changelog init`", ", ".join(missing))
+        raise typer.Exit(code=1)
+
+    with profiler.span("probes"):
+        version_infos = asyncio.run(_probe(git, list(bvs.values()), cfg, dry_run=dry_run))
+        current_versions = {name: version_info["current"] for name, version_info in zip(bvs, version_infos)}
+
+    with profiler.span("extract"):
+        e = extractor.ReleaseNoteExtractor(cfg=cfg, git=git, dry_run=dry_run)
+        package_sections = e.extract_packages(cfg.packages, current_versions)
+
+    version_tags, unique_issues = {}, {}
+    with profiler.span("version_tag"):
+        for name, sections in package_sections.items():
+            # Computed before the writers consume the sections.
+            unique_issues[name] = e.unique_issues(sections)
+            if not unique_issues[name]:
+                logger.warning("No changes present for %s, skipping.", name)
+                continue
+
+            bv = bvs[name]
+            if version_part is not None:
+                version_tags[name] = bv.get_version_info(version_part)["new"]
+            else:
+                version_tags[name] = extract_version_tag(sections, cfg, bv)
+
+    if not version_tags:
+        logger.error("No changes present in any package.")
+        raise typer.Exit(code=0)
+
+    date_suffix = f" {datetime.now(timezone.utc).strftime(cfg.date_format)}" if cfg.date_format else ""
+    writers = {}
+    with profiler.span("render"):
+        for name, version_tag in version_tags.items():
+            w = writer.new_writer(extensions[name], cfg, dry_run=dry_run, path=Path(cfg.packages[name].path))
+            w.add_version(cfg.version_string.format(new_version=version_tag) + date_suffix)
+            w.consume(cfg.type_headers, package_sections[name])
+            writers[name] = w
+
+            logger.error("%s\n%s", name, w)
+
+    # Release notes are not supported in monorepo mode, leave them in place.
+    processed = _finalise(writers, version_tags, cfg, dry_run=dry_run, profiler=profiler)
+
+    post_process = cfg.post_process
+    if post_process and processed:
+        from changelog_gen.post_processor import batch_post_process, per_issue_post_process
+
+        post_process_func = batch_post_process if post_process.batch else per_issue_post_process
+        with profiler.span("post_process"):
+            for name, version_tag in version_tags.items():
+                post_process_func(
+                    post_process,
+                    sorted(r for r in unique_issues[name] if not r.startswith("__")),
+                    f"{cfg.packages[name].tag_prefix}{version_tag}",
+                    dry_run=dry_run,
+                    journal=_journal(git),
+                )
 
 
 def _finalise(  # noqa: PLR0913
-    writer: writer.BaseWriter,
-    extractor: extractor.ReleaseNoteExtractor,
-    version_tag: str,
-    extension: writer.Extension,
+    writers: dict[str, writer.BaseWriter],
+    version_tags: dict[str, str],
     cfg: config.Config,
     *,
+    extractor: extractor.ReleaseNoteExtractor | None = None,
     dry_run: bool,
+    profiler: Profiler | None = None,
 ) -> bool:
-    bv = BumpVersion(verbose=cfg.verbose, dry_run=dry_run, allow_dirty=cfg.allow_dirty)
+    """Confirm, write and commit CHANGELOGs, then release each new version.
+
+    `writers` and `version_tags` are keyed by package name, `""` outside of a
+    monorepo. Each version is released from the directory of its CHANGELOG.
+    Parsed release notes are cleaned up by `extractor`, if given. If any
+    release fails, the CHANGELOG commit and earlier releases are reverted.
+
+    Returns:
+        whether the CHANGELOGs were written.
+    """
+    from changelog_gen.version import BumpVersion
+
+    profiler = profiler or Profiler()
     git = Git(dry_run=dry_run, commit=cfg.commit)
 
-    if dry_run or typer.confirm(
-        f"Write CHANGELOG for suggested version {version_tag}",
-    ):
-        writer.write()
-        extractor.clean()
-
-        paths = [f"CHANGELOG.{extension.value}"]
-        if Path("release_notes").exists():
-            paths.append("release_notes")
-        git.commit(version_tag, paths)
-
-        if cfg.commit and cfg.release:
-            try:
-                bv.release(version_tag)
-            except Exception as e:  # noqa: BLE001
-                git.revert()
-                logger.error("Error creating release: %s", str(e))  # noqa: TRY400
-                raise typer.Exit(code=1) from e
-        return True
-
-    return False
+    summary = ", ".join(f"{name} {version_tag}" if name else version_tag for name, version_tag in version_tags.items())
+    prompt = (
+        "Write CHANGELOGs for suggested versions" if len(version_tags) > 1 else "Write CHANGELOG for suggested version"
+    )
+    if not dry_run and not typer.confirm(f"{prompt} {summary}"):
+        return False
+
+    with profiler.span("write"):
+        for w in writers.values():
+            w.write()
+        if extractor is not None:
+            extractor.clean()
+
+    paths = [str(w.changelog) for w in writers.values()]
+    if extractor is not None and Path("release_notes").exists():
+        paths.append("release_notes")
+
+    release = cfg.commit and cfg.release
+    base = git.rev_parse("HEAD") if release else None
+    with profiler.span("commit"):
+        git.commit(summary, paths)
+
+    if release:
+        with profiler.span("release"):
+            for name, version_tag in version_tags.items():
+                bv = BumpVersion(
+                    verbose=cfg.verbose,
+                    dry_run=dry_run,
+                    allow_dirty=cfg.allow_dirty,
+                    path=writers[name].changelog.parent,
+                )
+                try:
+                    bv.release(version_tag)
+                except Exception as e:  # noqa: BLE001
+                    git.revert(base)
+                    logger.error("Error creating release%s: %s", f" for {name}" if name else "", str(e))  # noqa: TRY400
+                    raise typer.Exit(code=1) from e
+    return True
+
+
+@hook_app.command("install")
+def hook_install(
+    *,
+    force: bool = typer.Option(False, help="Replace an existing post-commit hook."),  # noqa: FBT003
+    verbose: int = typer.Option(0, "-v", "--verbose", help="Set output verbosity.", count=True, max=3),
+) -> None:
+    """Install a post-commit hook that parses each new commit into a git note.
+
+    Generation reads the notes in bulk, and only parses commits without one.
+    The hook runs the `changelog` command found on `PATH` at commit time, so
+    it keeps working when a virtualenv is recreated. Commits made without
+    `changelog` available are not recorded, and are parsed at generation.
+    """
+    setup_logging(verbose)
+    git = Git()
+    hook = git.hooks_dir() / "post-commit"
+
+    if hook.exists() and HOOK_MARKER not in hook.read_text() and not force:
+        logger.error("Existing post-commit hook detected, use --force to replace it.")
+        raise typer.Exit(code=1)
+
+    hook.parent.mkdir(parents=True, exist_ok=True)
+    hook.write_text(
+        f"""#!/bin/sh
+{HOOK_MARKER}
+if command -v changelog >/dev/null 2>&1; then
+    changelog hook post-commit
+fi
+""",
+    )
+    hook.chmod(0o755)
+    # `notes.rewriteRef` is deliberately not set, git would copy the note of
+    # the original commit over the note the hook records for an amended or
+    # rebased commit.
+
+    typer.echo(f"Installed {hook}, set `commit_notes = true` to use the recorded changes.")
+
+
+@hook_app.command("post-commit", hidden=True)
+def hook_post_commit(
+    verbose: int = typer.Option(0, "-v", "--verbose", help="Set output verbosity.", count=True, max=3),
+) -> None:
+    """Parse the latest commit into a git note."""
+    from changelog_gen import notes
+    from changelog_gen.cache import fingerprint
+
+    setup_logging(verbose)
+    try:
+        cfg = config.read(verbose=verbose)
+        git = Git()
+        ((short_hash, commit_hash, log),) = git.get_logs(None, max_count=1)
+        change = extractor.parse_commit_log(short_hash, commit_hash, log, cfg.type_headers)
+        git.add_note(notes.NOTES_REF, commit_hash, notes.dump(change, fingerprint(cfg.commit_types)))
+    except Exception as ex:  # noqa: BLE001
+        # Never fail the commit, generation parses commits without a note.
+        logger.error("Unable to record changelog note: %s", ex)  # noqa: TRY400
@@ -5,9 +5,9 @@ from pathlib import Path
 from changelog_gen.writer import Extension
 
 
-def detect_extension() -> str | None:
-    """Detect existing CHANGELOG file extension."""
+def detect_extension(path: Path | None = None) -> str | None:
+    """Detect existing CHANGELOG file extension, in `path` or the current directory."""
     for ext in Extension:
-        if Path(f"CHANGELOG.{ext.value}").exists():
+        if ((path or Path()) / f"CHANGELOG.{ext.value}").exists():
             return ext
     return None
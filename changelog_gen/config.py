@@ -13,8 +13,6 @@ from configparser import (
 from pathlib import Path
 from warnings import warn
 
-import rtoml
-
 from changelog_gen import errors
 
 logger = logging.getLogger(__name__)
@@ -160,12 +158,26 @@ class PostProcessConfig:
     verb: str = "POST"
     # The body to send as a post-processing command,
     # can have the entries: ::issue_ref::, ::version::
+    # or in batch mode: ::issue_refs::, ::version::
     body: str = '{"body": "Released on ::version::"}'
     auth_type: str = "basic"  # future proof config
     headers: dict | None = None
     # Name of an environment variable to use as HTTP Basic Auth parameters.
     # The variable should contain "{user}:{api_key}"
     auth_env: str | None = None
+    # Send one request per batch of issues, rather than one request per issue.
+    batch: bool = False
+    batch_size: int = 50
+    # Maximum number of requests in flight at once.
+    max_concurrency: int = 1
+    # Retry 429/5xx responses and connection errors, with exponential backoff
+    # (seconds) and jitter between attempts. `Retry-After` headers are honoured
+    # up to `max_backoff`.
+    retries: int = 0
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    # Maximum requests per second, unlimited if not set.
+    rate_limit: float | None = None
 
     @classmethod
     def from_dict(cls: type[PostProcessConfig], data: dict) -> PostProcessConfig:
@@ -175,6 +187,18 @@ class PostProcessConfig:
         return cls(**data)
 
 
+@dataclasses.dataclass
+class PackageConfig:
+    """Monorepo package configuration options."""
+
+    # Package directory relative to the repository root, contains the package
+    # CHANGELOG and bumpversion configuration. Commits touching files under it
+    # are included in the package changelog.
+    path: str
+    # Prefix of the package version tags, i.e. `core-` for `core-v1.2.3` tags.
+    tag_prefix: str = ""
+
+
 @dataclasses.dataclass
 class Config:
     """Changelog configuration options."""
@@ -192,9 +216,32 @@ class Config:
     release: bool = False
     commit: bool = False
     allow_dirty: bool = False
+    # `git status --untracked-files` mode used for dirty detection, `no` skips
+    # the untracked file scan on large worktrees.
+    untracked_files: str = "normal"
     reject_empty: bool = False
+    # Cache parsed commits in the git directory, only new commits are parsed on each run.
+    parse_cache: bool = False
+    # Parse commits across this many processes, only worthwhile for ranges of
+    # tens of thousands of commits.
+    parse_workers: int = 0
+    # Write one JSON line per extracted commit to this file, for debugging extraction.
+    trace_file: str | None = None
+    # Use changes parsed at commit time by the `changelog hook install` hook, stored as git notes.
+    commit_notes: bool = False
+    # Read commit history with the git cli (`cli`), or in process from the object store (`native`).
+    git_backend: str = "cli"
+    # Bound the history walk when no tag exists for the current version, i.e.
+    # first runs on repositories with a long untagged history.
+    max_commits: int | None = None
+    # Only walk commits more recent than a date, any `git log --since` format.
+    since: str | None = None
+    # Stop at the most recent commit that changed the CHANGELOG.
+    stop_at_changelog: bool = False
 
     post_process: PostProcessConfig | None = None
+    # Monorepo mode, map of package name to package configuration.
+    packages: dict[str, PackageConfig] = dataclasses.field(default_factory=dict)
 
     @property
     def semver_mappings(self: typing.Self) -> dict[str, str]:
@@ -213,6 +260,10 @@ class Config:
             for k, v in data["commit_types"].items():
                 value = json.loads(v) if isinstance(v, str) else v
                 data["commit_types"][k] = CommitType(**value)
+        if "packages" in data:
+            data["packages"] = {
+                k: v if isinstance(v, PackageConfig) else PackageConfig(**v) for k, v in data["packages"].items()
+            }
         return cls(**data)
 
 
@@ -237,6 +288,8 @@ def _process_overrides(overrides: dict) -> tuple[dict, PostProcessConfig | None]
 
 
 def _process_pyproject(pyproject: Path) -> dict:
+    import rtoml
+
     cfg = {}
     with pyproject.open() as f:
         data = rtoml.load(f)
@@ -389,7 +442,7 @@ def read(**kwargs) -> Config:  # noqa: C901
                 data = data[key]
 
         # check for non supported replace keys
-        supported = {"::issue_ref::", "::version::", "::commit_hash::"}
+        supported = {"::issue_ref::", "::issue_refs::", "::version::", "::commit_hash::"}
         unsupported = sorted(set(re.findall(r"(::.*?::)", value or "") or []) - supported)
         if unsupported:
             msg = f"""Replace string(s) ('{"', '".join(unsupported)}') not supported."""
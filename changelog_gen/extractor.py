@@ -1,23 +1,43 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses
+import functools
+import itertools
+import json
 import logging
+import os
 import re
+import sys
 import typing
-from collections import defaultdict
+from collections import defaultdict, deque
 from pathlib import Path
 from warnings import warn
 
 if typing.TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from changelog_gen import config
+    from changelog_gen.cache import ParseCache
     from changelog_gen.vcs import Git
     from changelog_gen.version import BumpVersion
 
 logger = logging.getLogger(__name__)
 
 
-@dataclasses.dataclass
-class Change:  # noqa: D101
+# `__slots__` drop the per instance `__dict__`, dataclass slots support requires python 3.10.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclasses.dataclass(**_SLOTS)
+class Change:
+    """Represent a single changelog entry.
+
+    Changes are sorted breaking first, then by scope and issue reference, the
+    sort key is computed once on construction. Use `dataclasses.replace` rather
+    than assignment to change a field, so the key is kept up to date.
+    """
+
     issue_ref: str
     description: str
     commit_type: str
@@ -28,15 +48,258 @@ class Change:  # noqa: D101
     short_hash: str | None = None
     commit_hash: str | None = None
 
+    sort_key: tuple[bool, str, str] = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self: typing.Self) -> None:  # noqa: D105
+        # Commit types and scopes repeat across a release, share a single copy.
+        self.commit_type = sys.intern(self.commit_type)
+        self.scope = sys.intern(self.scope)
+        issue_ref = self.issue_ref.lower()
+        self.sort_key = (
+            not self.breaking,
+            sys.intern(self.scope.lower()) if self.scope else "zzz",
+            # Reuse the original string when already lower case.
+            self.issue_ref if issue_ref == self.issue_ref else issue_ref,
+        )
+
     def __lt__(self: typing.Self, other: Change) -> bool:  # noqa: D105
-        s = (not self.breaking, self.scope.lower() if self.scope else "zzz", self.issue_ref.lower())
-        o = (not other.breaking, other.scope.lower() if other.scope else "zzz", other.issue_ref.lower())
-        return s < o
+        return self.sort_key < other.sort_key
+
+    def to_dict(self: typing.Self) -> dict:
+        """Serialize the constructor arguments, derived fields are rebuilt on construction."""
+        return {f.name: getattr(self, f.name) for f in dataclasses.fields(self) if f.init}
 
 
 SectionDict = dict[str, dict[str, Change]]
 
 
+@dataclasses.dataclass
+class Release:
+    """Represent a tagged release and the changes it contains."""
+
+    version: str
+    timestamp: int
+    sections: SectionDict
+
+
+# Tags treated as release boundaries, `v1.2`, `1.2.3`, `1.2.3rc1`, `1.2.3-beta.1`, `1.2.3+local` etc.
+VERSION_TAG = re.compile(r"^v?(\d+(?:\.\d+)+(?:[.-]?(?:alpha|beta|a|b|rc|dev|post)\.?\d*)*(?:\+[\w.]+)?)$")
+
+# Characters accepted in a scope and description, in addition to word characters.
+SCOPE_PUNCTUATION = frozenset("-.")
+DESCRIPTION_PUNCTUATION = frozenset(" .,`/")
+# Characters that terminate the commit type token.
+TYPE_TERMINATORS = frozenset("(!:")
+
+# Commits sent to a worker process at a time when parsing in parallel.
+PARSE_CHUNK_SIZE = 2_000
+
+# Trailer lines, `Key: value` or `Key #value`, `BREAKING CHANGE` is the only key containing a space.
+TRAILER = re.compile(r"(BREAKING CHANGE|[\w-]+)(?::[ \t]*| #)(.*)")
+ISSUE_REF = re.compile(r"#?([\w-]+)")
+# Trailers git adds itself, a block containing one only needs a quarter of its lines to be trailers.
+GIT_GENERATED_TRAILERS = ("Signed-off-by: ", "(cherry picked from commit ")
+# Threads reading release note files, reads are I/O bound so this helps on network filesystems.
+RELEASE_NOTE_READ_WORKERS = 8
+
+
+@dataclasses.dataclass
+class ConventionalCommit:
+    """Represent the parsed header and body of a conventional commit."""
+
+    commit_type: str
+    description: str
+    details: str
+
+    scope: str = ""
+    breaking: bool = False
+
+
+def _scan(message: str, start: int, punctuation: frozenset[str]) -> int:
+    """Find the end of a run of word characters and punctuation beginning at start."""
+    end, length = start, len(message)
+    while end < length and (message[end].isalnum() or message[end] == "_" or message[end] in punctuation):
+        end += 1
+    return end
+
+
+def parse_conventional_commit(message: str, commit_types: typing.Container[str]) -> ConventionalCommit | None:
+    """Parse a conventional commit message.
+
+    Single forward pass over the header, every character is inspected at most
+    once so runtime is linear in message length regardless of content.
+
+    `type(scope)!: description` where scope and ! are optional, any text
+    following the run of supported description characters is returned as
+    details. Returns None if the message is not a supported conventional
+    commit.
+    """
+    length = len(message)
+    pos = 0
+    while pos < length and message[pos] not in TYPE_TERMINATORS and not message[pos].isspace():
+        pos += 1
+
+    commit_type = message[:pos]
+    if commit_type not in commit_types:
+        return None
+
+    scope = ""
+    if message.startswith("(", pos):
+        end = _scan(message, pos + 1, SCOPE_PUNCTUATION)
+        if end == pos + 1 or not message.startswith(")", end):
+            return None
+        scope = message[pos + 1 : end]
+        pos = end + 1
+
+    breaking = message.startswith("!", pos)
+    if breaking:
+        pos += 1
+
+    if not message.startswith(": ", pos):
+        return None
+    pos += 2
+
+    end = _scan(message, pos, DESCRIPTION_PUNCTUATION)
+    if end == pos:
+        return None
+
+    return ConventionalCommit(
+        commit_type=commit_type,
+        scope=scope,
+        breaking=breaking,
+        description=message[pos:end].strip(),
+        details=message[end:],
+    )
+
+
+def parse_trailers(message: str) -> dict[str, str]:
+    """Parse git trailers from the last paragraph of a commit message.
+
+    The paragraph is scanned once. Lines starting with whitespace continue the
+    previous trailer value. As with git, the paragraph is a trailer block when
+    all of its lines are trailers, or when at least a quarter are and one of
+    them was generated by git (`Signed-off-by` or a cherry-pick note). Keys
+    configured with `trailer.<token>.key` in git config are not recognised.
+    Returns a map of trailer key to value, the last value wins for repeated keys.
+    """
+    paragraph = message.strip().rsplit("\n\n", 1)[-1]
+
+    trailers, key, count, total, generated = {}, None, 0, 0, False
+    for line in paragraph.split("\n"):
+        if not line.strip():
+            continue
+        if key is not None and line[0].isspace():
+            trailers[key] = f"{trailers[key]} {line.strip()}".strip()
+            continue
+
+        total += 1
+        if line.startswith(GIT_GENERATED_TRAILERS):
+            generated = True
+            if line[0] == "(":
+                # Cherry-pick notes count as trailers, but have no value.
+                key = None
+                count += 1
+                continue
+
+        m = TRAILER.match(line)
+        if m is None:
+            key = None
+            continue
+        key = m[1]
+        trailers[key] = m[2].strip()
+        count += 1
+
+    if count == total or (generated and count * 4 >= total):
+        return trailers
+    return {}
+
+
+def parse_commit_log(
+    short_hash: str,
+    commit_hash: str,
+    log: str,
+    commit_types: typing.Container[str],
+) -> Change | None:
+    """Parse a commit log into a change, issue_ref is left empty if no Refs footer is present."""
+    parsed = parse_conventional_commit(log, commit_types)
+    if parsed is None:
+        return None
+
+    # Details start with the rest of the header line when the description stops at punctuation.
+    trailers = parse_trailers(parsed.details.partition("\n")[2])
+    m = ISSUE_REF.match(trailers.get("Refs", ""))
+
+    return Change(
+        description=parsed.description,
+        breaking=parsed.breaking or "BREAKING CHANGE" in trailers or "BREAKING-CHANGE" in trailers,
+        scope=f"(`{parsed.scope}`)" if parsed.scope else "",
+        short_hash=short_hash,
+        commit_hash=commit_hash,
+        commit_type=parsed.commit_type,
+        issue_ref=m[1] if m else "",
+        authors=trailers.get("Authors", ""),
+    )
+
+
+def parse_commit_logs(
+    commit_types: typing.Container[str],
+    logs: list[tuple[str, str, str]],
+) -> list[Change | None]:
+    """Parse a chunk of `(short_hash, commit_hash, log)` commit logs, run in worker processes."""
+    return [parse_commit_log(short_hash, commit_hash, log, commit_types) for short_hash, commit_hash, log in logs]
+
+
+def _traced(method: typing.Callable) -> typing.Callable:
+    """Enable the commit trace while an extraction method runs."""
+
+    @functools.wraps(method)
+    def wrapper(self: ReleaseNoteExtractor, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:  # noqa: ANN401
+        with self._tracing():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class CommitTrace:
+    """Record one structured entry per extracted commit.
+
+    Entries are written as JSON lines to `path`, or logged at debug level.
+    Extraction checks `CommitTrace.enabled` once, so a disabled trace costs
+    nothing per commit.
+    """
+
+    def __init__(self: typing.Self, path: Path | None = None) -> None:
+        self.path = path
+        self._file: typing.TextIO | None = None
+
+    @property
+    def enabled(self: typing.Self) -> bool:  # noqa: D102
+        return self.path is not None or logger.isEnabledFor(logging.DEBUG)
+
+    def __enter__(self: typing.Self) -> typing.Self:  # noqa: D105
+        if self.path is not None:
+            self._file = self.path.open("w")
+        return self
+
+    def __exit__(self: typing.Self, *_args: object) -> None:  # noqa: D105
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __call__(self: typing.Self, source: str, short_hash: str, commit_hash: str, change: Change | None) -> None:
+        """Record how a commit was extracted, `source` is one of `parsed`, `cache` or `note`."""
+        record = {
+            "short_hash": short_hash,
+            "commit_hash": commit_hash,
+            "source": source,
+            "change": change.to_dict() if change is not None else None,
+        }
+        if self._file is not None:
+            self._file.write(json.dumps(record) + "\n")
+        else:
+            logger.debug("  %s", record)
+
+
 class ReleaseNoteExtractor:
     """Parse release notes and generate section dictionaries."""
 
@@ -44,7 +307,18 @@ class ReleaseNoteExtractor:
         self.release_notes = Path("./release_notes")
         self.dry_run = dry_run
         self.type_headers = cfg.type_headers
+        self.commit_types = cfg.commit_types
+        self.parse_cache = cfg.parse_cache
+        self.max_commits = cfg.max_commits
+        self.since = cfg.since
+        self.stop_at_changelog = cfg.stop_at_changelog
+        self.commit_notes = cfg.commit_notes
+        self.parse_workers = cfg.parse_workers
         self.git = git
+        self._notes: dict[str, Change | None] = {}
+        self.trace = CommitTrace(Path(cfg.trace_file) if cfg.trace_file else None)
+        # Trace callback while extracting, `None` when tracing is disabled.
+        self._trace: CommitTrace | None = None
 
         self.has_release_notes = self.release_notes.exists() and self.release_notes.is_dir()
 
@@ -59,35 +333,88 @@ class ReleaseNoteExtractor:
         )
         logger.warning("Extracting release note changes.")
         # Extract changelog details from release note files.
-        for issue in sorted(self.release_notes.iterdir()):
-            if issue.is_file and not issue.name.startswith("."):
-                issue_ref, commit_type = issue.name.split(".")
-
-                breaking = False
-                if commit_type.endswith("!"):
-                    commit_type = commit_type[:-1]
-                    breaking = True
-
-                description = issue.read_text().strip()
-
-                if breaking:
-                    logger.info("  Breaking change detected:\n    %s: %s", commit_type, description)
-                header = self.type_headers.get(commit_type, commit_type)
-
-                if commit_type not in self.type_headers:
-                    logger.warning(
-                        "  Skipping unsupported CHANGELOG commit type %s, derived from './release_notes/%s'",
-                        commit_type,
-                        issue.name,
-                    )
-                    continue
-
-                sections[header][issue_ref] = Change(
-                    description=description,
-                    issue_ref=issue_ref,
-                    breaking=breaking,
-                    commit_type=commit_type,
+        notes = []
+        for entry in self._release_note_files():
+            parts = entry.name.split(".")
+            if len(parts) != 2 or not all(parts):  # noqa: PLR2004
+                logger.warning(
+                    "  Skipping release note './release_notes/%s', expected '<issue_ref>.<commit_type>'",
+                    entry.name,
                 )
+                continue
+            issue_ref, commit_type = parts
+
+            breaking = False
+            if commit_type.endswith("!"):
+                commit_type = commit_type[:-1]
+                breaking = True
+
+            if commit_type not in self.type_headers:
+                logger.warning(
+                    "  Skipping unsupported CHANGELOG commit type %s, derived from './release_notes/%s'",
+                    commit_type,
+                    entry.name,
+                )
+                continue
+
+            notes.append((entry.path, issue_ref, commit_type, breaking))
+
+        for (_, issue_ref, commit_type, breaking), description in zip(
+            notes,
+            self._read_release_notes([path for path, *_ in notes]),
+        ):
+            if breaking:
+                logger.info("  Breaking change detected:\n    %s: %s", commit_type, description)
+            header = self.type_headers[commit_type]
+
+            sections[header][issue_ref] = Change(
+                description=description,
+                issue_ref=issue_ref,
+                breaking=breaking,
+                commit_type=commit_type,
+            )
+
+    def _release_note_files(self: typing.Self) -> list[os.DirEntry]:
+        """List release note files, sorted by name, skipping dotfiles and directories.
+
+        `os.scandir` entries carry the file type from the directory listing,
+        so no extra stat call is needed per file.
+        """
+        with os.scandir(self.release_notes) as entries:
+            files = [entry for entry in entries if not entry.name.startswith(".") and entry.is_file()]
+        return sorted(files, key=lambda entry: entry.name)
+
+    def _read_release_notes(self: typing.Self, paths: list[str]) -> list[str]:
+        """Read release note descriptions, in order, across a small thread pool."""
+        if len(paths) <= 1:
+            return [Path(path).read_text().strip() for path in paths]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(RELEASE_NOTE_READ_WORKERS, len(paths))) as pool:
+            return list(pool.map(lambda path: Path(path).read_text().strip(), paths))
+
+    def _load_cache(self: typing.Self) -> ParseCache | None:
+        if not self.parse_cache:
+            return None
+
+        from changelog_gen.cache import ParseCache, fingerprint
+
+        path = self.git.get_git_dir() / "changelog_gen" / "parse_cache.json"
+        return ParseCache.load(path, fingerprint(self.commit_types))
+
+    def _load_notes(self: typing.Self) -> dict[str, Change | None]:
+        if not self.commit_notes:
+            return {}
+
+        from changelog_gen import notes
+        from changelog_gen.cache import fingerprint
+
+        return notes.load(self.git, fingerprint(self.commit_types))
+
+    def _parse_commit_log(self: typing.Self, short_hash: str, commit_hash: str, log: str) -> Change | None:
+        """Parse a commit log into a change, issue_ref is left empty if no Refs footer is present."""
+        return parse_commit_log(short_hash, commit_hash, log, self.type_headers)
 
     def _extract_commit_logs(
         self: typing.Self,
@@ -96,62 +423,240 @@ class ReleaseNoteExtractor:
     ) -> None:
         # find tag from current version
         tag = self.git.find_tag(current_version)
-        logs = self.git.get_logs(tag)
+        logs = self.git.iter_logs(tag) if tag else self.git.iter_logs(None, **self._history_bounds())
+        cache = self._load_cache()
+        self._notes = self._load_notes()
 
-        # Build a conventional commit regex based on configured sections
-        #   ^(build|chore|ci|docs|feat|fix|perf|refactor|revert|style|test){1}(\([\w\-\.]+\))?(!)?: ([\w ])+([\s\S]*)
-        types = "|".join(self.type_headers.keys())
-        reg = re.compile(rf"^({types}){{1}}(\([\w\-\.]+\))?(!)?: ([\w .,`\/]+)+([\s\S]*)")
         logger.warning("Extracting commit log changes.")
 
-        for i, (short_hash, commit_hash, log) in enumerate(logs):
-            m = reg.match(log)
-            if m is None:
-                logger.debug("  Skipping commit log (not conventional): %s", log.strip())
-            if m:
-                logger.debug("  Parsing commit log: %s", log.strip())
-                commit_type = m[1]
-                scope = (m[2] or "").replace("(", "(`").replace(")", "`)")
-                breaking = m[3] is not None
-                description = m[4].strip()
-                details = m[5] or ""
-
-                # Handle missing refs in commit message, skip link generation in writer
-                issue_ref = f"__{i}__"
-                breaking = breaking or "BREAKING CHANGE" in details
-
-                logger.info("  commit_type: '%s'", commit_type)
-                logger.info("  scope: '%s'", scope)
-                logger.info("  breaking: %s", breaking)
-                logger.info("  description: '%s'", description)
-                logger.info("  details: '%s'", details)
-
-                if breaking:
-                    logger.info("  Breaking change detected:\n    %s: %s", commit_type, description)
-
-                change = Change(
-                    description=description,
-                    issue_ref=issue_ref,
-                    breaking=breaking,
-                    scope=scope,
-                    short_hash=short_hash,
-                    commit_hash=commit_hash,
-                    commit_type=commit_type,
-                )
+        if self.parse_workers > 1:
+            changes = self._parse_parallel(cache, logs)
+        else:
+            changes = (self._parse_cached(cache, *log) for log in logs)
 
-                for line in details.split("\n"):
-                    for target, pattern in [
-                        ("issue_ref", r"Refs: #?([\w-]+)"),
-                        ("authors", r"Authors: (.*)"),
-                    ]:
-                        m = re.match(pattern, line)
-                        if m:
-                            logger.info("  '%s' footer extracted '%s'", target, m[1])
-                            setattr(change, target, m[1])
+        for i, change in enumerate(changes):
+            if change is not None:
+                self._add_change(sections, change, i)
 
-                header = self.type_headers.get(commit_type, commit_type)
-                sections[header][change.issue_ref] = change
+        if cache is not None:
+            cache.save(self.git)
 
+    def _parse_parallel(
+        self: typing.Self,
+        cache: ParseCache | None,
+        logs: typing.Iterable[tuple[str, str, str]],
+    ) -> typing.Iterator[Change | None]:
+        """Parse logs in chunks across worker processes, yielding changes in log order.
+
+        Commits with a note or cache entry are not sent to the workers. A
+        bounded number of chunks are in flight, so the log stream is not read
+        far ahead of the merge.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        parse = functools.partial(parse_commit_logs, self.type_headers)
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as pool:
+            pending = deque()
+            logs = iter(logs)
+            while chunk := list(itertools.islice(logs, PARSE_CHUNK_SIZE)):
+                known = [
+                    commit_hash in self._notes or (cache is not None and commit_hash in cache)
+                    for _, commit_hash, _ in chunk
+                ]
+                unknown = [log for log, is_known in zip(chunk, known) if not is_known]
+                pending.append((chunk, known, pool.submit(parse, unknown) if unknown else None))
+                if len(pending) > 2 * self.parse_workers:
+                    yield from self._merge_parsed(cache, *pending.popleft())
+
+            while pending:
+                yield from self._merge_parsed(cache, *pending.popleft())
+
+    def _merge_parsed(
+        self: typing.Self,
+        cache: ParseCache | None,
+        chunk: list[tuple[str, str, str]],
+        known: list[bool],
+        future: Future | None,
+    ) -> typing.Iterator[Change | None]:
+        parsed = iter(future.result() if future is not None else [])
+        for log, is_known in zip(chunk, known):
+            if is_known:
+                yield self._parse_cached(cache, *log)
+                continue
+
+            change = next(parsed)
+            if cache is not None:
+                cache[log[1]] = change
+            if self._trace is not None:
+                self._trace("parsed", *log[:2], change)
+            yield change
+
+    def _history_bounds(self: typing.Self, path: str = "") -> dict[str, typing.Any]:
+        """Limits on the walk of untagged history, stopping at the CHANGELOG in `path`."""
+        bounds = {"max_count": self.max_commits, "since": self.since}
+        if self.stop_at_changelog:
+            stop_at = self.git.last_commit(f"{path}/CHANGELOG.*" if path else "CHANGELOG.*")
+            if stop_at is not None:
+                logger.info("  Stopping at last CHANGELOG commit %s", stop_at)
+                bounds["stop_at"] = stop_at
+        return bounds
+
+    def _package_history_bounds(
+        self: typing.Self,
+        tags: dict[str, str | None],
+        prefixes: dict[str, str],
+    ) -> dict[str, typing.Any]:
+        """Limits on the monorepo walk, if any package is untagged, with a stop commit per package."""
+        bounds, stop_at = {}, {}
+        for name, tag in tags.items():
+            if tag is None:
+                bounds = self._history_bounds(prefixes[name])
+                if "stop_at" in bounds:
+                    stop_at[name] = bounds.pop("stop_at")
+        if stop_at:
+            bounds["stop_at"] = stop_at
+        return bounds
+
+    def _parse_cached(
+        self: typing.Self,
+        cache: ParseCache | None,
+        short_hash: str,
+        commit_hash: str,
+        log: str,
+    ) -> Change | None:
+        if commit_hash in self._notes:
+            source, change = "note", self._notes[commit_hash]
+        elif cache is not None and commit_hash in cache:
+            source, change = "cache", cache[commit_hash]
+        else:
+            source, change = "parsed", self._parse_commit_log(short_hash, commit_hash, log)
+            if cache is not None:
+                cache[commit_hash] = change
+
+        if self._trace is not None:
+            self._trace(source, short_hash, commit_hash, change)
+        return change
+
+    @contextlib.contextmanager
+    def _tracing(self: typing.Self) -> typing.Iterator[None]:
+        """Enable the commit trace for the duration of an extraction, if configured."""
+        if not self.trace.enabled:
+            yield
+            return
+
+        with self.trace:
+            self._trace = self.trace
+            try:
+                yield
+            finally:
+                self._trace = None
+
+    def _add_change(self: typing.Self, sections: dict[str, dict], change: Change, index: int) -> None:
+        if not change.issue_ref:
+            # Handle missing refs in commit message, skip link generation in writer
+            change = dataclasses.replace(change, issue_ref=f"__{index}__")
+
+        header = self.type_headers.get(change.commit_type, change.commit_type)
+        sections[header][change.issue_ref] = change
+
+    @_traced
+    def extract_releases(self: typing.Self) -> list[Release]:
+        """Split the full commit history into releases at version tags.
+
+        History is walked once, newest first. Each release contains the commits
+        reachable from its version tag but not from an older version tag, so
+        branches merged after a release belong to the release that merged them.
+        Commits not reachable from any version tag are not included.
+        """
+        from changelog_gen.vcs import reachable
+
+        parents, tagged, changes = {}, [], []
+
+        logger.warning("Extracting releases from commit log.")
+        for short_hash, commit_hash, commit_parents, tags, timestamp, log in self.git.iter_tagged_logs():
+            parents[commit_hash] = commit_parents
+            versions = [m[1] for m in map(VERSION_TAG.match, tags) if m]
+            if versions:
+                logger.info("Release %s detected at %s", versions[0], short_hash)
+                tagged.append((versions[0], commit_hash, timestamp))
+
+            change = self._parse_commit_log(short_hash, commit_hash, log)
+            if self._trace is not None:
+                self._trace("parsed", short_hash, commit_hash, change)
+            changes.append((short_hash, commit_hash, change))
+
+        # Oldest release first, so each commit belongs to the oldest release that reaches it.
+        release_of = {}
+        for position in reversed(range(len(tagged))):
+            for commit_hash in reachable(parents, tagged[position][1], release_of):
+                release_of[commit_hash] = position
+
+        releases = [
+            Release(version=version, timestamp=timestamp, sections=defaultdict(dict))
+            for version, _, timestamp in tagged
+        ]
+        indexes = [0] * len(releases)
+        for short_hash, commit_hash, change in changes:
+            position = release_of.get(commit_hash)
+            if position is None:
+                logger.debug("  Skipping unreleased commit %s", short_hash)
+                continue
+
+            if change is not None:
+                self._add_change(releases[position].sections, change, indexes[position])
+            indexes[position] += 1
+
+        return releases
+
+    @_traced
+    def extract_packages(
+        self: typing.Self,
+        packages: dict[str, config.PackageConfig],
+        current_versions: dict[str, str],
+    ) -> dict[str, SectionDict]:
+        """Extract sections for each monorepo package from a single history walk.
+
+        Commits since each package's current version tag are routed to every
+        package containing a file the commit changed, and parsed only once.
+        If a package has no tag, the walk is bounded as for untagged history,
+        each untagged package stopping at its own last CHANGELOG commit.
+        Release note files are not supported in monorepo mode.
+        """
+        tag_index = self.git.tag_index()
+        tags, prefixes = {}, {}
+        for name, package in packages.items():
+            tag = tag_index.find(current_versions[name], package.tag_prefix)
+            tags[name] = tag.name if tag else None
+            prefix = package.path.strip("/")
+            prefixes[name] = "" if prefix == "." else prefix
+
+        logger.warning("Extracting commit log changes for %s packages.", len(packages))
+        partitions = self.git.partition_logs(tags, **self._package_history_bounds(tags, prefixes))
+        cache = self._load_cache()
+        self._notes = self._load_notes()
+
+        changes = {}
+        package_sections = {}
+        for name, prefix in prefixes.items():
+            sections, index = defaultdict(dict), 0
+            for short_hash, commit_hash, files, log in partitions[name]:
+                if prefix and not any(f == prefix or f.startswith(f"{prefix}/") for f in files):
+                    continue
+
+                if commit_hash not in changes:
+                    changes[commit_hash] = self._parse_cached(cache, short_hash, commit_hash, log)
+                change = changes[commit_hash]
+                if change is not None:
+                    self._add_change(sections, change, index)
+                index += 1
+            package_sections[name] = sections
+
+        if cache is not None:
+            cache.save(self.git)
+
+        return package_sections
+
+    @_traced
     def extract(self: typing.Self, current_version: str) -> SectionDict:
         """Iterate over release note files extracting sections and issues."""
         sections = defaultdict(dict)
@@ -182,12 +687,11 @@ class ReleaseNoteExtractor:
         """
         if self.release_notes.exists():
             logger.info("Cleaning release notes.")
-            for x in self.release_notes.iterdir():
-                if x.is_file and not x.name.startswith("."):
-                    if self.dry_run:
-                        logger.info("  Would remove release note '%s'", x.name)
-                        continue
-                    x.unlink()
+            for entry in self._release_note_files():
+                if self.dry_run:
+                    logger.info("  Would remove release note '%s'", entry.name)
+                    continue
+                os.unlink(entry.path)  # noqa: PTH108
 
 
 def extract_version_tag(sections: SectionDict, cfg: config.Config, bv: BumpVersion) -> str:
@@ -0,0 +1,429 @@
+"""Read-only, in-process access to git commit history.
+
+Reads loose objects and packfiles directly from the repository `.git`
+directory, avoiding a `git` subprocess for log extraction. Only what is
+needed to walk commits is supported, anything else (sha256 repositories,
+reftable ref storage, v1 pack indexes) raises `UnsupportedRepositoryError` so
+callers can fall back to the git cli.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import dataclasses
+import heapq
+import mmap
+import os
+import struct
+import typing
+import zlib
+from pathlib import Path
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Size of each slice fed to zlib when inflating a packed object.
+INFLATE_CHUNK_SIZE = 16 * 1024
+# Extra uninteresting commits walked once only uninteresting commits remain
+# queued, guards against commit timestamp skew (matches git).
+SLOP = 5
+# Minimum abbreviated hash length, git's `core.abbrev` default.
+MIN_ABBREV = 7
+
+OBJECT_TYPES = {1: b"commit", 2: b"tree", 3: b"blob", 4: b"tag"}
+OFS_DELTA = 6
+REF_DELTA = 7
+
+
+class UnsupportedRepositoryError(Exception):
+    """Repository can not be read without the git cli."""
+
+
+class ObjectNotFoundError(UnsupportedRepositoryError):
+    """Object not present in the repository."""
+
+
+def find_git_dir(path: Path | None = None) -> Path:
+    """Discover the git directory for `path`, as `git rev-parse --absolute-git-dir` would."""
+    if "GIT_DIR" in os.environ:
+        return Path(os.environ["GIT_DIR"]).resolve()
+
+    path = (path or Path.cwd()).resolve()
+    for directory in [path, *path.parents]:
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            # Linked worktree or submodule, `.git` file contains `gitdir: <path>`
+            content = dot_git.read_text().strip()
+            if content.startswith("gitdir: "):
+                return (directory / content[len("gitdir: ") :]).resolve()
+
+    msg = f"Not a git repository: {path}"
+    raise UnsupportedRepositoryError(msg)
+
+
+def common_dir(git_dir: Path) -> Path:
+    """Resolve the directory holding shared refs and objects, differs from `git_dir` in linked worktrees."""
+    commondir = git_dir / "commondir"
+    if commondir.exists():
+        return (git_dir / commondir.read_text().strip()).resolve()
+    return git_dir
+
+
+@dataclasses.dataclass
+class Commit:
+    """Parsed commit object."""
+
+    sha: str
+    parents: list[str]
+    timestamp: int
+    message: str
+
+
+def parse_commit(sha: str, data: bytes) -> Commit:
+    """Parse raw commit object content."""
+    headers, _, message = data.partition(b"\n\n")
+    parents = []
+    timestamp = 0
+    for line in headers.split(b"\n"):
+        if line.startswith(b"parent "):
+            parents.append(line[7:].decode())
+        elif line.startswith(b"committer "):
+            # committer Name <email> 1700000000 +0000
+            timestamp = int(line.rsplit(b" ", 2)[1])
+    return Commit(sha=sha, parents=parents, timestamp=timestamp, message=message.decode(errors="replace"))
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:  # noqa: C901
+    """Reconstruct an object from its base and a packfile delta."""
+
+    def varint(pos: int) -> tuple[int, int]:
+        value = shift = 0
+        while True:
+            c = delta[pos]
+            pos += 1
+            value |= (c & 0x7F) << shift
+            shift += 7
+            if not c & 0x80:
+                return value, pos
+
+    _base_size, pos = varint(0)
+    result_size, pos = varint(pos)
+
+    result = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            # Copy from base, offset and size bytes present according to op bits.
+            offset = size = 0
+            for i in range(4):
+                if op & (1 << i):
+                    offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if op & (0x10 << i):
+                    size |= delta[pos] << (8 * i)
+                    pos += 1
+            result += base[offset : offset + (size or 0x10000)]
+        elif op:
+            # Insert the next `op` bytes.
+            result += delta[pos : pos + op]
+            pos += op
+        else:
+            msg = "Invalid delta instruction."
+            raise UnsupportedRepositoryError(msg)
+
+    if len(result) != result_size:
+        msg = "Delta result size mismatch."
+        raise UnsupportedRepositoryError(msg)
+    return bytes(result)
+
+
+class _Names:
+    """Sequence view of the sorted object names in a pack index, for bisect."""
+
+    def __init__(self: typing.Self, data: mmap.mmap, start: int, count: int) -> None:
+        self.data = data
+        self.start = start
+        self.count = count
+
+    def __len__(self: typing.Self) -> int:
+        return self.count
+
+    def __getitem__(self: typing.Self, i: int) -> bytes:
+        offset = self.start + i * 20
+        return self.data[offset : offset + 20]
+
+
+class Pack:
+    """A packfile and its v2 index, both memory mapped."""
+
+    def __init__(self: typing.Self, idx_path: Path) -> None:
+        self.idx_path = idx_path
+        self.pack_path = idx_path.with_suffix(".pack")
+        self._stack = contextlib.ExitStack()
+        try:
+            self.idx = self._map(idx_path)
+            self.pack = self._map(self.pack_path)
+        except UnsupportedRepositoryError:
+            self._stack.close()
+            raise
+
+        if self.idx[:8] != b"\xfftOc\x00\x00\x00\x02":
+            msg = f"Unsupported pack index version: {idx_path}"
+            raise UnsupportedRepositoryError(msg)
+
+        self.count = struct.unpack_from(">I", self.idx, 8 + 255 * 4)[0]
+        self.names = _Names(self.idx, 8 + 256 * 4, self.count)
+        self._offsets = 8 + 256 * 4 + self.count * 24
+        self._large_offsets = self._offsets + self.count * 4
+
+    def _map(self: typing.Self, path: Path) -> mmap.mmap:
+        try:
+            f = self._stack.enter_context(path.open("rb"))
+            return self._stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError) as e:
+            # Missing, empty (mmap raises ValueError) or unreadable pack files.
+            msg = f"Unable to map {path}: {e}"
+            raise UnsupportedRepositoryError(msg) from e
+
+    def close(self: typing.Self) -> None:
+        """Unmap the pack and index files."""
+        self._stack.close()
+
+    def offset(self: typing.Self, binsha: bytes) -> int | None:
+        """Find the pack offset of an object, `None` if not in this pack."""
+        first = binsha[0]
+        lo = struct.unpack_from(">I", self.idx, 8 + (first - 1) * 4)[0] if first else 0
+        hi = struct.unpack_from(">I", self.idx, 8 + first * 4)[0]
+        i = bisect.bisect_left(self.names, binsha, lo, hi)
+        if i == hi or self.names[i] != binsha:
+            return None
+
+        offset = struct.unpack_from(">I", self.idx, self._offsets + i * 4)[0]
+        if offset & 0x80000000:
+            offset = struct.unpack_from(">Q", self.idx, self._large_offsets + (offset & 0x7FFFFFFF) * 8)[0]
+        return offset
+
+    def read_at(self: typing.Self, offset: int, store: ObjectStore) -> tuple[bytes, bytes]:
+        """Read the object at `offset`, resolving deltas."""
+        c = self.pack[offset]
+        pos = offset + 1
+        type_num = (c >> 4) & 7
+        while c & 0x80:
+            c = self.pack[pos]
+            pos += 1
+
+        if type_num == OFS_DELTA:
+            c = self.pack[pos]
+            pos += 1
+            base_distance = c & 0x7F
+            while c & 0x80:
+                c = self.pack[pos]
+                pos += 1
+                base_distance = ((base_distance + 1) << 7) | (c & 0x7F)
+            object_type, base = self.read_at(offset - base_distance, store)
+            return object_type, apply_delta(base, self._inflate(pos))
+
+        if type_num == REF_DELTA:
+            object_type, base = store.read(self.pack[pos : pos + 20].hex())
+            return object_type, apply_delta(base, self._inflate(pos + 20))
+
+        if type_num not in OBJECT_TYPES:
+            msg = f"Invalid pack object type {type_num} in {self.pack_path}"
+            raise UnsupportedRepositoryError(msg)
+        return OBJECT_TYPES[type_num], self._inflate(pos)
+
+    def _inflate(self: typing.Self, pos: int) -> bytes:
+        decompressor = zlib.decompressobj()
+        chunks = []
+        while not decompressor.eof:
+            chunk = self.pack[pos : pos + INFLATE_CHUNK_SIZE]
+            if not chunk:
+                msg = f"Truncated pack {self.pack_path}"
+                raise UnsupportedRepositoryError(msg)
+            chunks.append(decompressor.decompress(chunk))
+            pos += INFLATE_CHUNK_SIZE
+        return b"".join(chunks)
+
+
+class ObjectStore:
+    """Read objects from a repository's loose object directory and packfiles."""
+
+    def __init__(self: typing.Self, git_dir: Path) -> None:
+        self.git_dir = git_dir
+        self.common_dir = common_dir(git_dir)
+        self.objects_dir = self.common_dir / "objects"
+        if (self.objects_dir / "info" / "alternates").exists():
+            # Objects borrowed from another repository (`--reference`, `--shared` clones) are not read.
+            msg = "Repositories with alternate object directories are not supported."
+            raise UnsupportedRepositoryError(msg)
+        self._packs: list[Pack] | None = None
+        self._shallow: set[str] | None = None
+
+    def __enter__(self: typing.Self) -> typing.Self:  # noqa: D105
+        return self
+
+    def __exit__(self: typing.Self, *_args: object) -> None:  # noqa: D105
+        self.close()
+
+    def close(self: typing.Self) -> None:
+        """Release memory mapped packfiles."""
+        for pack in self._packs or []:
+            pack.close()
+        self._packs = None
+
+    @property
+    def packs(self: typing.Self) -> list[Pack]:
+        """Packfiles in the repository, loaded on first use."""
+        if self._packs is None:
+            pack_dir = self.objects_dir / "pack"
+            self._packs = [Pack(idx) for idx in sorted(pack_dir.glob("*.idx"))] if pack_dir.exists() else []
+        return self._packs
+
+    def read(self: typing.Self, sha: str) -> tuple[bytes, bytes]:
+        """Read an object, returning its type and content."""
+        path = self.objects_dir / sha[:2] / sha[2:]
+        if path.exists():
+            header, _, content = zlib.decompress(path.read_bytes()).partition(b"\0")
+            return header.split(b" ", 1)[0], content
+
+        binsha = bytes.fromhex(sha)
+        for pack in self.packs:
+            offset = pack.offset(binsha)
+            if offset is not None:
+                return pack.read_at(offset, self)
+
+        raise ObjectNotFoundError(sha)
+
+    def read_commit(self: typing.Self, sha: str) -> Commit:
+        """Read and parse a commit object."""
+        object_type, content = self.read(sha)
+        if object_type != b"commit":
+            msg = f"Object {sha} is a {object_type.decode()}, not a commit."
+            raise UnsupportedRepositoryError(msg)
+        commit = parse_commit(sha, content)
+        if sha in self.shallow:
+            commit.parents = []
+        return commit
+
+    @property
+    def shallow(self: typing.Self) -> set[str]:
+        """Commits at the boundary of a shallow clone, their parents are not present."""
+        if self._shallow is None:
+            path = self.common_dir / "shallow"
+            self._shallow = set(path.read_text().split()) if path.exists() else set()
+        return self._shallow
+
+    def abbrev_length(self: typing.Self) -> int:
+        """Estimate git's automatic abbreviated hash length from the packed object count."""
+        count = sum(pack.count for pack in self.packs)
+        return max(MIN_ABBREV, (count.bit_length() + 1) // 2)
+
+    def resolve(self: typing.Self, ref: str) -> str:
+        """Resolve `HEAD` or a full ref name to a commit sha."""
+        for _ in range(5):
+            path = (self.git_dir if ref == "HEAD" else self.common_dir) / ref
+            value = path.read_text().strip() if path.is_file() else self._packed_ref(ref)
+            if value is None:
+                msg = f"Unable to resolve ref {ref}"
+                raise UnsupportedRepositoryError(msg)
+            if not value.startswith("ref: "):
+                if len(value) != 40:  # noqa: PLR2004
+                    msg = "Only sha1 repositories are supported."
+                    raise UnsupportedRepositoryError(msg)
+                return value
+            ref = value[len("ref: ") :]
+
+        msg = f"Too many levels of symbolic refs resolving {ref}"
+        raise UnsupportedRepositoryError(msg)
+
+    def _packed_ref(self: typing.Self, ref: str) -> str | None:
+        packed_refs = self.common_dir / "packed-refs"
+        if not packed_refs.exists():
+            return None
+        for line in packed_refs.read_text().splitlines():
+            if line.endswith(f" {ref}"):
+                return line.split(" ", 1)[0]
+        return None
+
+    def walk(self: typing.Self, head: str, exclude: str | None = None) -> Iterator[Commit]:
+        """Walk commits reachable from `head` but not `exclude`, newest first.
+
+        Equivalent to `git log exclude..head`, commits are ordered by committer
+        date with ties in the order they were discovered.
+        """
+        if exclude is None:
+            return self._walk(head)
+        return self._limited_walk(head, exclude)
+
+    def _limited_walk(self: typing.Self, head: str, exclude: str) -> Iterator[Commit]:  # noqa: C901
+        # Limited walk, as git does, every commit must be visited before
+        # output as a later uninteresting commit may exclude an earlier one.
+        uninteresting: set[str] = set()
+        seen: dict[str, Commit] = {}
+        queue: list[tuple[int, int, str]] = []
+        counter = 0
+
+        def push(sha: str) -> None:
+            nonlocal counter
+            commit = seen.get(sha)
+            if commit is None:
+                commit = seen[sha] = self.read_commit(sha)
+                heapq.heappush(queue, (-commit.timestamp, counter, sha))
+                counter += 1
+
+        def mark_uninteresting(sha: str) -> None:
+            stack = [sha]
+            while stack:
+                sha = stack.pop()
+                if sha in uninteresting:
+                    continue
+                uninteresting.add(sha)
+                if sha in seen:
+                    stack.extend(seen[sha].parents)
+
+        push(exclude)
+        uninteresting.add(exclude)
+        push(head)
+
+        result = []
+        slop = SLOP
+        while queue:
+            _, _, sha = heapq.heappop(queue)
+            commit = seen[sha]
+            for parent in commit.parents:
+                if sha in uninteresting:
+                    mark_uninteresting(parent)
+                push(parent)
+
+            if sha in uninteresting:
+                if all(queued in uninteresting for _, _, queued in queue):
+                    slop -= 1
+                    if not slop:
+                        break
+                else:
+                    slop = SLOP
+                continue
+            result.append(commit)
+
+        for commit in result:
+            if commit.sha not in uninteresting:
+                yield commit
+
+    def _walk(self: typing.Self, head: str) -> Iterator[Commit]:
+        seen = {head}
+        queue = [(0, 0, self.read_commit(head))]
+        counter = 1
+        while queue:
+            _, _, commit = heapq.heappop(queue)
+            yield commit
+            for parent in commit.parents:
+                if parent not in seen:
+                    seen.add(parent)
+                    parent_commit = self.read_commit(parent)
+                    heapq.heappush(queue, (-parent_commit.timestamp, counter, parent_commit))
+                    counter += 1
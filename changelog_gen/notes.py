@@ -0,0 +1,53 @@
+"""Changes pre-parsed at commit time, stored as git notes alongside each commit."""
+
+from __future__ import annotations
+
+import json
+import logging
+import typing
+
+from changelog_gen.extractor import Change
+
+if typing.TYPE_CHECKING:
+    from changelog_gen.vcs import Git
+
+logger = logging.getLogger(__name__)
+
+NOTES_REF = "refs/notes/changelog"
+
+
+def dump(change: Change | None, fingerprint: str) -> str:
+    """Serialize a parsed change, `None` for non conventional commits."""
+    return json.dumps({"fingerprint": fingerprint, "change": change.to_dict() if change is not None else None})
+
+
+def load(git: Git, fingerprint: str) -> dict[str, Change | None]:
+    """Read all changelog notes, in bulk.
+
+    Notes written with a different commit type configuration, or that can not
+    be read, are ignored so the commit is parsed again. Commit hashes are
+    taken from the annotated commit, a note copied from a rewritten commit
+    still links to the commit it is attached to.
+
+    Returns:
+        map of commit hash to parsed change.
+    """
+    changes = {}
+    for commit_hash, content in git.read_notes(NOTES_REF).items():
+        try:
+            data = json.loads(content)
+        except ValueError:
+            logger.debug("  Ignoring unreadable note on commit %s", commit_hash)
+            continue
+
+        if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+            logger.debug("  Ignoring stale note on commit %s", commit_hash)
+            continue
+
+        change = data.get("change")
+        if change is not None:
+            # Keep the abbreviation length git used when the note was recorded.
+            short_hash = commit_hash[: len(change.get("short_hash") or "")]
+            change = Change(**{**change, "short_hash": short_hash, "commit_hash": commit_hash})
+        changes[commit_hash] = change
+    return changes
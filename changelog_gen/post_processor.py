@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
+import json
 import logging
 import os
+import random
+import time
 import typing
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from http import HTTPStatus
 
 import httpx
 import typer
 
 if typing.TYPE_CHECKING:
+    from pathlib import Path
+
     from changelog_gen.config import PostProcessConfig
 
 logger = logging.getLogger(__name__)
@@ -26,71 +36,336 @@ class BearerAuth(httpx.Auth):
         yield request
 
 
-def make_client(cfg: PostProcessConfig) -> httpx.Client:
-    """Generate HTTPx client with authorization if configured."""
-    auth = None
-    if cfg.auth_env:
-        user_auth = os.environ.get(cfg.auth_env)
-        if not user_auth:
-            logger.error('Missing environment variable "%s"', cfg.auth_env)
-            raise typer.Exit(code=1)
+@dataclasses.dataclass
+class Journal:
+    """Append only record of post process requests, allows interrupted runs to be resumed.
+
+    Each line is a JSON record, either the issue refs `planned` for a version,
+    or a request `done` for an issue ref and url.
+    """
+
+    path: Path
+
+    def _append(self: typing.Self, record: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def _records(self: typing.Self, version: str) -> typing.Iterator[dict]:
+        if not self.path.exists():
+            return
+        with self.path.open() as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Ignore lines truncated by an interrupted write.
+                    continue
+                if record.get("version") == version:
+                    yield record
+
+    def plan(self: typing.Self, version: str, issue_refs: list[str]) -> None:
+        """Record the issue refs to be post processed for a version."""
+        self._append({"event": "planned", "version": version, "issue_refs": issue_refs})
+
+    def record(self: typing.Self, version: str, issue_ref: str, url: str) -> None:
+        """Record a successful request."""
+        self._append({"event": "done", "version": version, "issue_ref": issue_ref, "url": url})
+
+    def completed(self: typing.Self, version: str) -> set[tuple[str, str]]:
+        """Get `(issue_ref, url)` pairs successfully requested for a version."""
+        return {(r["issue_ref"], r["url"]) for r in self._records(version) if r.get("event") == "done"}
+
+    def outstanding(self: typing.Self, version: str) -> list[str]:
+        """Get planned issue refs for a version that have no successful request."""
+        planned, done = set(), set()
+        for r in self._records(version):
+            if r.get("event") == "planned":
+                planned.update(r["issue_refs"])
+            elif r.get("event") == "done":
+                done.add(r["issue_ref"])
+        return sorted(planned - done)
 
-        if cfg.auth_type == "bearer":
-            auth = BearerAuth(user_auth)
-        else:
-            # Fall back to basic auth
-            try:
-                username, api_key = user_auth.split(":")
-            except ValueError as e:
-                logger.error(  # noqa: TRY400
-                    "Unexpected content in %s, need '{username}:{api_key}' for basic auth",
-                    cfg.auth_env,
-                )
-                raise typer.Exit(code=1) from e
-            else:
-                auth = httpx.BasicAuth(username=username, password=api_key)
 
-    return httpx.Client(
-        auth=auth,
+def _make_auth(cfg: PostProcessConfig) -> httpx.Auth | None:
+    """Generate HTTPx authorization if configured."""
+    if not cfg.auth_env:
+        return None
+
+    user_auth = os.environ.get(cfg.auth_env)
+    if not user_auth:
+        logger.error('Missing environment variable "%s"', cfg.auth_env)
+        raise typer.Exit(code=1)
+
+    if cfg.auth_type == "bearer":
+        return BearerAuth(user_auth)
+
+    # Fall back to basic auth
+    try:
+        username, api_key = user_auth.split(":")
+    except ValueError as e:
+        logger.error(  # noqa: TRY400
+            "Unexpected content in %s, need '{username}:{api_key}' for basic auth",
+            cfg.auth_env,
+        )
+        raise typer.Exit(code=1) from e
+
+    return httpx.BasicAuth(username=username, password=api_key)
+
+
+def make_async_client(cfg: PostProcessConfig) -> httpx.AsyncClient:
+    """Generate async HTTPx client with authorization if configured."""
+    return httpx.AsyncClient(
+        auth=_make_auth(cfg),
         headers=cfg.headers,
     )
 
 
+def _render(cfg: PostProcessConfig, issue: str, version_tag: str) -> tuple[str, str]:
+    """Render url and body templates for an issue."""
+    url, body = cfg.url, cfg.body
+    for find, replace in [
+        ("::issue_ref::", issue),
+        ("::version::", version_tag),
+    ]:
+        url = url.replace(find, replace)
+        body = body.replace(find, replace)
+    return url, body
+
+
+def _render_batch(cfg: PostProcessConfig, issues: list[str], version_tag: str) -> tuple[str, str]:
+    """Render url and body templates for a batch of issues.
+
+    `::issue_refs::` is rendered as a comma separated list in the url, and as a
+    JSON array in the body.
+    """
+    url = cfg.url.replace("::issue_refs::", ",".join(issues)).replace("::version::", version_tag)
+    body = cfg.body.replace("::issue_refs::", json.dumps(issues)).replace("::version::", version_tag)
+    return url, body
+
+
+# Responses worth retrying, the request may succeed if sent again later.
+RETRY_STATUSES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    },
+)
+
+
+class TokenBucket:
+    """Client side rate limiter, allow `rate` requests per second with bursts of up to `capacity`."""
+
+    def __init__(self: typing.Self, rate: float, capacity: int = 1) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self: typing.Self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def retry_after(response: httpx.Response) -> float | None:
+    """Extract the delay requested by a `Retry-After` header, in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        # A `-0000` zone parses to a naive datetime, RFC 5322 treats it as UTC.
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+def backoff(cfg: PostProcessConfig, attempt: int) -> float:
+    """Exponential backoff with full jitter, capped at `cfg.max_backoff`."""
+    return random.uniform(0, min(cfg.max_backoff, cfg.backoff_factor * 2**attempt))  # noqa: S311
+
+
+async def _send(
+    client: httpx.AsyncClient,
+    cfg: PostProcessConfig,
+    bucket: TokenBucket | None,
+    url: str,
+    body: str,
+) -> httpx.Response:
+    """Send a request, retrying transport errors and retryable responses."""
+    attempt = 0
+    while True:
+        if bucket is not None:
+            await bucket.acquire()
+
+        try:
+            r = await client.request(
+                method=cfg.verb,
+                url=url,
+                content=body,
+            )
+        except httpx.TransportError as e:
+            if attempt >= cfg.retries:
+                raise
+            delay = backoff(cfg, attempt)
+            logger.info("  Request: %s %s failed (%s), retrying in %.2fs", cfg.verb, url, e, delay)
+        else:
+            if attempt >= cfg.retries or r.status_code not in RETRY_STATUSES:
+                return r
+            delay = retry_after(r)
+            delay = backoff(cfg, attempt) if delay is None else min(delay, cfg.max_backoff)
+            logger.info(
+                "  Request: %s %s returned %s, retrying in %.2fs",
+                cfg.verb,
+                url,
+                HTTPStatus(r.status_code).name,
+                delay,
+            )
+
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _request(  # noqa: PLR0913
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    bucket: TokenBucket | None,
+    cfg: PostProcessConfig,
+    issues: list[str],
+    url: str,
+    body: str,
+    on_success: typing.Callable[[str, str], None] | None,
+) -> None:
+    async with semaphore:
+        r = await _send(client, cfg, bucket, url, body)
+
+    # Log request and response together, keeps per issue output grouped when run concurrently.
+    logger.info("  Request: %s %s", cfg.verb, url)
+    try:
+        logger.info("    Response: %s", HTTPStatus(r.status_code).name)
+        r.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.error("Post process request failed.")  # noqa: TRY400
+        logger.warning("  %s", e.response.text)
+    else:
+        if on_success is not None:
+            for issue in issues:
+                on_success(issue, url)
+
+
+async def _post_process(
+    cfg: PostProcessConfig,
+    requests: list[tuple[list[str], str, str]],
+    on_success: typing.Callable[[str, str], None] | None = None,
+) -> None:
+    """Send requests concurrently, at most `cfg.max_concurrency` in flight at once."""
+    concurrency = max(cfg.max_concurrency, 1)
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = TokenBucket(cfg.rate_limit, capacity=concurrency) if cfg.rate_limit else None
+    async with make_async_client(cfg) as client:
+        await asyncio.gather(
+            *(
+                _request(client, semaphore, bucket, cfg, issues, url, body, on_success)
+                for issues, url, body in requests
+            ),
+        )
+
+
 def per_issue_post_process(
     cfg: PostProcessConfig,
     issue_refs: list[str],
     version_tag: str,
     *,
     dry_run: bool = False,
+    journal: Journal | None = None,
 ) -> None:
-    """Run post process for all provided issue references."""
+    """Run post process for all provided issue references.
+
+    If a journal is provided, successful requests are recorded, and requests
+    already recorded for this version are skipped.
+    """
     if not cfg.url:
         return
     logger.warning("Post processing:")
 
-    client = make_client(cfg)
+    requests = [([issue], *_render(cfg, issue, version_tag)) for issue in issue_refs]
+
+    if dry_run:
+        for _issues, url, body in requests:
+            logger.warning("  Would request: %s %s %s", cfg.verb, url, body)
+        return
+
+    on_success = None
+    if journal is not None:
+        completed = journal.completed(version_tag)
+        pending = []
+        for request in requests:
+            [issue], url, _body = request
+            if (issue, url) in completed:
+                logger.info("  Skipping completed request: %s %s", cfg.verb, url)
+            else:
+                pending.append(request)
+        requests = pending
+
+        journal.plan(version_tag, issue_refs)
+        on_success = functools.partial(journal.record, version_tag)
 
-    for issue in issue_refs:
-        url, body = cfg.url, cfg.body
-        for find, replace in [
-            ("::issue_ref::", issue),
-            ("::version::", version_tag),
-        ]:
-            url = url.replace(find, replace)
-            body = body.replace(find, replace)
+    asyncio.run(_post_process(cfg, requests, on_success))
 
-        if dry_run:
+
+def batch_post_process(
+    cfg: PostProcessConfig,
+    issue_refs: list[str],
+    version_tag: str,
+    *,
+    dry_run: bool = False,
+    journal: Journal | None = None,
+) -> None:
+    """Run post process for batches of up to `cfg.batch_size` issue references per request.
+
+    If a journal is provided, successful requests are recorded, and issue
+    references already recorded for this version are left out of batches.
+    """
+    if not cfg.url:
+        return
+    logger.warning("Post processing (batch):")
+
+    if not dry_run and journal is not None:
+        completed = {issue for issue, _url in journal.completed(version_tag)}
+        for issue in issue_refs:
+            if issue in completed:
+                logger.info("  Skipping completed issue: %s", issue)
+        journal.plan(version_tag, issue_refs)
+        issue_refs = [issue for issue in issue_refs if issue not in completed]
+
+    size = max(cfg.batch_size, 1)
+    batches = [issue_refs[i : i + size] for i in range(0, len(issue_refs), size)]
+    requests = [(batch, *_render_batch(cfg, batch, version_tag)) for batch in batches]
+
+    if dry_run:
+        for _issues, url, body in requests:
             logger.warning("  Would request: %s %s %s", cfg.verb, url, body)
-        else:
-            logger.info("  Request: %s %s", cfg.verb, url)
-            r = client.request(
-                method=cfg.verb,
-                url=url,
-                content=body,
-            )
-            try:
-                logger.info("    Response: %s", HTTPStatus(r.status_code).name)
-                r.raise_for_status()
-            except httpx.HTTPError as e:
-                logger.error("Post process request failed.")  # noqa: TRY400
-                logger.warning("  %s", e.response.text)
+        return
+
+    on_success = functools.partial(journal.record, version_tag) if journal is not None else None
+    asyncio.run(_post_process(cfg, requests, on_success))
@@ -0,0 +1,96 @@
+"""Lightweight per-phase timing of changelog generation."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import sys
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# Profiler currently counting subprocesses, audit hooks can not be removed so
+# a single hook is installed and forwards events to the active profiler.
+_active: Profiler | None = None
+_hook_installed = False
+
+
+def _audit_hook(event: str, _args: tuple) -> None:
+    if _active is not None and event == "subprocess.Popen":
+        _active.subprocess_count += 1
+
+
+@dataclasses.dataclass
+class Span:
+    """Timing of a single phase."""
+
+    name: str
+    start: float
+    duration: float
+    subprocesses: int
+
+
+class Profiler:
+    """Record wall time and subprocess count for named phases.
+
+    A disabled profiler records nothing, spans cost a single attribute check.
+    """
+
+    def __init__(self: typing.Self, *, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.spans: list[Span] = []
+        self.subprocess_count = 0
+        self._origin = time.perf_counter()
+
+    @contextlib.contextmanager
+    def span(self: typing.Self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase `name`."""
+        if not self.enabled:
+            yield
+            return
+
+        global _active, _hook_installed  # noqa: PLW0603
+        if not _hook_installed:
+            sys.addaudithook(_audit_hook)
+            _hook_installed = True
+
+        previous, _active = _active, self
+        subprocesses = self.subprocess_count
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            _active = previous
+            self.spans.append(
+                Span(
+                    name=name,
+                    start=start - self._origin,
+                    duration=end - start,
+                    subprocesses=self.subprocess_count - subprocesses,
+                ),
+            )
+
+    def table(self: typing.Self) -> str:
+        """Render recorded spans as a text table."""
+        width = max([len("phase"), *(len(span.name) for span in self.spans)])
+        lines = [f"{'phase':<{width}}  {'wall (ms)':>10}  {'subprocesses':>12}"]
+        lines.extend(
+            f"{span.name:<{width}}  {span.duration * 1000:>10.1f}  {span.subprocesses:>12}" for span in self.spans
+        )
+        total = sum(span.duration for span in self.spans)
+        subprocesses = sum(span.subprocesses for span in self.spans)
+        lines.append(f"{'total':<{width}}  {total * 1000:>10.1f}  {subprocesses:>12}")
+        return "\n".join(lines)
+
+    def write_json(self: typing.Self, path: Path, version: str) -> None:
+        """Write recorded spans as a machine readable trace."""
+        data = {
+            "version": version,
+            "spans": [dataclasses.asdict(span) for span in self.spans],
+        }
+        path.write_text(json.dumps(data, indent=2))
@@ -1,14 +1,348 @@
 from __future__ import annotations
 
+import dataclasses
+import itertools
 import logging
 import subprocess
-from typing import TypeVar
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
 
 from changelog_gen import errors
+from changelog_gen.git_objects import ObjectStore, UnsupportedRepositoryError, find_git_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Container, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound="Git")
+TI = TypeVar("TI", bound="TagIndex")
+NG = TypeVar("NG", bound="NativeGit")
+BR = TypeVar("BR", bound="GitBatchReader")
+
+# Size of each read from the `git log` pipe, bounds memory use independent of history length.
+LOG_CHUNK_SIZE = 64 * 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class Tag:
+    """A repository tag and the commit it points to."""
+
+    name: str
+    commit: str
+
+
+class TagIndex:
+    """Map normalized versions to repository tags.
+
+    Built from `packed-refs` and loose `refs/tags` files, falling back to
+    `git for-each-ref` if a tag can not be resolved to its commit without git
+    (i.e. reftable ref storage or packed-refs without peeled tags).
+    """
+
+    def __init__(self: TI, tags: Iterable[Tag]) -> None:
+        self.tags: dict[str, Tag] = {}
+        self.versions: dict[str, Tag] = {}
+        for tag in tags:
+            self.tags[tag.name] = tag
+            version = normalize_tag(tag.name)
+            # Prefer an exact `1.2.3` tag over `v1.2.3`.
+            if version not in self.versions or tag.name == version:
+                self.versions[version] = tag
+
+    def find(self: TI, version_string: str, prefix: str = "") -> Tag | None:
+        """Find the tag for a version string.
+
+        With a `prefix`, find `{prefix}{version}` or `{prefix}v{version}` tags,
+        i.e. per package tags in a monorepo.
+        """
+        if prefix:
+            return self.tags.get(f"{prefix}{version_string}") or self.tags.get(f"{prefix}v{version_string}")
+        tag = self.versions.get(version_string)
+        if tag is None:
+            tag = self._find_suffix(version_string)
+        return tag
+
+    def _find_suffix(self: TI, version_string: str) -> Tag | None:
+        """Find a tag ending in the version with any other prefix, i.e. `release-1.2.3`.
+
+        The prefix must not end in a digit or `.`, so `0.0.2` does not match
+        `10.0.2`. The first tag by name wins if several match.
+        """
+        matches = [
+            name
+            for name in self.tags
+            if name.endswith(version_string)
+            and len(name) > len(version_string)
+            and name[-len(version_string) - 1] not in "0123456789."
+        ]
+        return self.tags[min(matches)] if matches else None
+
+    @classmethod
+    def build(cls: type[TI], git_dir: Path) -> TI:
+        """Build the index from ref files in `git_dir`, or from git if they can't be resolved."""
+        try:
+            return cls(_read_tag_refs(git_dir))
+        except (UnresolvedRefError, UnsupportedRepositoryError) as e:
+            logger.debug("Unable to read tag refs (%s), falling back to git.", e)
+            return cls.from_git()
+
+    @classmethod
+    def from_git(cls: type[TI]) -> TI:
+        """Build the index with `git for-each-ref`."""
+        output = subprocess.check_output(
+            [  # noqa: S603, S607
+                "git",
+                "for-each-ref",
+                "--format=%(refname:strip=2)%00%(objectname)%00%(*objectname)",
+                "refs/tags",
+            ],
+            stderr=subprocess.STDOUT,
+        ).decode()
+
+        tags = []
+        for line in output.splitlines():
+            name, object_name, peeled = line.split("\0")
+            tags.append(Tag(name, peeled or object_name))
+        return cls(tags)
+
+
+class UnresolvedRefError(Exception):
+    """Tag ref can not be resolved without git."""
+
+
+def normalize_tag(name: str) -> str:
+    """Strip the `v` prefix from a version tag name."""
+    return name[1:] if name[:1] == "v" and name[1:2].isdigit() else name
+
+
+def _read_tag_refs(git_dir: Path) -> list[Tag]:
+    with ObjectStore(git_dir) as store:
+        git_dir = store.common_dir
+        if (git_dir / "reftable").exists():
+            msg = "reftable ref storage"
+            raise UnresolvedRefError(msg)
+
+        tags = {}
+        packed_refs = git_dir / "packed-refs"
+        if packed_refs.exists():
+            tags.update(_parse_packed_refs(packed_refs.read_text()))
+
+        # Loose refs take precedence over packed refs.
+        tags_dir = git_dir / "refs" / "tags"
+        if tags_dir.exists():
+            for path in tags_dir.rglob("*"):
+                if path.is_file() and path.suffix != ".lock":
+                    name = path.relative_to(tags_dir).as_posix()
+                    tags[name] = _peel(store, path.read_text().strip())
+
+    return [Tag(name, commit) for name, commit in tags.items()]
+
+
+def _parse_packed_refs(content: str) -> dict[str, str]:
+    """Parse `packed-refs` into a mapping of tag name to commit."""
+    lines = content.splitlines()
+    # `# pack-refs with: peeled fully-peeled sorted`, peeled guarantees annotated tags have a `^` line.
+    traits = set(lines[0].split()) if lines and lines[0].startswith("#") else set()
+    peeled = bool(traits & {"peeled", "fully-peeled"})
+
+    tags = {}
+    name = None
+    for line in lines:
+        if line.startswith("#"):
+            continue
+        if line.startswith("^"):
+            # Peeled commit of the annotated tag on the previous line.
+            if name is not None:
+                tags[name] = line[1:]
+            continue
+
+        object_name, ref = line.split(" ", 1)
+        name = ref[len("refs/tags/") :] if ref.startswith("refs/tags/") else None
+        if name is None:
+            continue
+        if not peeled:
+            msg = "packed-refs not fully peeled"
+            raise UnresolvedRefError(msg)
+        tags[name] = object_name
+    return tags
+
+
+def _peel(store: ObjectStore, object_name: str) -> str:
+    """Resolve an object name to a commit, following annotated tag objects."""
+    while True:
+        object_type, content = store.read(object_name)
+        if object_type == b"commit":
+            return object_name
+        if object_type != b"tag":
+            raise UnresolvedRefError(object_name)
+
+        # First line of a tag object is `object <sha>`
+        object_name = content.split(b"\n", 1)[0].split(b" ", 1)[1].decode()
+
+
+def _status_args(untracked_files: str) -> list[str]:
+    return ["git", "status", "--porcelain=v2", "--branch", f"--untracked-files={untracked_files}", "-z"]
+
+
+def _status_error(output: bytes | None) -> errors.VcsError:
+    if output:
+        return errors.VcsError(f"Unable to get current git status: {output.decode().strip()}")
+    return errors.VcsError("Unable to get current git status.")
+
+
+async def _run_async(args: list[str]) -> tuple[int, bytes]:
+    """Run a command with asyncio, returning its exit code and combined output."""
+    import asyncio
+
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    output, _ = await proc.communicate()
+    return proc.returncode, output
+
+
+def parse_status(status: str) -> dict:
+    """Parse NUL terminated `git status --porcelain=v2 --branch` output."""
+    info = {
+        "dirty": False,
+        "branch": "HEAD",
+        "ahead": 0,
+        "behind": 0,
+    }
+    for record in status.split("\0"):
+        if record.startswith("# branch.head "):
+            head = record[len("# branch.head ") :]
+            info["branch"] = "HEAD" if head == "(detached)" else head
+        elif record.startswith("# branch.ab "):
+            ahead, behind = record[len("# branch.ab ") :].split()
+            info["ahead"] = int(ahead)
+            info["behind"] = abs(int(behind))
+        elif record and not record.startswith(("#", "!")):
+            # Changed, renamed, unmerged or untracked entry.
+            info["dirty"] = True
+    return info
+
+
+def reachable(parents: dict[str, list[str]], start: str | None, exclude: Container[str] = ()) -> set[str]:
+    """Find commits reachable from `start` in a walked history.
+
+    The walk does not enter commits in `exclude`, nor parents missing from
+    `parents` (outside the walked history).
+    """
+    seen, stack = set(), [start] if start in parents and start not in exclude else []
+    while stack:
+        commit = stack.pop()
+        if commit not in seen:
+            seen.add(commit)
+            stack.extend(p for p in parents[commit] if p in parents and p not in exclude)
+    return seen
+
+
+class GitBatchReader:
+    """Read many objects through a single `git cat-file --batch` process.
+
+    Requests are written from a background thread while responses are parsed,
+    so git never waits on the next request. Output is read in fixed size
+    chunks, and object content that falls within a chunk is returned as a
+    `memoryview` of it without copying.
+    """
+
+    def __init__(self: BR) -> None:
+        self._proc: subprocess.Popen | None = None
+        self._chunk = b""
+        self._pos = 0
+
+    def __enter__(self: BR) -> BR:  # noqa: D105
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],  # noqa: S603, S607
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        return self
+
+    def __exit__(self: BR, *_args: object) -> None:  # noqa: D105
+        self._proc.stdin.close()
+        self._proc.stdout.close()
+        self._proc.wait()
+        self._proc = None
+
+    def read(self: BR, object_names: Iterable[str]) -> Iterator[tuple[str, str | None, memoryview | None]]:
+        """Read objects, in request order.
+
+        Yields `(object_name, object_type, content)` tuples, type and content
+        are `None` for missing objects.
+        """
+        object_names = list(object_names)
+        writer = threading.Thread(target=self._request, args=(object_names,), daemon=True)
+        writer.start()
+
+        read = 0
+        try:
+            while read < len(object_names):
+                response = self._response()
+                read += 1
+                yield response
+        finally:
+            # Keep the stream aligned for the next read if iteration stopped early.
+            for _ in range(read, len(object_names)):
+                self._response()
+            writer.join()
+
+    def _request(self: BR, object_names: list[str]) -> None:
+        for object_name in object_names:
+            self._proc.stdin.write(f"{object_name}\n".encode())
+        self._proc.stdin.flush()
+
+    def _response(self: BR) -> tuple[str, str | None, memoryview | None]:
+        header = self._readline()
+        object_name, _, info = header.decode().partition(" ")
+        if info in ("missing", "ambiguous"):
+            return object_name, None, None
+
+        object_type, size = info.split(" ")
+        content = self._read(int(size))
+        # Content is followed by a newline.
+        self._read(1)
+        return object_name, object_type, content
+
+    def _next_chunk(self: BR) -> None:
+        chunk = self._proc.stdout.read1(LOG_CHUNK_SIZE)
+        if not chunk:
+            msg = "git cat-file exited unexpectedly."
+            raise errors.VcsError(msg)
+        self._chunk, self._pos = chunk, 0
+
+    def _readline(self: BR) -> bytes:
+        parts = []
+        while (end := self._chunk.find(b"\n", self._pos)) == -1:
+            parts.append(self._chunk[self._pos :])
+            self._next_chunk()
+        parts.append(self._chunk[self._pos : end])
+        self._pos = end + 1
+        return b"".join(parts)
+
+    def _read(self: BR, size: int) -> memoryview:
+        end = self._pos + size
+        if end <= len(self._chunk):
+            view = memoryview(self._chunk)[self._pos : end]
+            self._pos = end
+            return view
+
+        # Spans several chunks, copied once into a single buffer.
+        parts = [memoryview(self._chunk)[self._pos :]]
+        remaining = size - len(parts[0])
+        while remaining:
+            self._next_chunk()
+            take = min(remaining, len(self._chunk))
+            parts.append(memoryview(self._chunk)[:take])
+            self._pos = take
+            remaining -= take
+        return memoryview(b"".join(parts))
 
 
 class Git:
@@ -17,89 +351,340 @@ class Git:
     def __init__(self: T, *, commit: bool = True, dry_run: bool = False) -> None:
         self._commit = commit
         self.dry_run = dry_run
+        self._tag_index: TagIndex | None = None
 
-    def get_current_info(self: T) -> dict[str, str]:
-        """Get current state info from git."""
-        changed_files = (
-            subprocess.check_output(
-                ["git", "status", "-s"],  # noqa: S603, S607
-                stderr=subprocess.STDOUT,
-            )
-            .decode()
-            .strip()
-            .split("\n")
-        )
+    def get_current_info(self: T, untracked_files: str = "normal") -> dict:
+        """Get current state info from git.
 
+        Args:
+            untracked_files: `git status --untracked-files` mode, `no` skips
+                scanning the worktree for untracked files.
+
+        Returns:
+            branch name (`HEAD` if detached), dirty state and upstream
+            ahead/behind commit counts (zero if no upstream is set).
+        """
         try:
-            branch = (
-                subprocess.check_output(
-                    [  # noqa: S603, S607
-                        "git",
-                        "rev-parse",
-                        "--abbrev-ref",
-                        "HEAD",
-                    ],
-                    stderr=subprocess.STDOUT,
-                )
-                .decode()
-                .strip()
-                .split("\n")
-            )
+            status = subprocess.check_output(
+                _status_args(untracked_files),  # noqa: S603
+                stderr=subprocess.STDOUT,
+            ).decode()
         except subprocess.CalledProcessError as e:
-            msg = (
-                f"Unable to get current git branch: {e.output.decode().strip()}"
-                if e.output
-                else "Unable to get current git branch."
-            )
-            raise errors.VcsError(msg) from e
+            raise _status_error(e.output) from e
 
-        return {
-            "dirty": changed_files != [""],  # Any changed files == dirty
-            "branch": branch[0],
-        }
+        return parse_status(status)
 
-    def find_tag(self: T, version_string: str) -> str | None:
-        """Find a version tag given the version string.
+    async def get_current_info_async(self: T, untracked_files: str = "normal") -> dict:
+        """Get current state info from git, without blocking the event loop.
 
-        Given a version string `0.1.2` find the version tag `v0.1.2`, `0.1.2` etc.
+        See `get_current_info`.
         """
-        tag = (
+        returncode, output = await _run_async(_status_args(untracked_files))
+        if returncode:
+            raise _status_error(output)
+        return parse_status(output.decode())
+
+    def get_git_dir(self: T) -> Path:
+        """Get the absolute path to the repository git directory."""
+        git_dir = (
             subprocess.check_output(
-                [  # noqa: S603, S607
-                    "git",
-                    "tag",
-                    "-n",
-                    "--format='%(refname:short)'",
-                    rf"*{version_string}",
-                ],
+                ["git", "rev-parse", "--absolute-git-dir"],  # noqa: S603, S607
                 stderr=subprocess.STDOUT,
             )
             .decode()
             .strip()
         )
+        return Path(git_dir)
+
+    async def get_git_dir_async(self: T) -> Path:
+        """Get the absolute path to the repository git directory, without blocking the event loop."""
+        returncode, output = await _run_async(["git", "rev-parse", "--absolute-git-dir"])
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, "git rev-parse", output)
+        return Path(output.decode().strip())
+
+    def unreachable_commits(self: T, commit_hashes: Iterable[str]) -> set[str]:
+        """Filter provided commit hashes down to those not reachable from HEAD.
+
+        Commits that no longer exist in the repository are ignored.
+        """
+        commit_hashes = set(commit_hashes)
+        if not commit_hashes:
+            return set()
+
+        output = subprocess.run(
+            ["git", "rev-list", "--ignore-missing", "--stdin", "^HEAD"],  # noqa: S603, S607
+            input="\n".join(sorted(commit_hashes)).encode(),
+            capture_output=True,
+            check=True,
+        ).stdout
+        return commit_hashes.intersection(output.decode().split())
+
+    def hooks_dir(self: T) -> Path:
+        """Get the path to the repository hooks directory, respecting `core.hooksPath`."""
+        output = subprocess.check_output(["git", "rev-parse", "--git-path", "hooks"])  # noqa: S603, S607
+        return Path(output.decode().strip()).absolute()
+
+    def add_note(self: T, ref: str, commit: str, message: str) -> None:
+        """Attach a note to a commit, replacing any existing note in `ref`."""
+        subprocess.check_output(
+            ["git", "notes", f"--ref={ref}", "add", "--force", "--file=-", commit],  # noqa: S603, S607
+            input=message.encode(),
+            stderr=subprocess.STDOUT,
+        )
+
+    def read_notes(self: T, ref: str) -> dict[str, str]:
+        """Read every note in `ref`, with two git processes regardless of the number of notes.
+
+        Returns:
+            map of annotated commit hash to note content.
+        """
+        output = subprocess.check_output(["git", "notes", f"--ref={ref}", "list"])  # noqa: S603, S607
+        # Identical notes share a blob, fetch each blob once.
+        blobs = defaultdict(list)
+        for line in output.decode().splitlines():
+            blob, commit = line.split()
+            blobs[blob].append(commit)
+        if not blobs:
+            return {}
+
+        notes = {}
+        with self.batch_reader() as reader:
+            for blob, _, content in reader.read(blobs):
+                if content is not None:
+                    notes.update(dict.fromkeys(blobs[blob], str(content, "utf-8")))
+        return notes
+
+    def batch_reader(self: T) -> GitBatchReader:
+        """Open a reader for fetching many objects from one git process."""
+        return GitBatchReader()
+
+    def tag_index(self: T) -> TagIndex:
+        """Get the index of repository tags, built once per instance."""
+        if self._tag_index is None:
+            self._tag_index = TagIndex.build(self.get_git_dir())
+        return self._tag_index
+
+    async def tag_index_async(self: T) -> TagIndex:
+        """Get the index of repository tags, reading ref files in a worker thread."""
+        import asyncio
+
+        if self._tag_index is None:
+            git_dir = await self.get_git_dir_async()
+            self._tag_index = await asyncio.to_thread(TagIndex.build, git_dir)
+        return self._tag_index
+
+    def find_tag(self: T, version_string: str) -> str | None:
+        """Find a version tag given the version string.
 
-        return tag.strip("'") or None
+        Given a version string `0.1.2` find the version tag `0.1.2`, `v0.1.2`,
+        or failing those a tag with any other prefix, such as `release-0.1.2`.
+        """
+        tag = self.tag_index().find(version_string)
+        return tag.name if tag is not None else None
 
-    def get_logs(self: T, tag: str | None) -> list:
+    def get_logs(
+        self: T,
+        tag: str | None,
+        *,
+        max_count: int | None = None,
+        since: str | None = None,
+        stop_at: str | None = None,
+    ) -> list[tuple[str, str, str]]:
         """Fetch logs since last tag."""
+        return list(self.iter_logs(tag, max_count=max_count, since=since, stop_at=stop_at))
+
+    def iter_logs(
+        self: T,
+        tag: str | None,
+        *,
+        max_count: int | None = None,
+        since: str | None = None,
+        stop_at: str | None = None,
+    ) -> Iterator[tuple[str, str, str]]:
+        """Stream logs since last tag.
+
+        Read NUL delimited records from the `git log` pipe in fixed size chunks,
+        yielding `(short_hash, commit_hash, message)` tuples as they are parsed.
+
+        Args:
+            tag: exclude the tag and its ancestors.
+            max_count: yield at most `max_count` commits.
+            since: only walk commits more recent than a date, in any format
+                accepted by `git log --since`.
+            stop_at: exclude a commit and its ancestors, when no tag is given.
+        """
         args = [
             "git",
             "log",
             "--format=%h:%H:%B",  # message only
             "-z",  # separate with \x00 rather than \n to differentiate multiline commits
         ]
-        if tag:
-            args.append(f"{tag}..HEAD")
-        return [
-            m.split(":", 2)
-            for m in (
-                subprocess.check_output(args)  # noqa: S603
-                .decode()
-                .strip()
-                .split("\x00")
-            )
-            if m
+        if max_count is not None:
+            args.append(f"--max-count={max_count}")
+        if since:
+            args.append(f"--since={since}")
+        if tag or stop_at:
+            args.append(f"{tag or stop_at}..HEAD")
+
+        for record in self._iter_log_records(args):
+            short_hash, commit_hash, message = record.split(":", 2)
+            yield short_hash, commit_hash, message
+
+    def last_commit(self: T, pathspec: str) -> str | None:
+        """Find the most recent commit that changed files matching `pathspec`.
+
+        The walk stops at the first match, so this is cheap for recently
+        changed files.
+        """
+        output = subprocess.check_output(
+            ["git", "rev-list", "-1", "HEAD", "--", pathspec],  # noqa: S603, S607
+        )
+        return output.decode().strip() or None
+
+    def iter_tagged_logs(self: T) -> Iterator[tuple[str, str, list[str], list[str], int, str]]:
+        """Stream the full history, decorated with tags pointing at each commit.
+
+        Yields `(short_hash, commit_hash, parents, tags, commit_timestamp, message)` tuples.
+        """
+        args = [
+            "git",
+            "log",
+            "--decorate-refs=refs/tags/",  # only decorate with tag names
+            "--format=%h%x1f%H%x1f%P%x1f%D%x1f%ct%x1f%B",  # \x1f separated, decorations contain `:`
+            "-z",
         ]
+        for record in self._iter_log_records(args):
+            short_hash, commit_hash, parents, refs, timestamp, message = record.split("\x1f", 5)
+            tags = [ref.removeprefix("tag: ") for ref in refs.split(", ") if ref]
+            yield short_hash, commit_hash, parents.split(), tags, int(timestamp), message
+
+    def iter_changed_logs(
+        self: T,
+        tips: list[str],
+        exclude: list[str],
+        *,
+        max_count: int | None = None,
+        since: str | None = None,
+    ) -> Iterator[tuple[str, str, list[str], list[str], str]]:
+        """Stream logs reachable from `tips` but not from `exclude`, with the files each commit changed.
+
+        Yields `(short_hash, commit_hash, parents, files, message)` tuples.
+
+        Args:
+            tips: commits to walk back from.
+            exclude: exclude these commits and their ancestors.
+            max_count: yield at most `max_count` commits.
+            since: only walk commits more recent than a date.
+        """
+        args = [
+            "git",
+            "log",
+            "--name-only",
+            "-z",
+            # \x1e separates commits, file names follow the \x1f\x00 terminated header.
+            "--format=%x1e%h%x1f%H%x1f%P%x1f%B%x1f",
+        ]
+        if max_count is not None:
+            args.append(f"--max-count={max_count}")
+        if since:
+            args.append(f"--since={since}")
+        args.extend(tips)
+        if exclude:
+            args.extend(["--not", *exclude])
+        args.append("--")
+
+        for record in self._iter_log_records(args, b"\x1e"):
+            header, _, files = record.partition("\x1f\x00")
+            short_hash, commit_hash, parents, message = header.split("\x1f", 3)
+            yield short_hash, commit_hash, parents.split(), [f for f in files.strip("\n").split("\x00") if f], message
+
+    def merge_base(self: T, commits: list[str]) -> str | None:
+        """Find the best common ancestor of all commits, `None` if histories are unrelated."""
+        result = subprocess.run(
+            ["git", "merge-base", "--octopus", *commits],  # noqa: S603, S607
+            capture_output=True,
+            check=False,
+        )
+        return result.stdout.decode().strip() or None
+
+    def rev_parse(self: T, rev: str) -> str:
+        """Resolve a revision to a commit hash."""
+        return subprocess.check_output(["git", "rev-parse", rev], stderr=subprocess.STDOUT).decode().strip()  # noqa: S603, S607
+
+    def partition_logs(
+        self: T,
+        tags: dict[str, str | None],
+        *,
+        max_count: int | None = None,
+        since: str | None = None,
+        stop_at: dict[str, str] | None = None,
+    ) -> dict[str, list[tuple[str, str, list[str], str]]]:
+        """Fetch `tag..HEAD` logs for several tags from a single history walk.
+
+        Walks HEAD and every tag back to their common ancestor once, then
+        splits commits per key using reachability from each tag.
+
+        Args:
+            tags: map of key to tag name, `None` for all history.
+            max_count: walk at most `max_count` commits.
+            since: only walk commits more recent than a date, in any format
+                accepted by `git log --since`.
+            stop_at: map of key to a commit excluded with its ancestors,
+                for keys without a tag.
+
+        Returns:
+            map of key to `(short_hash, commit_hash, files, message)` tuples,
+            newest first.
+        """
+        index = self.tag_index()
+        stop_at = stop_at or {}
+        tag_commits = {key: index.tags[tag].commit if tag else stop_at.get(key) for key, tag in tags.items()}
+        commits = sorted({commit for commit in tag_commits.values() if commit is not None})
+
+        head = self.rev_parse("HEAD")
+        # Anything reachable from every tag is excluded for all keys, don't walk it.
+        base = self.merge_base(commits) if commits and None not in tag_commits.values() else None
+
+        logs, parents = [], {}
+        for short_hash, commit_hash, commit_parents, files, message in self.iter_changed_logs(
+            [head, *commits],
+            [base] if base else [],
+            max_count=max_count,
+            since=since,
+        ):
+            parents[commit_hash] = commit_parents
+            logs.append((short_hash, commit_hash, files, message))
+
+        from_head = reachable(parents, head)
+        partitions = {}
+        for key, tag_commit in tag_commits.items():
+            excluded = reachable(parents, tag_commit)
+            partitions[key] = [log for log in logs if log[1] in from_head and log[1] not in excluded]
+        return partitions
+
+    def _iter_log_records(self: T, args: list[str], separator: bytes = b"\x00") -> Iterator[str]:
+        """Read `separator` delimited records from a `git log -z` pipe in fixed size chunks."""
+        with subprocess.Popen(args, stdout=subprocess.PIPE) as proc:  # noqa: S603
+            remainder = b""
+            while chunk := proc.stdout.read(LOG_CHUNK_SIZE):
+                *records, tail = chunk.split(separator)
+                if not records:
+                    # Record spans multiple chunks, keep accumulating.
+                    remainder += tail
+                    continue
+
+                records[0] = remainder + records[0]
+                remainder = tail
+                for record in records:
+                    if record:
+                        yield record.decode()
+
+            if remainder.strip():
+                yield remainder.decode()
+
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, args)
 
     def add_path(self: T, path: str) -> None:
         """Add path to git repository."""
@@ -128,9 +713,73 @@ class Git:
             msg = f"Unable to commit: {e.output.decode().strip()}" if e.output else "Unable to commit."
             raise errors.VcsError(msg) from e
 
-    def revert(self: T) -> None:
-        """Revert a commit."""
+    def revert(self: T, commit: str = "HEAD~1") -> None:
+        """Reset to `commit`, discarding later commits and any tags pointing at them.
+
+        By default only the last commit is reverted.
+        """
         if self.dry_run:
             logger.warning("Would revert commit in Git")
             return
-        subprocess.check_output(["git", "reset", "HEAD~1", "--hard"])  # noqa: S603, S607
+
+        discarded = subprocess.check_output(["git", "rev-list", f"{commit}..HEAD"]).decode().split()  # noqa: S603, S607
+        if discarded:
+            tags = subprocess.check_output(
+                ["git", "tag", "--list", *(f"--points-at={c}" for c in discarded)],  # noqa: S603, S607
+            )
+            for tag in tags.decode().split():
+                logger.warning("Deleting tag %s", tag)
+                subprocess.check_output(["git", "tag", "--delete", tag])  # noqa: S603, S607
+        subprocess.check_output(["git", "reset", commit, "--hard"])  # noqa: S603, S607
+
+
+class NativeGit(Git):
+    """Git implementation reading commit history in process.
+
+    Logs are walked directly from the object store, see
+    `changelog_gen.git_objects`, other operations use the git cli. Falls back
+    to the git cli if the repository can not be read directly.
+    """
+
+    def get_git_dir(self: NG) -> Path:
+        """Get the absolute path to the repository git directory."""
+        try:
+            return find_git_dir()
+        except UnsupportedRepositoryError:
+            return super().get_git_dir()
+
+    async def get_git_dir_async(self: NG) -> Path:
+        """Get the absolute path to the repository git directory."""
+        return self.get_git_dir()
+
+    def iter_logs(
+        self: NG,
+        tag: str | None,
+        *,
+        max_count: int | None = None,
+        since: str | None = None,
+        stop_at: str | None = None,
+    ) -> Iterator[tuple[str, str, str]]:
+        """Stream logs since last tag, walking commits in process.
+
+        `since` accepts any git date format, so it is delegated to the git cli.
+        """
+        if since:
+            yield from super().iter_logs(tag, max_count=max_count, since=since, stop_at=stop_at)
+            return
+
+        yielded = False
+        try:
+            with ObjectStore(self.get_git_dir()) as store:
+                exclude = self.tag_index().tags[tag].commit if tag else stop_at
+                abbrev = store.abbrev_length()
+                commits = store.walk(store.resolve("HEAD"), exclude)
+                for commit in itertools.islice(commits, max_count):
+                    yield commit.sha[:abbrev], commit.sha, commit.message
+                    yielded = True
+        except UnsupportedRepositoryError as e:
+            if yielded:
+                msg = f"Unable to read git history: {e}"
+                raise errors.VcsError(msg) from e
+            logger.debug("Unable to read git history (%s), falling back to git.", e)
+            yield from super().iter_logs(tag, max_count=max_count, stop_at=stop_at)
@@ -1,12 +1,16 @@
+from __future__ import annotations
+
+import importlib.util
 import logging
 import re
 import subprocess
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 from warnings import warn
 
-try:
-    from bumpversion import bump  # noqa: F401
-except ImportError:  # pragma: no cover
+# Detect without importing, bump-my-version is only loaded once a version is required.
+if (
+    importlib.util.find_spec("bumpversion") is None or importlib.util.find_spec("bumpversion.bump") is None
+):  # pragma: no cover
     bump_library = "bump2version"
     warn(
         "bump2version deprecated, recommend installing extras[bump-my-version].",
@@ -18,6 +22,9 @@ else:
 
 from changelog_gen import errors
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound="BumpVersion")
@@ -43,6 +50,41 @@ def parse_bump2version_info(_semver: str, lines: list[str]) -> tuple[str, str]:
     return bumpversion_data["current_version"], bumpversion_data["new_version"]
 
 
+def version_candidates(path: Path | None = None) -> tuple[str, dict[str, str | None]]:
+    """Calculate the current version, and the next version for each part, using bump-my-version.
+
+    Configuration is read from `path`, the current directory by default. Parts
+    that can not be bumped (i.e. a release part already at its final value)
+    map to `None`.
+    """
+    from bumpversion.config import get_configuration
+    from bumpversion.config.files import CONFIG_FILE_SEARCH_ORDER, find_config_file
+    from bumpversion.exceptions import BumpVersionError
+    from bumpversion.utils import get_context
+
+    if path is None:
+        config_file = find_config_file()
+    else:
+        config_file = next(filter(None, (find_config_file(path / name) for name in CONFIG_FILE_SEARCH_ORDER)), None)
+
+    try:
+        config = get_configuration(config_file)
+        current = config.version_config.parse(config.current_version)
+    except (BumpVersionError, ValueError) as e:
+        msg = "Unable to get version data from bumpversion."
+        raise errors.VersionDetectionError(msg) from e
+
+    context = get_context(config)
+    candidates = {}
+    for part in config.parts:
+        try:
+            candidates[part] = config.version_config.serialize(current.bump(part), context)
+        except (BumpVersionError, ValueError):  # noqa: PERF203
+            candidates[part] = None
+
+    return config.current_version, candidates
+
+
 def generate_verbosity(verbose: int = 0) -> list[str]:
     """Generate verbose flags correctly for each supported bumpversion library."""
     return ["--verbose"] * verbose if bump_library == "bump2version" else [f"-{'v' * verbose}"]
@@ -63,10 +105,20 @@ commands = {
 
 
 class BumpVersion:  # noqa: D101
-    def __init__(self: T, verbose: int = 0, *, allow_dirty: bool = False, dry_run: bool = False) -> None:
+    def __init__(
+        self: T,
+        verbose: int = 0,
+        *,
+        allow_dirty: bool = False,
+        dry_run: bool = False,
+        path: Path | None = None,
+    ) -> None:
         self.verbose = verbose
         self.allow_dirty = allow_dirty
         self.dry_run = dry_run
+        # Directory containing the bumpversion configuration, current directory by default.
+        self.path = path
+        self._version_candidates: tuple[str, dict[str, str | None]] | None = None
 
     def _version_info_cmd(self: T, semver: str) -> list[str]:
         command = commands[bump_library]["get_version_info"]
@@ -85,11 +137,22 @@ class BumpVersion:  # noqa: D101
 
     def get_version_info(self: T, semver: str) -> dict[str, str]:
         """Get version info for a semver release."""
+        if bump_library == "bump-my-version":
+            current, candidates = self._candidates()
+            if candidates.get(semver) is None:
+                msg = f"Unable to bump version part '{semver}'."
+                raise errors.VersionDetectionError(msg)
+            return {
+                "current": current,
+                "new": candidates[semver],
+            }
+
         try:
             describe_out = (
                 subprocess.check_output(
                     self._version_info_cmd(semver),  # noqa: S603
                     stderr=subprocess.STDOUT,
+                    cwd=self.path,
                 )
                 .decode()
                 .strip()
@@ -107,6 +170,45 @@ class BumpVersion:  # noqa: D101
             "new": new,
         }
 
+    async def get_version_info_async(self: T, semver: str) -> dict[str, str]:
+        """Get version info for a semver release, without blocking the event loop.
+
+        See `get_version_info`.
+        """
+        import asyncio
+
+        if bump_library == "bump-my-version":
+            return await asyncio.to_thread(self.get_version_info, semver)
+
+        proc = await asyncio.create_subprocess_exec(
+            *self._version_info_cmd(semver),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=self.path,
+        )
+        output, _ = await proc.communicate()
+        if proc.returncode:
+            for line in output.decode().split("\n"):
+                logger.warning(line.strip())
+            msg = "Unable to get version data from bumpversion."
+            raise errors.VersionDetectionError(msg)
+
+        current, new = commands[bump_library]["parser"](semver, output.decode().strip().split("\n"))
+        return {
+            "current": current,
+            "new": new,
+        }
+
+    def _candidates(self: T) -> tuple[str, dict[str, str | None]]:
+        """Calculate the next version for every version part, in process.
+
+        bump-my-version is used as a library, configuration is read once and
+        the results cached, so repeated lookups are free.
+        """
+        if self._version_candidates is None:
+            self._version_candidates = version_candidates(self.path)
+        return self._version_candidates
+
     def release(self: T, version: str) -> None:
         """Generate new release."""
         try:
@@ -114,6 +216,7 @@ class BumpVersion:  # noqa: D101
                 subprocess.check_output(
                     self._release_cmd(version),  # noqa: S603
                     stderr=subprocess.STDOUT,
+                    cwd=self.path,
                 )
                 .decode()
                 .strip()
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
+import stat
 import typing
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import mkstemp
 
 if typing.TYPE_CHECKING:
     from changelog_gen import config
@@ -15,6 +19,9 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Size of each read when copying existing changelog entries into the new file.
+COPY_CHUNK_SIZE = 64 * 1024
+
 
 class Extension(Enum):
     """Supported changelog file extensions."""
@@ -37,11 +44,7 @@ class BaseWriter:
         *,
         dry_run: bool = False,
     ) -> None:
-        self.existing = []
         self.changelog = changelog
-        if self.changelog.exists():
-            lines = changelog.read_text().split("\n")
-            self.existing = lines[self.file_header_line_count + 1 :]
         self.content = []
         self.dry_run = dry_run
         self.issue_link = cfg.issue_link
@@ -66,7 +69,7 @@ class BaseWriter:
     def add_section(self: typing.Self, header: str, changes: dict[str, Change]) -> None:
         """Add a section to changelog file."""
         self._add_section_header(header)
-        for change in sorted(changes.values()):
+        for change in sorted(changes.values(), key=attrgetter("sort_key")):
             description = f"{change.scope} {change.description}" if change.scope else change.description
             description = f"{self.bold_string('Breaking:')} {description}" if change.breaking else description
             description = f"{description} {change.authors}" if change.authors else description
@@ -95,18 +98,62 @@ class BaseWriter:
         return f"\n\n{content}\n\n"
 
     def write(self: typing.Self) -> None:
-        """Write file contents to destination."""
-        self.content = [self.file_header, *self.content, *self.existing]
-        self._write(self.content)
+        """Write file contents to destination.
+
+        New content is written to a temporary file followed by the existing
+        entries, streamed from the current changelog, before atomically
+        replacing the changelog.
+        """
+        self._write([self.file_header, *self.content], self._file_footer())
+
+    def _file_footer(self: typing.Self) -> list[str]:
+        return []
+
+    def _copy_existing(self: typing.Self, output_file: typing.BinaryIO) -> None:
+        """Copy existing changelog entries, skipping the file header, in fixed size chunks."""
+        if not self.changelog.exists():
+            return
+
+        with self.changelog.open("rb") as existing:
+            for _ in range(self.file_header_line_count + 1):
+                if not existing.readline().endswith(b"\n"):
+                    # No entries after the file header.
+                    return
+
+            output_file.write(b"\n")
+            shutil.copyfileobj(existing, output_file, COPY_CHUNK_SIZE)
 
-    def _write(self: typing.Self, content: list[str]) -> None:
+    def _file_mode(self: typing.Self) -> int:
+        if self.changelog.exists():
+            return stat.S_IMODE(self.changelog.stat().st_mode)
+
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+    def _write(self: typing.Self, content: list[str], footer: list[str]) -> None:
         if self.dry_run:
             logger.warning("Would write to '%s'", self.changelog.name)
-            with NamedTemporaryFile("wb") as output_file:
-                output_file.write(("\n".join(content)).encode("utf-8"))
         else:
             logger.warning("Writing to '%s'", self.changelog.name)
-            self.changelog.write_text("\n".join(content))
+
+        # Temporary file in the same directory, os.replace is only atomic within a filesystem.
+        fd, name = mkstemp(dir=self.changelog.parent, prefix=f".{self.changelog.name}.", suffix=".tmp")
+        tmp = Path(name)
+        try:
+            with os.fdopen(fd, "wb") as output_file:
+                output_file.write("\n".join(content).encode("utf-8"))
+                self._copy_existing(output_file)
+                if footer:
+                    output_file.write(("\n" + "\n".join(footer)).encode("utf-8"))
+                output_file.flush()
+                os.fsync(output_file.fileno())
+
+            if not self.dry_run:
+                tmp.chmod(self._file_mode())
+                tmp.replace(self.changelog)
+        finally:
+            tmp.unlink(missing_ok=True)
 
 
 class MdWriter(BaseWriter):
@@ -185,10 +232,8 @@ class RstWriter(BaseWriter):
 
         self.content.extend([line, ""])
 
-    def write(self: typing.Self) -> None:
-        """Write contents to destination."""
-        self.content = [self.file_header, *self.content, *self.existing, *self.links]
-        self._write(self.content)
+    def _file_footer(self: typing.Self) -> list[str]:
+        return self.links
 
 
 def new_writer(
@@ -196,9 +241,13 @@ def new_writer(
     cfg: config.Config,
     *,
     dry_run: bool = False,
+    path: Path | None = None,
 ) -> BaseWriter:
-    """Generate a new writer based on the required extension."""
-    changelog = Path(f"CHANGELOG.{extension.value}")
+    """Generate a new writer based on the required extension.
+
+    Writes `CHANGELOG.{extension}` to `path`, the current directory by default.
+    """
+    changelog = (path or Path()) / f"CHANGELOG.{extension.value}"
 
     if extension == Extension.MD:
         return MdWriter(changelog, cfg, dry_run=dry_run)
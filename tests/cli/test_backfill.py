@@ -0,0 +1,140 @@
+import pytest
+
+
+@pytest.fixture()
+def tagged_repo(git_repo):
+    f = git_repo.workspace / "hello.txt"
+    for msg, tag in [
+        ("initial commit", None),
+        ("fix: Detail about 1\n\nRefs: #1\n", "v0.0.1"),
+        ("feat: Detail about 2\n\nRefs: #2\n", None),
+        ("update readme", None),
+        ("fix(config): Detail about 3", "0.1.0"),
+        ("fix: Detail about 4\n\nRefs: #4\n", "a-random-tag"),
+        ("feat!: Detail about 5\n\nRefs: #5\n", "v1.0.0"),
+        ("fix: Unreleased", None),
+    ]:
+        f.write_text(msg)
+        git_repo.run("git add hello.txt")
+        git_repo.api.index.commit(msg)
+        if tag:
+            git_repo.api.create_tag(tag)
+
+    return git_repo
+
+
+@pytest.mark.usefixtures("tagged_repo")
+def test_backfill_writes_all_releases(cli_runner):
+    result = cli_runner.invoke(["backfill"])
+
+    assert result.exit_code == 0
+    with open("CHANGELOG.md") as f:  # noqa: PTH123
+        content = f.read()
+
+    assert (
+        content
+        == """# Changelog
+
+## v1.0.0
+
+### Features and Improvements
+
+- **Breaking:** Detail about 5 [#5]
+
+### Bug fixes
+
+- Detail about 4 [#4]
+
+## v0.1.0
+
+### Features and Improvements
+
+- Detail about 2 [#2]
+
+### Bug fixes
+
+- (`config`) Detail about 3
+
+## v0.0.1
+
+### Bug fixes
+
+- Detail about 1 [#1]
+"""
+    )
+
+
+@pytest.mark.usefixtures("tagged_repo")
+def test_backfill_rst(cli_runner, git_repo):
+    result = cli_runner.invoke(["backfill", "--file-format", "rst"])
+
+    assert result.exit_code == 0
+    content = (git_repo.workspace / "CHANGELOG.rst").read_text()
+    assert content.index("v1.0.0") < content.index("v0.1.0") < content.index("v0.0.1")
+
+
+@pytest.mark.usefixtures("tagged_repo")
+def test_backfill_dry_run(cli_runner, git_repo):
+    result = cli_runner.invoke(["backfill", "--dry-run"])
+
+    assert result.exit_code == 0
+    assert "## v0.0.1" in result.output
+    assert not (git_repo.workspace / "CHANGELOG.md").exists()
+
+
+def test_backfill_aborts_if_file_exists(cli_runner, git_repo):
+    (git_repo.workspace / "CHANGELOG.md").write_text("# Changelog\n")
+
+    result = cli_runner.invoke(["backfill"])
+
+    assert result.exit_code == 1
+    assert result.output.strip() == "CHANGELOG.md detected."
+
+
+def test_backfill_aborts_if_no_version_tags(cli_runner, git_repo):
+    git_repo.api.index.commit("initial commit")
+
+    result = cli_runner.invoke(["backfill"])
+
+    assert result.exit_code == 1
+    assert result.output.strip() == "No version tags found."
+
+
+def test_backfill_assigns_merged_commits_by_reachability(cli_runner, git_repo, monkeypatch):
+    def commit(message, filename, date):
+        monkeypatch.setenv("GIT_COMMITTER_DATE", f"{date} +0000")
+        (git_repo.workspace / filename).write_text(message)
+        git_repo.run(f"git add {filename}")
+        git_repo.run(f"git commit -q -m '{message}'")
+
+    commit("fix: Detail about 1", "hello.txt", "2024-01-01T00:00:00")
+    git_repo.run("git checkout -q -b feature")
+    # Older than the v1.0.0 commit, but only merged after v1.0.0 was released.
+    commit("feat: Detail about 2", "feature.txt", "2024-01-02T00:00:00")
+    git_repo.run("git checkout -q master")
+    commit("fix: Detail about 3", "hello.txt", "2024-01-03T00:00:00")
+    git_repo.run("git tag v1.0.0")
+    monkeypatch.setenv("GIT_COMMITTER_DATE", "2024-01-04T00:00:00 +0000")
+    git_repo.run("git merge -q --no-ff feature -m 'Merge feature'")
+    git_repo.run("git tag v1.1.0")
+
+    result = cli_runner.invoke(["backfill"])
+
+    assert result.exit_code == 0
+    assert (git_repo.workspace / "CHANGELOG.md").read_text() == (
+        """# Changelog
+
+## v1.1.0
+
+### Features and Improvements
+
+- Detail about 2
+
+## v1.0.0
+
+### Bug fixes
+
+- Detail about 3
+- Detail about 1
+"""
+    )
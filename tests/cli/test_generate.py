@@ -1,12 +1,17 @@
+import asyncio
+import json
+from pathlib import Path
 from unittest import mock
 
 import pytest
 import typer
 from freezegun import freeze_time
 
-from changelog_gen import errors
+from changelog_gen import errors, post_processor, version
 from changelog_gen.cli import command
 from changelog_gen.config import PostProcessConfig
+from changelog_gen.post_processor import Journal
+from changelog_gen.vcs import Tag
 
 
 @pytest.fixture(autouse=True)
@@ -16,8 +21,12 @@ def mock_git(monkeypatch):
         "dirty": False,
         "branch": "main",
     }
-    mock_git.get_logs.return_value = []
+    mock_git.iter_logs.return_value = []
     mock_git.find_tag.return_value = "v0.0.0"
+    mock_git.get_git_dir.return_value = Path(".git")
+    # Async probes report whatever the synchronous api is configured to return.
+    mock_git.get_current_info_async = mock.AsyncMock(side_effect=lambda **kwargs: mock_git.get_current_info(**kwargs))
+    mock_git.tag_index_async = mock.AsyncMock()
 
     monkeypatch.setattr(command, "Git", mock.Mock(return_value=mock_git))
 
@@ -32,7 +41,9 @@ def mock_bump(monkeypatch):
         "new": "0.0.1",
     }
 
-    monkeypatch.setattr(command, "BumpVersion", mock.Mock(return_value=mock_bump))
+    mock_bump.get_version_info_async = mock.AsyncMock(side_effect=lambda semver: mock_bump.get_version_info(semver))
+
+    monkeypatch.setattr(version, "BumpVersion", mock.Mock(return_value=mock_bump))
 
     return mock_bump
 
@@ -60,7 +71,7 @@ def _release_notes(cwd):
 @pytest.fixture()
 def commit_factory(mock_git):
     def factory(commits):
-        mock_git.get_logs.return_value = [
+        mock_git.iter_logs.return_value = [
             (f"short{i}", f"commit-hash{i}", message) for i, message in enumerate(commits)
         ]
 
@@ -174,6 +185,46 @@ allow_dirty = false
     assert result.output.strip() == "Working directory is not clean. Use `allow_dirty` configuration to ignore."
 
 
+@pytest.mark.usefixtures("changelog", "_conventional_commits")
+def test_generate_reports_dirty_before_version_errors(gen_cli_runner, mock_git, mock_bump):
+    mock_git.get_current_info.return_value = {
+        "dirty": True,
+        "branch": "main",
+    }
+    mock_bump.get_version_info.side_effect = errors.VersionDetectionError("Unable to get version data.")
+
+    result = gen_cli_runner.invoke()
+
+    assert result.exit_code == 1
+    assert result.output.strip() == "Working directory is not clean. Use `allow_dirty` configuration to ignore."
+
+
+@pytest.mark.usefixtures("changelog", "_conventional_commits")
+def test_generate_runs_probes_concurrently(gen_cli_runner, mock_git, mock_bump):
+    running = 0
+    concurrent = []
+
+    def probe(result):
+        async def _probe(*_args, **_kwargs):
+            nonlocal running
+            running += 1
+            await asyncio.sleep(0.01)
+            concurrent.append(running)
+            running -= 1
+            return result
+
+        return _probe
+
+    mock_git.get_current_info_async.side_effect = probe({"dirty": False, "branch": "main"})
+    mock_git.tag_index_async.side_effect = probe(None)
+    mock_bump.get_version_info_async.side_effect = probe({"current": "0.0.0", "new": "0.0.1"})
+
+    result = gen_cli_runner.invoke(["--dry-run"])
+
+    assert result.exit_code == 0
+    assert concurrent[0] == 3  # noqa: PLR2004
+
+
 @pytest.mark.usefixtures("changelog", "_conventional_commits")
 def test_generate_allows_dirty(gen_cli_runner, cwd):
     p = cwd / "pyproject.toml"
@@ -493,7 +544,7 @@ release = true
     assert result.exit_code == 1
     assert mock_git.commit.call_args == mock.call("0.0.1", ["CHANGELOG.md"])
     assert mock_bump.release.call_args == mock.call("0.0.1")
-    assert mock_git.revert.call_args == mock.call()
+    assert mock_git.revert.call_args == mock.call(mock_git.rev_parse.return_value)
 
 
 @pytest.mark.usefixtures("_conventional_commits")
@@ -578,6 +629,190 @@ def test_generate_reject_empty(
     )
 
 
+@pytest.mark.usefixtures("_conventional_commits", "changelog")
+def test_generate_native_git_backend(gen_cli_runner, cwd, mock_git, monkeypatch):
+    p = cwd / "pyproject.toml"
+    p.write_text(
+        """
+[tool.changelog_gen]
+git_backend = "native"
+""",
+    )
+    native_git = mock.Mock(return_value=mock_git)
+    monkeypatch.setattr(command, "NativeGit", native_git)
+
+    result = gen_cli_runner.invoke(["--dry-run"])
+
+    assert result.exit_code == 0
+    assert native_git.call_args == mock.call(dry_run=True)
+
+
+@pytest.mark.usefixtures("changelog")
+def test_generate_bounds_untagged_history(gen_cli_runner, mock_git):
+    mock_git.find_tag.return_value = None
+    mock_git.last_commit.return_value = "changelog-hash"
+
+    result = gen_cli_runner.invoke(["--dry-run", "--max-commits", "50", "--since", "2024-01-01", "--stop-at-changelog"])
+
+    assert result.exit_code == 0
+    assert mock_git.iter_logs.call_args == mock.call(None, max_count=50, since="2024-01-01", stop_at="changelog-hash")
+
+
+@pytest.mark.usefixtures("_conventional_commits", "changelog")
+def test_generate_profile(gen_cli_runner):
+    result = gen_cli_runner.invoke(["--dry-run", "--profile"])
+
+    assert result.exit_code == 0
+    phases = [line.split()[0] for line in result.output.splitlines()[-8:]]
+    assert phases == [
+        "phase",
+        "probes",
+        "extract",
+        "version_tag",
+        "render",
+        "write",
+        "commit",
+        "total",
+    ]
+
+
+@pytest.mark.usefixtures("_conventional_commits", "changelog")
+def test_generate_profile_json(gen_cli_runner, cwd):
+    trace = cwd / "trace.json"
+    result = gen_cli_runner.invoke(["--dry-run", "--profile-json", str(trace)])
+
+    assert result.exit_code == 0
+    assert "phase" not in result.output
+    data = json.loads(trace.read_text())
+    assert [span["name"] for span in data["spans"]] == [
+        "probes",
+        "extract",
+        "version_tag",
+        "render",
+        "write",
+        "commit",
+    ]
+
+
+@pytest.mark.usefixtures("_conventional_commits", "changelog")
+def test_generate_trace_file(gen_cli_runner, cwd):
+    trace = cwd / "trace.jsonl"
+    result = gen_cli_runner.invoke(["--dry-run", "--trace-file", str(trace)])
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in trace.read_text().splitlines()]
+    assert records
+    assert {record["source"] for record in records} == {"parsed"}
+
+
+@pytest.fixture()
+def monorepo(cwd, mock_git):
+    (cwd / "pyproject.toml").write_text(
+        """
+[tool.changelog_gen.packages]
+core = { path = "packages/core", tag_prefix = "core-" }
+utils = { path = "packages/utils", tag_prefix = "utils-" }
+""",
+    )
+    for package in ["core", "utils"]:
+        path = cwd / "packages" / package
+        path.mkdir(parents=True)
+        (path / "CHANGELOG.md").write_text("# Changelog\n")
+
+    mock_git.tag_index.return_value.find.side_effect = lambda version, prefix: Tag(f"{prefix}{version}", "hash")
+    mock_git.partition_logs.return_value = {
+        "core": [
+            ("short1", "commit-hash1", ["packages/core/a.py"], "feat: Core feature\n\nRefs: #1\n"),
+            ("short2", "commit-hash2", ["packages/utils/a.py"], "fix: Utils fix\n\nRefs: #2\n"),
+        ],
+        "utils": [],
+    }
+    return cwd
+
+
+@pytest.mark.usefixtures("monorepo")
+def test_generate_monorepo_packages(gen_cli_runner, cwd, monkeypatch, mock_git, mock_bump):
+    monkeypatch.setattr(typer, "confirm", mock.MagicMock(return_value=True))
+    monkeypatch.setattr(version, "BumpVersion", mock.Mock(return_value=mock_bump))
+
+    result = gen_cli_runner.invoke(["--commit", "--release"])
+
+    assert result.exit_code == 0
+    assert mock_git.partition_logs.call_args == mock.call({"core": "core-0.0.0", "utils": "utils-0.0.0"})
+    assert (cwd / "packages" / "core" / "CHANGELOG.md").read_text() == (
+        "# Changelog\n\n## v0.0.1\n\n### Features and Improvements\n\n- Core feature [#1]\n"
+    )
+    # No changes routed to utils, its CHANGELOG is left untouched.
+    assert (cwd / "packages" / "utils" / "CHANGELOG.md").read_text() == "# Changelog\n"
+    assert mock_git.commit.call_args == mock.call("core 0.0.1", ["packages/core/CHANGELOG.md"])
+    assert version.BumpVersion.call_args_list[-1] == mock.call(
+        verbose=0,
+        dry_run=False,
+        allow_dirty=False,
+        path=Path("packages/core"),
+    )
+    assert mock_bump.release.call_args_list == [mock.call("0.0.1")]
+
+
+@pytest.mark.usefixtures("monorepo")
+def test_generate_monorepo_reverts_partial_release(gen_cli_runner, monkeypatch, mock_git, mock_bump):
+    mock_git.partition_logs.return_value["utils"] = [
+        ("short2", "commit-hash2", ["packages/utils/a.py"], "fix: Utils fix\n\nRefs: #2\n"),
+    ]
+    mock_bump.release.side_effect = [None, Exception("bump failed")]
+    monkeypatch.setattr(typer, "confirm", mock.MagicMock(return_value=True))
+
+    result = gen_cli_runner.invoke(["--commit", "--release"])
+
+    assert result.exit_code == 1
+    assert "Error creating release for utils: bump failed" in result.output
+    assert mock_git.commit.call_args == mock.call(
+        "core 0.0.1, utils 0.0.1",
+        ["packages/core/CHANGELOG.md", "packages/utils/CHANGELOG.md"],
+    )
+    assert mock_bump.release.call_args_list == [mock.call("0.0.1"), mock.call("0.0.1")]
+    # Back to before the CHANGELOG commit, discarding the core release.
+    assert mock_git.revert.call_args_list == [mock.call(mock_git.rev_parse.return_value)]
+
+
+def test_generate_monorepo_post_process(gen_cli_runner, monorepo, monkeypatch, mock_git):
+    with (monorepo / "pyproject.toml").open("a") as f:
+        f.write('\n[tool.changelog_gen]\npost_process.url = "https://my-api/::issue_ref::/release"\n')
+    mock_git.partition_logs.return_value["utils"] = [
+        ("short3", "commit-hash3", ["packages/utils/a.py"], "fix: Utils fix\n\nRefs: #42\n"),
+        ("short4", "commit-hash4", ["packages/utils/b.py"], "fix: Utils fix without ref\n"),
+    ]
+    monkeypatch.setattr(typer, "confirm", mock.MagicMock(return_value=True))
+    post_process_mock = mock.MagicMock()
+    monkeypatch.setattr(post_processor, "per_issue_post_process", post_process_mock)
+
+    result = gen_cli_runner.invoke()
+
+    assert result.exit_code == 0
+    assert [c.args[1:] for c in post_process_mock.call_args_list] == [
+        (["1"], "core-0.0.1"),
+        (["42"], "utils-0.0.1"),
+    ]
+
+
+@pytest.mark.usefixtures("monorepo")
+def test_generate_monorepo_rejects_version_tag(gen_cli_runner, mock_git):
+    result = gen_cli_runner.invoke(["--version-tag", "1.0.0"])
+
+    assert result.exit_code == 1
+    assert mock_git.partition_logs.call_count == 0
+
+
+@pytest.mark.usefixtures("monorepo")
+def test_generate_monorepo_requires_package_changelogs(gen_cli_runner, cwd):
+    (cwd / "packages" / "utils" / "CHANGELOG.md").unlink()
+
+    result = gen_cli_runner.invoke()
+
+    assert result.exit_code == 1
+    assert "No CHANGELOG file detected for utils" in result.output
+
+
 class TestDelegatesToPerIssuePostProcess:
     # The behaviour of per_issue_post_process are tested in test_post_processor
 
@@ -589,7 +824,7 @@ class TestDelegatesToPerIssuePostProcess:
     ):
         monkeypatch.setattr(typer, "confirm", mock.MagicMock(return_value=True))
         post_process_mock = mock.MagicMock()
-        monkeypatch.setattr(command, "per_issue_post_process", post_process_mock)
+        monkeypatch.setattr(post_processor, "per_issue_post_process", post_process_mock)
 
         result = gen_cli_runner.invoke()
 
@@ -603,6 +838,7 @@ class TestDelegatesToPerIssuePostProcess:
                 ["1", "2", "3", "4"],
                 "0.0.1",
                 dry_run=False,
+                journal=Journal(Path(".git/changelog_gen/post_process.jsonl")),
             ),
         ]
 
@@ -614,7 +850,7 @@ class TestDelegatesToPerIssuePostProcess:
     ):
         monkeypatch.setattr(typer, "confirm", mock.MagicMock(return_value=True))
         post_process_mock = mock.MagicMock()
-        monkeypatch.setattr(command, "per_issue_post_process", post_process_mock)
+        monkeypatch.setattr(post_processor, "per_issue_post_process", post_process_mock)
 
         api_url = "https://my-api/::issue_ref::/comment"
         result = gen_cli_runner.invoke(["--post-process-url", api_url])
@@ -629,6 +865,7 @@ class TestDelegatesToPerIssuePostProcess:
                 ["1", "2", "3", "4"],
                 "0.0.1",
                 dry_run=False,
+                journal=Journal(Path(".git/changelog_gen/post_process.jsonl")),
             ),
         ]
 
@@ -640,7 +877,7 @@ class TestDelegatesToPerIssuePostProcess:
     ):
         monkeypatch.setattr(typer, "confirm", mock.MagicMock(return_value=True))
         post_process_mock = mock.MagicMock()
-        monkeypatch.setattr(command, "per_issue_post_process", post_process_mock)
+        monkeypatch.setattr(post_processor, "per_issue_post_process", post_process_mock)
 
         result = gen_cli_runner.invoke(["--post-process-auth-env", "OTHER_API_AUTH"])
 
@@ -654,6 +891,7 @@ class TestDelegatesToPerIssuePostProcess:
                 ["1", "2", "3", "4"],
                 "0.0.1",
                 dry_run=False,
+                journal=Journal(Path(".git/changelog_gen/post_process.jsonl")),
             ),
         ]
 
@@ -665,7 +903,7 @@ class TestDelegatesToPerIssuePostProcess:
     ):
         monkeypatch.setattr(typer, "confirm", mock.MagicMock(return_value=True))
         post_process_mock = mock.MagicMock()
-        monkeypatch.setattr(command, "per_issue_post_process", post_process_mock)
+        monkeypatch.setattr(post_processor, "per_issue_post_process", post_process_mock)
 
         result = gen_cli_runner.invoke(["--dry-run"])
 
@@ -679,6 +917,7 @@ class TestDelegatesToPerIssuePostProcess:
                 ["1", "2", "3", "4"],
                 "0.0.1",
                 dry_run=True,
+                journal=Journal(Path(".git/changelog_gen/post_process.jsonl")),
             ),
         ]
 
@@ -690,7 +929,7 @@ class TestDelegatesToPerIssuePostProcess:
     ):
         monkeypatch.setattr(typer, "confirm", mock.MagicMock(return_value=False))
         post_process_mock = mock.MagicMock()
-        monkeypatch.setattr(command, "per_issue_post_process", post_process_mock)
+        monkeypatch.setattr(post_processor, "per_issue_post_process", post_process_mock)
 
         result = gen_cli_runner.invoke([])
 
@@ -0,0 +1,173 @@
+import json
+import os
+import shutil
+import sys
+from unittest import mock
+
+import pytest
+
+from changelog_gen import notes
+from changelog_gen.cache import fingerprint
+from changelog_gen.config import SUPPORTED_TYPES, Config
+from changelog_gen.extractor import Change, ReleaseNoteExtractor
+from changelog_gen.vcs import Git
+
+
+def commit(git_repo, message):
+    f = git_repo.workspace / "hello.txt"
+    f.write_text(message)
+    git_repo.run("git add hello.txt")
+    git_repo.run(f"git commit -q -m '{message}'")
+    return git_repo.run("git rev-parse HEAD", capture=True).strip()
+
+
+def test_hook_install(cli_runner, git_repo):
+    result = cli_runner.invoke(["hook", "install"])
+
+    assert result.exit_code == 0
+    hook = git_repo.workspace / ".git" / "hooks" / "post-commit"
+    assert os.access(hook, os.X_OK)
+    assert "changelog hook post-commit" in hook.read_text()
+    assert sys.executable not in hook.read_text()
+
+
+@pytest.mark.usefixtures("git_repo")
+def test_hook_install_is_idempotent(cli_runner):
+    cli_runner.invoke(["hook", "install"])
+
+    result = cli_runner.invoke(["hook", "install"])
+
+    assert result.exit_code == 0
+
+
+def test_hook_install_keeps_existing_hook(cli_runner, git_repo):
+    hook = git_repo.workspace / ".git" / "hooks" / "post-commit"
+    hook.write_text("#!/bin/sh\necho custom\n")
+
+    result = cli_runner.invoke(["hook", "install"])
+
+    assert result.exit_code == 1
+    assert hook.read_text() == "#!/bin/sh\necho custom\n"
+
+    result = cli_runner.invoke(["hook", "install", "--force"])
+
+    assert result.exit_code == 0
+    assert "hook post-commit" in hook.read_text()
+
+
+def test_hook_post_commit_records_note(cli_runner, git_repo):
+    commit_hash = commit(git_repo, "fix: Detail about 1\n\nRefs: #1")
+
+    result = cli_runner.invoke(["hook", "post-commit"])
+
+    assert result.exit_code == 0
+    note = json.loads(git_repo.run("git notes --ref=changelog show HEAD", capture=True))
+    assert note == {
+        "fingerprint": fingerprint(SUPPORTED_TYPES),
+        "change": {
+            "issue_ref": "1",
+            "description": "Detail about 1",
+            "commit_type": "fix",
+            "authors": "",
+            "scope": "",
+            "breaking": False,
+            "short_hash": commit_hash[:7],
+            "commit_hash": commit_hash,
+        },
+    }
+
+
+@pytest.mark.usefixtures("git_repo")
+def test_hook_post_commit_never_fails(cli_runner):
+    # No commits to parse.
+    result = cli_runner.invoke(["hook", "post-commit"])
+
+    assert result.exit_code == 0
+
+
+def test_installed_hook_skips_without_entry_point(cli_runner, git_repo, monkeypatch):
+    cli_runner.invoke(["hook", "install"])
+    monkeypatch.setenv("PATH", os.path.dirname(shutil.which("git")))  # noqa: PTH120
+
+    commit(git_repo, "fix: Detail about 1")
+
+    assert notes.load(Git(), fingerprint(SUPPORTED_TYPES)) == {}
+
+
+def test_installed_hook_notes_follow_amend(cli_runner, git_repo):
+    cli_runner.invoke(["hook", "install"])
+    commit(git_repo, "fix: Detail about 1")
+
+    git_repo.run("git commit -q --amend -m 'fix: Detail about 2'")
+    commit_hash = git_repo.run("git rev-parse HEAD", capture=True).strip()
+
+    changes = notes.load(Git(), fingerprint(SUPPORTED_TYPES))
+    assert changes[commit_hash].description == "Detail about 2"
+
+
+def test_installed_hook_notes_follow_rebase(cli_runner, git_repo):
+    cli_runner.invoke(["hook", "install"])
+    commit(git_repo, "initial commit")
+    git_repo.run("git checkout -q -b feature")
+    commit(git_repo, "fix: Detail about 1")
+    git_repo.run("git checkout -q master")
+    (git_repo.workspace / "other.txt").write_text("other")
+    git_repo.run("git add other.txt")
+    git_repo.run("git commit -q -m 'feat: Detail about 2'")
+    git_repo.run("git checkout -q feature")
+
+    git_repo.run("git rebase -q master")
+    commit_hash = git_repo.run("git rev-parse HEAD", capture=True).strip()
+
+    changes = notes.load(Git(), fingerprint(SUPPORTED_TYPES))
+    assert changes[commit_hash].description == "Detail about 1"
+    assert (
+        json.loads(git_repo.run("git notes --ref=changelog show HEAD", capture=True))["change"]["commit_hash"]
+        == commit_hash
+    )
+
+
+def test_installed_hook_notes_used_by_extractor(cli_runner, git_repo):
+    cli_runner.invoke(["hook", "install"])
+    commit(git_repo, "initial commit")
+    first = commit(git_repo, "fix: Detail about 1\n\nRefs: #1")
+    # Committed before the hook was installed, or without it.
+    (git_repo.workspace / ".git" / "hooks" / "post-commit").unlink()
+    second = commit(git_repo, "feat: Detail about 2\n\nRefs: #2")
+
+    cfg = Config(commit_notes=True)
+    e = ReleaseNoteExtractor(cfg, Git())
+    with mock.patch.object(e, "_parse_commit_log", wraps=e._parse_commit_log) as parse:
+        sections = e.extract("0.0.0")
+
+    # Only the commit without a note is parsed.
+    assert parse.call_args_list == [mock.call(second[:7], second, mock.ANY)]
+    assert sections["Bug fixes"]["1"] == Change(
+        "1",
+        "Detail about 1",
+        "fix",
+        short_hash=first[:7],
+        commit_hash=first,
+    )
+    assert sorted(sections["Features and Improvements"]) == ["2"]
+
+
+def test_notes_hashes_follow_annotated_commit(git_repo):
+    old_hash = commit(git_repo, "fix: Detail about 1")
+    commit_hash = commit(git_repo, "fix: Detail about 1, reworded")
+    git = Git()
+    change = Change("1", "Detail about 1", "fix", short_hash=old_hash[:7], commit_hash=old_hash)
+    git.add_note(notes.NOTES_REF, commit_hash, notes.dump(change, "fp"))
+
+    assert notes.load(git, "fp") == {
+        commit_hash: Change("1", "Detail about 1", "fix", short_hash=commit_hash[:7], commit_hash=commit_hash),
+    }
+
+
+def test_notes_ignores_stale_fingerprint(git_repo):
+    commit_hash = commit(git_repo, "fix: Detail about 1")
+    git = Git()
+    git.add_note(notes.NOTES_REF, commit_hash, notes.dump(None, "old"))
+
+    assert notes.load(git, "old") == {commit_hash: None}
+    assert notes.load(git, "new") == {}
@@ -0,0 +1,114 @@
+from unittest import mock
+
+import pytest
+
+from changelog_gen import post_processor
+from changelog_gen.cli import command
+from changelog_gen.config import PostProcessConfig
+from changelog_gen.post_processor import Journal
+
+
+@pytest.fixture(autouse=True)
+def mock_git(monkeypatch, cwd):
+    mock_git = mock.Mock()
+    mock_git.get_git_dir.return_value = cwd / ".git"
+
+    monkeypatch.setattr(command, "Git", mock.Mock(return_value=mock_git))
+
+    return mock_git
+
+
+@pytest.fixture()
+def journal(cwd):
+    return Journal(cwd / ".git" / "changelog_gen" / "post_process.jsonl")
+
+
+@pytest.fixture()
+def post_process_pyproject(cwd):
+    p = cwd / "pyproject.toml"
+    p.write_text(
+        """
+[tool.changelog_gen]
+post_process.url = "https://my-api/::issue_ref::/release"
+""",
+    )
+
+    return p
+
+
+@pytest.fixture()
+def post_process_mock(monkeypatch):
+    post_process_mock = mock.MagicMock()
+    monkeypatch.setattr(post_processor, "per_issue_post_process", post_process_mock)
+    return post_process_mock
+
+
+@pytest.mark.usefixtures("post_process_pyproject")
+def test_resume_sends_outstanding(cli_runner, journal, post_process_mock):
+    journal.plan("1.0.0", ["1", "2", "3"])
+    journal.record("1.0.0", "2", "https://my-api/2/release")
+
+    result = cli_runner.invoke(["post-process", "--resume", "1.0.0"])
+
+    assert result.exit_code == 0
+    assert post_process_mock.call_args_list == [
+        mock.call(
+            PostProcessConfig(url="https://my-api/::issue_ref::/release"),
+            ["1", "3"],
+            "1.0.0",
+            dry_run=False,
+            journal=journal,
+        ),
+    ]
+
+
+@pytest.mark.usefixtures("post_process_pyproject")
+def test_resume_nothing_outstanding(cli_runner, journal, post_process_mock):
+    journal.plan("1.0.0", ["1"])
+    journal.record("1.0.0", "1", "https://my-api/1/release")
+
+    result = cli_runner.invoke(["post-process", "--resume", "1.0.0"])
+
+    assert result.exit_code == 0
+    assert result.output.strip() == "No outstanding post process requests for 1.0.0."
+    assert post_process_mock.call_count == 0
+
+
+@pytest.mark.usefixtures("cwd")
+def test_resume_requires_post_process_url(cli_runner, post_process_mock):
+    result = cli_runner.invoke(["post-process", "--resume", "1.0.0"])
+
+    assert result.exit_code == 1
+    assert result.output.strip() == "No post_process url configured."
+    assert post_process_mock.call_count == 0
+
+
+@pytest.mark.usefixtures("cwd")
+def test_resume_url_override(cli_runner, journal, post_process_mock):
+    journal.plan("1.0.0", ["1"])
+
+    result = cli_runner.invoke(
+        ["post-process", "--resume", "1.0.0", "--post-process-url", "https://other/::issue_ref::"],
+    )
+
+    assert result.exit_code == 0
+    assert post_process_mock.call_args.args[0].url == "https://other/::issue_ref::"
+
+
+@pytest.mark.usefixtures("cwd")
+def test_resume_batch(cli_runner, journal, monkeypatch):
+    (journal.path.parent.parent.parent / "pyproject.toml").write_text(
+        """
+[tool.changelog_gen]
+post_process.url = "https://my-api/release"
+post_process.batch = true
+""",
+    )
+    batch_mock = mock.MagicMock()
+    monkeypatch.setattr(post_processor, "batch_post_process", batch_mock)
+    journal.plan("1.0.0", ["1", "2"])
+
+    result = cli_runner.invoke(["post-process", "--resume", "1.0.0"])
+
+    assert result.exit_code == 0
+    assert batch_mock.call_args.args[1:] == (["1", "2"], "1.0.0")
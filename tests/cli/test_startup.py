@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+
+# Heavy dependencies each command must not import. Checking module presence
+# rather than timings keeps the tests stable on slow or loaded machines.
+VERSION_UNUSED_MODULES = ["httpx", "bumpversion", "rtoml", "pydantic", "rich.logging"]
+GENERATE_UNUSED_MODULES = ["httpx"]
+
+LOADED_MODULES = """
+import json, sys
+from changelog_gen.cli.command import app
+try:
+    app()
+finally:
+    sys.stderr.write("\\n" + json.dumps(sorted(sys.modules)))
+"""
+
+
+def loaded_modules(*args):
+    result = subprocess.run(
+        [sys.executable, "-c", LOADED_MODULES, *args],  # noqa: S603
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+    return result.returncode, set(json.loads(result.stderr.splitlines()[-1]))
+
+
+def test_version_skips_heavy_imports():
+    returncode, modules = loaded_modules("--version")
+
+    assert returncode == 0
+    for module in VERSION_UNUSED_MODULES:
+        assert module not in modules
+
+
+def test_generate_dry_run_skips_heavy_imports(git_repo):
+    p = git_repo.workspace / "pyproject.toml"
+    p.write_text(
+        """
+[tool.bumpversion]
+current_version = "0.0.0"
+        """.strip(),
+    )
+    git_repo.run("touch CHANGELOG.md")
+    git_repo.run("git add CHANGELOG.md pyproject.toml")
+    git_repo.run("git commit -m 'initial commit'")
+
+    returncode, modules = loaded_modules("generate", "--dry-run")
+
+    assert returncode == 0
+    for module in GENERATE_UNUSED_MODULES:
+        assert module not in modules
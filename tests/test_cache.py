@@ -0,0 +1,101 @@
+import json
+from unittest import mock
+
+import pytest
+
+from changelog_gen import cache
+from changelog_gen.config import SUPPORTED_TYPES, CommitType
+from changelog_gen.extractor import Change
+
+
+@pytest.fixture()
+def cache_path(tmp_path):
+    return tmp_path / "changelog_gen" / "parse_cache.json"
+
+
+@pytest.fixture()
+def git():
+    git = mock.Mock()
+    git.unreachable_commits.return_value = set()
+    return git
+
+
+def test_fingerprint_stable():
+    assert cache.fingerprint(SUPPORTED_TYPES) == cache.fingerprint(dict(SUPPORTED_TYPES))
+
+
+def test_fingerprint_changes_with_commit_types():
+    assert cache.fingerprint(SUPPORTED_TYPES) != cache.fingerprint({"fix": CommitType("Bug fixes")})
+
+
+def test_load_missing_cache(cache_path):
+    c = cache.ParseCache.load(cache_path, "fp")
+
+    assert c.entries == {}
+    assert "abc" not in c
+
+
+def test_round_trip(cache_path, git):
+    change = Change("1", "Detail about 1", "fix", short_hash="abc", commit_hash="abcdef")
+    c = cache.ParseCache.load(cache_path, "fp")
+    c["abcdef"] = change
+    c["123456"] = None
+    c.save(git)
+
+    c = cache.ParseCache.load(cache_path, "fp")
+
+    assert "abcdef" in c
+    assert c["abcdef"] == change
+    assert "123456" in c
+    assert c["123456"] is None
+
+
+def test_load_discards_on_fingerprint_mismatch(cache_path, git):
+    c = cache.ParseCache.load(cache_path, "fp")
+    c["123456"] = None
+    c.save(git)
+
+    c = cache.ParseCache.load(cache_path, "other")
+
+    assert "123456" not in c
+    assert c.changed is True
+
+
+def test_load_discards_unreadable_cache(cache_path):
+    cache_path.parent.mkdir()
+    cache_path.write_text("{not json")
+
+    c = cache.ParseCache.load(cache_path, "fp")
+
+    assert c.entries == {}
+
+
+def test_save_skipped_if_unchanged(cache_path, git):
+    c = cache.ParseCache.load(cache_path, "fp")
+    c.save(git)
+
+    assert not cache_path.exists()
+
+
+def test_evict_unreachable(cache_path, git):
+    git.unreachable_commits.return_value = {"old"}
+    c = cache.ParseCache(cache_path, "fp")
+    c.entries = {"old": None, "reachable": None, "current": None}
+    c["current"] = None
+
+    c.save(git)
+
+    assert git.unreachable_commits.call_args == mock.call(["old", "reachable"])
+    assert json.loads(cache_path.read_text())["entries"] == {"reachable": None, "current": None}
+
+
+def test_evict_least_recently_used_over_limit(cache_path, git):
+    c = cache.ParseCache(cache_path, "fp", max_entries=2)
+    c["a"] = None
+    c["b"] = None
+    c["c"] = None
+    c["a"]
+
+    c.save(git)
+
+    assert list(json.loads(cache_path.read_text())["entries"]) == ["c", "a"]
@@ -494,6 +494,25 @@ headers."content-type" = "application/json"
             headers={"content-type": "application/json"},
         )
 
+    def test_read_picks_up_batch_post_process_config_pyproject(self, config_factory):
+        config_factory(
+            """
+[tool.changelog_gen.post_process]
+url = "https://fake_rest_api/release"
+body = '{"issues": ::issue_refs::, "comment": "Released in ::version::"}'
+batch = true
+batch_size = 100
+""",
+        )
+
+        c = config.read()
+        assert c.post_process == config.PostProcessConfig(
+            url="https://fake_rest_api/release",
+            body='{"issues": ::issue_refs::, "comment": "Released in ::version::"}',
+            batch=True,
+            batch_size=100,
+        )
+
     def test_read_picks_up_unexpected_replaces(self, config_factory):
         config_factory(
             """
@@ -560,6 +579,22 @@ enabled = false
             config.read()
 
 
+def test_read_picks_up_packages(config_factory):
+    config_factory(
+        """
+[tool.changelog_gen.packages]
+core = { path = "packages/core", tag_prefix = "core-" }
+utils = { path = "packages/utils" }
+""",
+    )
+
+    c = config.read()
+    assert c.packages == {
+        "core": config.PackageConfig(path="packages/core", tag_prefix="core-"),
+        "utils": config.PackageConfig(path="packages/utils"),
+    }
+
+
 @pytest.mark.parametrize(
     ("key", "value"),
     [
@@ -568,6 +603,9 @@ enabled = false
         ("allow_dirty", True),
         ("reject_empty", True),
         ("date_format", "%Y-%m-%d"),
+        ("max_commits", 100),
+        ("since", "2 weeks ago"),
+        ("stop_at_changelog", True),
     ],
 )
 def test_read_overrides(config_factory, key, value):
@@ -590,6 +628,9 @@ commit=true
         ("allow_dirty", True),
         ("reject_empty", True),
         ("date_format", "%Y-%m-%d"),
+        ("max_commits", 100),
+        ("since", "2 weeks ago"),
+        ("stop_at_changelog", True),
     ],
 )
 def test_read_overrides_pyproject(config_factory, key, value):
@@ -1,12 +1,21 @@
+import dataclasses
+import json
+import logging
+import os
 import random
+import sys
+import time
+import tracemalloc
+import typing
+from operator import attrgetter
 from unittest import mock
 
 import pytest
 
 from changelog_gen import extractor
-from changelog_gen.config import CommitType, Config
-from changelog_gen.extractor import Change, ReleaseNoteExtractor
-from changelog_gen.vcs import Git
+from changelog_gen.config import CommitType, Config, PackageConfig
+from changelog_gen.extractor import Change, ConventionalCommit, ReleaseNoteExtractor, parse_conventional_commit
+from changelog_gen.vcs import Git, Tag
 
 
 @pytest.fixture()
@@ -325,6 +334,144 @@ Refs: #1
     }
 
 
+def test_git_commit_extraction_parse_cache(conventional_commits, monkeypatch):
+    hashes = conventional_commits
+    cfg = Config(parse_cache=True)
+    git = Git()
+
+    sections = ReleaseNoteExtractor(cfg, git).extract("0.0.2")
+
+    assert (git.get_git_dir() / "changelog_gen" / "parse_cache.json").exists()
+
+    e = ReleaseNoteExtractor(cfg, git)
+    monkeypatch.setattr(e, "_parse_commit_log", mock.Mock())
+
+    assert e.extract("0.0.2") == sections
+    assert e._parse_commit_log.call_count == 0
+    assert sections["Bug fixes"]["4"].commit_hash == hashes[0]
+
+
+@pytest.mark.usefixtures("conventional_commits")
+def test_git_commit_extraction_parse_cache_parses_new_commits(multiversion_repo):
+    cfg = Config(parse_cache=True)
+    git = Git()
+    ReleaseNoteExtractor(cfg, git).extract("0.0.2")
+
+    f = multiversion_repo.workspace / "hello.txt"
+    f.write_text("Detail about 5.")
+    multiversion_repo.run("git add hello.txt")
+    multiversion_repo.api.index.commit("fix: Detail about 5")
+
+    e = ReleaseNoteExtractor(cfg, git)
+    with mock.patch.object(e, "_parse_commit_log", wraps=e._parse_commit_log) as parse:
+        sections = e.extract("0.0.2")
+
+    assert parse.call_count == 1
+    assert sorted(sections["Bug fixes"]) == ["1", "4", "__0__"]
+    assert sorted(sections["Features and Improvements"]) == ["2", "3"]
+
+
+def test_extract_packages_routes_commits_by_path(git_repo):
+    def commit(path, message):
+        f = git_repo.workspace / path
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.write_text(message)
+        git_repo.run(f"git add {path}")
+        git_repo.api.index.commit(message)
+
+    commit("core/a.txt", "fix: Core initial")
+    commit("utils/a.txt", "fix: Utils initial")
+    git_repo.api.create_tag("core-v0.0.1")
+    git_repo.api.create_tag("utils-0.0.1")
+    commit("core/a.txt", "feat: Core feature\n\nRefs: #1")
+    commit("utils/a.txt", "fix: Utils fix")
+    commit("core-extras/a.txt", "fix: Not core")
+    commit("utils/a.txt", "Not conventional for utils")
+
+    cfg = Config(
+        packages={
+            "core": PackageConfig(path="core", tag_prefix="core-"),
+            "utils": PackageConfig(path="utils/", tag_prefix="utils-"),
+            "root": PackageConfig(path="."),
+        },
+    )
+    e = ReleaseNoteExtractor(cfg, Git())
+    with mock.patch.object(e, "_parse_commit_log", wraps=e._parse_commit_log) as parse:
+        sections = e.extract_packages(cfg.packages, {"core": "0.0.1", "utils": "0.0.1", "root": "0.0.0"})
+
+    assert {header: sorted(changes) for header, changes in sections["core"].items()} == {
+        "Features and Improvements": ["1"],
+    }
+    assert {
+        header: sorted(change.description for change in changes.values())
+        for header, changes in sections["utils"].items()
+    } == {"Bug fixes": ["Utils fix"]}
+    assert len(sections["root"]["Bug fixes"]) == 4  # noqa: PLR2004
+    # Each commit is parsed once, regardless of the number of packages it is routed to.
+    assert parse.call_count == 6  # noqa: PLR2004
+
+
+def test_git_commit_extraction_bounds_untagged_history():
+    git = mock.Mock()
+    git.find_tag.return_value = None
+    git.iter_logs.return_value = []
+    git.last_commit.return_value = "changelog-hash"
+    cfg = Config(max_commits=100, since="1 year ago", stop_at_changelog=True)
+
+    ReleaseNoteExtractor(cfg, git).extract("0.0.1")
+
+    assert git.last_commit.call_args == mock.call("CHANGELOG.*")
+    assert git.iter_logs.call_args == mock.call(None, max_count=100, since="1 year ago", stop_at="changelog-hash")
+
+
+def test_extract_packages_bounds_untagged_packages():
+    git = mock.Mock()
+    git.tag_index.return_value.find.side_effect = (
+        lambda version, prefix: Tag(f"{prefix}{version}", "hash") if prefix else None
+    )
+    git.partition_logs.return_value = {"core": [], "utils": []}
+    git.last_commit.return_value = "changelog-hash"
+    cfg = Config(max_commits=100, since="1 year ago", stop_at_changelog=True)
+    packages = {"core": PackageConfig(path="core", tag_prefix="core-"), "utils": PackageConfig(path="utils/")}
+
+    ReleaseNoteExtractor(cfg, git).extract_packages(packages, {"core": "0.0.1", "utils": "0.0.0"})
+
+    assert git.last_commit.call_args_list == [mock.call("utils/CHANGELOG.*")]
+    assert git.partition_logs.call_args == mock.call(
+        {"core": "core-0.0.1", "utils": None},
+        max_count=100,
+        since="1 year ago",
+        stop_at={"utils": "changelog-hash"},
+    )
+
+
+def test_extract_packages_does_not_bound_tagged_packages():
+    git = mock.Mock()
+    git.tag_index.return_value.find.side_effect = lambda version, prefix: Tag(f"{prefix}{version}", "hash")
+    git.partition_logs.return_value = {"core": []}
+    cfg = Config(max_commits=100, stop_at_changelog=True)
+
+    ReleaseNoteExtractor(cfg, git).extract_packages(
+        {"core": PackageConfig(path="core", tag_prefix="core-")},
+        {"core": "0.0.1"},
+    )
+
+    assert git.last_commit.call_count == 0
+    assert git.partition_logs.call_args == mock.call({"core": "core-0.0.1"})
+
+
+def test_git_commit_extraction_does_not_bound_tagged_history():
+    git = mock.Mock()
+    git.find_tag.return_value = "v0.0.1"
+    git.iter_logs.return_value = []
+    cfg = Config(max_commits=100, stop_at_changelog=True)
+
+    ReleaseNoteExtractor(cfg, git).extract("0.0.1")
+
+    assert git.last_commit.call_count == 0
+    assert git.iter_logs.call_args == mock.call("v0.0.1")
+
+
 @pytest.mark.backwards_compat()
 @pytest.mark.usefixtures("_valid_release_notes")
 def test_invalid_notes_skipped():
@@ -343,6 +490,42 @@ def test_invalid_notes_skipped():
     }
 
 
+@pytest.mark.backwards_compat()
+@pytest.mark.usefixtures("_valid_release_notes")
+def test_malformed_and_directory_notes_skipped(release_notes):
+    (release_notes / "5.fix.md").write_text("Detail about 5")
+    (release_notes / "6").write_text("Detail about 6")
+    (release_notes / ".fix").write_text("Detail about 7")
+    (release_notes / "8.fix").mkdir()
+    cfg = Config(commit_types={"fix": CommitType("Fix")})
+
+    with mock.patch.object(extractor.logger, "warning") as warning:
+        sections = ReleaseNoteExtractor(cfg, Git()).extract("0.0.2")
+
+    assert sections == {
+        "Fix": {
+            "1": Change("1", "Detail about 1", "fix"),
+            "4": Change("4", "Detail about 4", "fix"),
+        },
+    }
+    skipped = [c.args[1] for c in warning.call_args_list if c.args[0].startswith("  Skipping release note")]
+    assert skipped == ["5.fix.md", "6"]
+
+
+@pytest.mark.backwards_compat()
+def test_many_notes_read_in_order(release_notes, monkeypatch):
+    monkeypatch.setattr(extractor, "RELEASE_NOTE_READ_WORKERS", 4)
+    for i in range(50):
+        (release_notes / f"{i:02}.fix").write_text(f"Detail about {i}\n")
+    cfg = Config(commit_types={"fix": CommitType("Fix")})
+
+    sections = ReleaseNoteExtractor(cfg, Git()).extract("0.0.2")
+
+    assert list(sections["Fix"].items()) == [
+        (f"{i:02}", Change(f"{i:02}", f"Detail about {i}", "fix")) for i in range(50)
+    ]
+
+
 def test_unique_issues():
     cfg = Config(commit_types={"bug": CommitType("BugFix"), "feat": CommitType("Features")})
     git = mock.Mock()
@@ -401,6 +584,16 @@ def test_clean_removes_all_non_dotfiles(release_notes):
     assert [f.name for f in release_notes.iterdir()] == [".file"]
 
 
+@pytest.mark.backwards_compat()
+@pytest.mark.usefixtures("_valid_release_notes")
+def test_clean_keeps_directories(release_notes):
+    (release_notes / "5.fix").mkdir()
+
+    ReleaseNoteExtractor(Config(), mock.Mock()).clean()
+
+    assert sorted(f.name for f in release_notes.iterdir()) == [".file", "5.fix"]
+
+
 @pytest.mark.parametrize(
     ("sections", "commit_types", "expected_semver"),
     [
@@ -556,3 +749,302 @@ def test_change_ordering():
             commit_type="fix",
         ),
     ]
+
+
+def test_change_sort_key_follows_replace():
+    change = Change(issue_ref="", description="Detail", commit_type="fix", scope="(Writer)")
+    assert change.sort_key == (True, "(writer)", "")
+
+    change = dataclasses.replace(change, issue_ref="ABC-1", breaking=True)
+    assert change.sort_key == (False, "(writer)", "abc-1")
+
+
+def test_change_interns_repeated_strings():
+    # Built at runtime, so not already interned as literals are.
+    commit_type, scope = "".join(["f", "ix"]), "".join(["(a", "pi)"])  # noqa: FLY002
+    change = Change(issue_ref="1", description="Detail", commit_type=commit_type, scope=scope)
+
+    assert change.commit_type is sys.intern("fix")
+    assert change.scope is sys.intern("(api)")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require python 3.10")
+def test_change_has_no_instance_dict():
+    assert not hasattr(Change(issue_ref="1", description="Detail", commit_type="fix"), "__dict__")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require python 3.10")
+def test_change_sort_benchmark():
+    @dataclasses.dataclass
+    class DictChange:
+        # Change without slots, comparing freshly built tuples.
+        issue_ref: str
+        description: str
+        commit_type: str
+        authors: str = ""
+        scope: str = ""
+        breaking: bool = False
+        short_hash: typing.Optional[str] = None  # noqa: FA100
+        commit_hash: typing.Optional[str] = None  # noqa: FA100
+
+        def __lt__(self, other):
+            s = (not self.breaking, self.scope.lower() if self.scope else "zzz", self.issue_ref.lower())
+            o = (not other.breaking, other.scope.lower() if other.scope else "zzz", other.issue_ref.lower())
+            return s < o
+
+    def bench(change_cls):
+        tracemalloc.start()
+        changes = [
+            change_cls(
+                issue_ref=f"__{i}__",
+                description=f"Bump dependency {i}",
+                commit_type="chore",
+                scope=f"(deps-{i % 10})",
+                breaking=i % 100 == 0,
+            )
+            for i in range(20_000)
+        ]
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        random.shuffle(changes)
+
+        start = time.perf_counter()
+        sorted(changes, key=attrgetter("sort_key")) if change_cls is Change else sorted(changes)
+        return memory, time.perf_counter() - start
+
+    change_memory, change_time = bench(Change)
+    dict_memory, dict_time = bench(DictChange)
+
+    assert change_memory < dict_memory
+    assert change_time < dict_time
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("fix: Detail", ConventionalCommit("fix", "Detail", "")),
+        ("fix(config): Detail", ConventionalCommit("fix", "Detail", "", scope="config")),
+        ("fix(my-scope.v2)!: Detail", ConventionalCommit("fix", "Detail", "", scope="my-scope.v2", breaking=True)),
+        ("feat!: Detail\n\nRefs: #1\n", ConventionalCommit("feat", "Detail", "\n\nRefs: #1\n", breaking=True)),
+        (
+            "fix: Allow one/two `chars`, ignore link. (#20)\n\nBody",
+            ConventionalCommit("fix", "Allow one/two `chars`, ignore link.", "(#20)\n\nBody"),
+        ),
+        ("fix typo", None),
+        ("update readme", None),
+        ("custom: Detail", None),
+        ("fix:Detail", None),
+        ("fix: ", None),
+        ("fix: (#20)", None),
+        ("fix(): Detail", None),
+        ("fix(sc ope): Detail", None),
+        ("fix(scope: Detail", None),
+        ("", None),
+    ],
+)
+def test_parse_conventional_commit(message, expected):
+    assert parse_conventional_commit(message, {"fix": "Bug fixes", "feat": "Features"}) == expected
+
+
+@pytest.mark.parametrize(
+    "subject",
+    [
+        "fix: " + "a " * 50_000 + "\x00",
+        "fix: " + "a." * 50_000 + "(",
+        "fix(" + "a-" * 50_000 + ": Detail",
+        "fix" + "x" * 100_000,
+        " " * 100_000,
+    ],
+)
+def test_parse_conventional_commit_pathological_subject_bounded(subject):
+    commit_types = {"fix": "Bug fixes"}
+    start = time.perf_counter()
+    for _ in range(5):
+        parse_conventional_commit(subject, commit_types)
+    elapsed = time.perf_counter() - start
+
+    # Linear scan over 100k characters, well clear of exponential backtracking.
+    assert elapsed < 2.0  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("", {}),
+        ("\n\nRefs: #1\n", {"Refs": "#1"}),
+        ("\nRefs: #1\nAuthors: (edgy, tom)\n", {"Refs": "#1", "Authors": "(edgy, tom)"}),
+        ("\n\nRefs #12", {"Refs": "12"}),
+        ("\n\nBREAKING CHANGE:\nRefs: #1\n", {"BREAKING CHANGE": "", "Refs": "#1"}),
+        ("\n\nBREAKING CHANGE: drops\n  python 3.8\nRefs: #1", {"BREAKING CHANGE": "drops python 3.8", "Refs": "#1"}),
+        ("\n\nCustom-Trailer: value", {"Custom-Trailer": "value"}),
+        ("\n\nRefs: #1\nRefs: #2", {"Refs": "#2"}),
+        # Only the last paragraph is searched.
+        ("\n\nRefs: #1\n\nA closing paragraph.", {}),
+        ("\n\nRefs: #1\n\nNot: a closing paragraph.\n", {"Not": "a closing paragraph."}),
+        # Every line must be a trailer.
+        ("\n\nsome\nprose\nlines\nNote: a stray line", {}),
+        # Unless git generated one of them, then at least a quarter must be trailers.
+        (
+            "\n\nsome\nprose\nRefs: #1\nSigned-off-by: A U Thor <a@example.com>",
+            {"Refs": "#1", "Signed-off-by": "A U Thor <a@example.com>"},
+        ),
+        ("\n\nsome\nprose\nlines\nRefs: #1\n(cherry picked from commit abc123)", {"Refs": "#1"}),
+        ("\n\nsome\nmore\nprose\nlines\nlines\nlines\nlines\nSigned-off-by: A U Thor", {}),
+    ],
+)
+def test_parse_trailers(message, expected):
+    assert extractor.parse_trailers(message) == expected
+
+
+def test_parse_commit_log_trailers():
+    e = ReleaseNoteExtractor(Config(), mock.Mock())
+
+    change = e._parse_commit_log(
+        "short",
+        "hash",
+        "fix: Detail\n\nNot a BREAKING CHANGE mention.\n\nRefs #ABC-12\nAuthors: (edgy)\n",
+    )
+
+    assert change == Change(
+        "ABC-12",
+        "Detail",
+        "fix",
+        authors="(edgy)",
+        short_hash="short",
+        commit_hash="hash",
+    )
+
+
+@pytest.mark.parametrize(
+    ("log", "description"),
+    [
+        ("fix: Detail (scope)\nRefs: #1", "Detail"),
+        ("fix: Detail, more\nRefs: #1\n", "Detail, more"),
+        ("fix: Detail\nRefs: #1", "Detail"),
+    ],
+)
+def test_parse_commit_log_trailers_after_header(log, description):
+    change = extractor.parse_commit_log("short", "hash", log, {"fix": "Bug fixes"})
+
+    assert change.issue_ref == "1"
+    assert change.description == description
+
+
+def synthetic_logs(count):
+    messages = [
+        "fix: Detail about {i}\n\nRefs: #{i}\n",
+        "feat(api): Feature {i}\n\nSome details.\n\nAuthors: (edgy)\n",
+        "chore(deps): Bump dependency {i}",
+        "Merge branch {i}",
+        "fix!: Breaking {i}\n\nBREAKING CHANGE: removed\nRefs: #B{i}\n",
+    ]
+    return [(f"short{i}", f"hash{i}", messages[i % len(messages)].format(i=i)) for i in range(count)]
+
+
+@pytest.mark.parametrize("count", [0, 7, 2 * extractor.PARSE_CHUNK_SIZE + 3])
+def test_parallel_extraction_matches_serial(monkeypatch, count):
+    monkeypatch.setattr(extractor, "PARSE_CHUNK_SIZE", 5)
+    git = mock.Mock()
+    git.iter_logs.side_effect = lambda *_args, **_kwargs: iter(synthetic_logs(count))
+
+    serial = ReleaseNoteExtractor(Config(), git).extract("0.0.1")
+    parallel = ReleaseNoteExtractor(Config(parse_workers=2), git).extract("0.0.1")
+
+    assert parallel == serial
+    # Placeholder refs for changes without a Refs trailer follow the log position.
+    assert [list(changes) for changes in parallel.values()] == [list(changes) for changes in serial.values()]
+
+
+@pytest.mark.usefixtures("git_repo")
+def test_parallel_extraction_uses_cache(monkeypatch):
+    git = Git()
+    monkeypatch.setattr(git, "iter_logs", mock.Mock(side_effect=lambda *_a, **_kw: iter(synthetic_logs(20))))
+    monkeypatch.setattr(git, "unreachable_commits", mock.Mock(return_value=set()))
+    cfg = Config(parse_cache=True, parse_workers=2)
+
+    sections = ReleaseNoteExtractor(cfg, git).extract("0.0.1")
+
+    parse = mock.Mock()
+    monkeypatch.setattr(extractor, "parse_commit_logs", parse)
+    assert ReleaseNoteExtractor(cfg, git).extract("0.0.1") == sections
+    assert parse.call_count == 0
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="parallel parsing needs several cpus to win")  # noqa: PLR2004
+def test_parallel_extraction_benchmark():
+    """Find the range size from which parallel parsing beats serial parsing."""
+
+    def bench(logs, workers):
+        git = mock.Mock()
+        git.iter_logs.return_value = iter(logs)
+        start = time.perf_counter()
+        ReleaseNoteExtractor(Config(parse_workers=workers), git).extract("0.0.1")
+        return time.perf_counter() - start
+
+    timings = {}
+    for count in [1_000, 10_000, 50_000]:
+        logs = synthetic_logs(count)
+        timings[count] = (bench(logs, 0), bench(logs, 4))
+
+    # Process start up dominates small ranges, parsing dominates large ones.
+    assert timings[1_000][0] < timings[1_000][1]
+    assert timings[50_000][1] < timings[50_000][0]
+
+
+def test_extraction_trace_file(conventional_commits, tmp_path):
+    hashes = conventional_commits
+    trace = tmp_path / "trace.jsonl"
+    cfg = Config(trace_file=str(trace))
+
+    ReleaseNoteExtractor(cfg, Git()).extract("0.0.2")
+
+    records = [json.loads(line) for line in trace.read_text().splitlines()]
+    assert [record["commit_hash"] for record in records] == list(reversed(hashes))
+    assert {record["source"] for record in records} == {"parsed"}
+    assert records[0]["change"]["issue_ref"] == "2"
+    assert records[1]["change"] is None
+
+
+@pytest.mark.usefixtures("conventional_commits")
+def test_extraction_trace_logs_one_record_per_commit():
+    extractor.logger.setLevel(logging.DEBUG)
+    try:
+        with mock.patch.object(extractor.logger, "debug") as debug:
+            ReleaseNoteExtractor(Config(), Git()).extract("0.0.2")
+    finally:
+        extractor.logger.setLevel(logging.NOTSET)
+
+    assert debug.call_count == 6  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("conventional_commits")
+def test_extraction_trace_disabled(monkeypatch):
+    monkeypatch.setattr(extractor.CommitTrace, "__call__", mock.Mock(side_effect=AssertionError))
+
+    sections = ReleaseNoteExtractor(Config(), Git()).extract("0.0.2")
+
+    assert sorted(sections["Bug fixes"]) == ["1", "4"]
+
+
+@pytest.mark.parametrize(
+    ("tag", "version"),
+    [
+        ("v1.2.3", "1.2.3"),
+        ("1.2", "1.2"),
+        ("1.2.3rc1", "1.2.3rc1"),
+        ("v1.2.3-beta.1", "1.2.3-beta.1"),
+        ("1.2.3.dev4", "1.2.3.dev4"),
+        ("1.2.3.post1", "1.2.3.post1"),
+        ("1.2.3+local.1", "1.2.3+local.1"),
+        ("2024-release", None),
+        ("3rd-party-sync", None),
+        ("1foo", None),
+        ("1", None),
+        ("1.2.3-hotfix", None),
+        ("release-1.2.3", None),
+    ],
+)
+def test_version_tag(tag, version):
+    match = extractor.VERSION_TAG.match(tag)
+
+    assert (match[1] if match else None) == version
@@ -0,0 +1,204 @@
+import subprocess
+import time
+from unittest import mock
+
+import pytest
+
+from changelog_gen import errors, git_objects, vcs
+from changelog_gen.vcs import Git, NativeGit
+
+
+def commit(repo, message, filename="hello.txt"):
+    f = repo.workspace / filename
+    f.write_text(f"{f.read_text() if f.exists() else ''}{message}\n")
+    repo.run(f"git add {filename}")
+    repo.run(f"git commit -q -m '{message}'")
+
+
+@pytest.fixture()
+def history_repo(git_repo):
+    for i in range(5):
+        commit(git_repo, f"fix: initial {i}")
+    git_repo.run("git tag -a v0.0.1 -m 'Release 0.0.1'")
+
+    git_repo.run("git checkout -q -b feature")
+    for i in range(3):
+        commit(git_repo, f"feat: feature {i}", "feature.txt")
+    git_repo.run("git checkout -q master")
+    for i in range(3):
+        commit(git_repo, f"fix: master {i}\n\nWith a body.\n\nRefs: #{i}")
+    git_repo.run("git merge -q --no-ff feature -m 'Merge feature'")
+    git_repo.run("git tag 0.0.2")
+    commit(git_repo, "chore: after release")
+
+    return git_repo
+
+
+@pytest.mark.parametrize("tag", [None, "v0.0.1", "0.0.2"])
+@pytest.mark.parametrize("pack", [False, True])
+def test_native_logs_match_git(history_repo, tag, pack):
+    if pack:
+        history_repo.run("git gc -q")
+
+    assert NativeGit().get_logs(tag) == Git().get_logs(tag)
+
+
+@pytest.mark.parametrize("max_count", [None, 0, 3])
+@pytest.mark.parametrize("stop_at", [None, "HEAD~4"])
+def test_native_logs_bounded_match_git(history_repo, max_count, stop_at):
+    if stop_at:
+        stop_at = history_repo.run(f"git rev-parse {stop_at}", capture=True).strip()
+
+    assert NativeGit().get_logs(None, max_count=max_count, stop_at=stop_at) == Git().get_logs(
+        None,
+        max_count=max_count,
+        stop_at=stop_at,
+    )
+
+
+def test_native_logs_detached_head(history_repo):
+    history_repo.run("git checkout -q feature")
+
+    assert NativeGit().get_logs("v0.0.1") == Git().get_logs("v0.0.1")
+
+
+@pytest.mark.usefixtures("history_repo")
+def test_native_logs_no_subprocess(monkeypatch):
+    monkeypatch.setattr(vcs.subprocess, "Popen", mock.Mock(side_effect=AssertionError))
+    monkeypatch.setattr(vcs.subprocess, "check_output", mock.Mock(side_effect=AssertionError))
+
+    assert len(NativeGit().get_logs("v0.0.1")) == 8  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("history_repo")
+def test_native_logs_falls_back_to_git(monkeypatch):
+    monkeypatch.setattr(
+        git_objects.ObjectStore,
+        "resolve",
+        mock.Mock(side_effect=git_objects.UnsupportedRepositoryError("sha256")),
+    )
+
+    assert NativeGit().get_logs("v0.0.1") == Git().get_logs("v0.0.1")
+
+
+def test_native_logs_raises_on_corrupt_history(history_repo):
+    git = NativeGit()
+    logs = git.iter_logs(None)
+    next(logs)
+    parent = history_repo.run("git rev-parse HEAD~1", capture=True).strip()
+    (history_repo.workspace / ".git" / "objects" / parent[:2] / parent[2:]).unlink()
+
+    with pytest.raises(errors.VcsError):
+        list(logs)
+
+
+@pytest.mark.parametrize("clone_args", ["--shared", "--reference=source"])
+def test_native_logs_falls_back_for_alternates(history_repo, tmp_path, monkeypatch, clone_args):
+    source = history_repo.workspace
+    history_repo.run("git gc -q")
+    clone = tmp_path / "clone"
+    reference = clone_args.replace("source", str(source))
+    subprocess.check_call(["git", "clone", "-q", reference, str(source), str(clone)])  # noqa: S603, S607
+    monkeypatch.chdir(clone)
+
+    with pytest.raises(git_objects.UnsupportedRepositoryError):
+        git_objects.ObjectStore(Git().get_git_dir())
+    assert NativeGit().get_logs(None) == Git().get_logs(None)
+
+
+@pytest.mark.parametrize("damage", ["missing", "empty"])
+def test_unreadable_pack_unsupported(history_repo, damage):
+    history_repo.run("git gc -q")
+    parent = history_repo.run("git rev-parse HEAD~1", capture=True).strip()
+    git_dir = Git().get_git_dir()
+    (pack,) = (git_dir / "objects" / "pack").glob("*.pack")
+    if damage == "missing":
+        pack.unlink()
+    else:
+        pack.write_bytes(b"")
+
+    with git_objects.ObjectStore(git_dir) as store, pytest.raises(git_objects.UnsupportedRepositoryError):
+        store.read(parent)
+
+
+def test_read_deltified_objects(git_repo):
+    content = "".join(f"line {i}\n" for i in range(2000))
+    f = git_repo.workspace / "large.txt"
+    for i in range(5):
+        f.write_text(content + f"change {i}\n")
+        git_repo.run("git add large.txt")
+        git_repo.run(f"git commit -q -m 'change {i}'")
+    git_repo.run("git gc -q --aggressive")
+
+    blobs = git_repo.run("git rev-list --objects --all", capture=True)
+    with git_objects.ObjectStore(Git().get_git_dir()) as store:
+        for line in blobs.splitlines():
+            sha, _, path = line.partition(" ")
+            if path != "large.txt":
+                continue
+            object_type, data = store.read(sha)
+            assert object_type == b"blob"
+            assert data == subprocess.check_output(["git", "cat-file", "blob", sha])  # noqa: S603, S607
+
+
+def test_read_missing_object(git_repo):
+    commit(git_repo, "initial")
+
+    with git_objects.ObjectStore(Git().get_git_dir()) as store, pytest.raises(git_objects.ObjectNotFoundError):
+        store.read("0" * 40)
+
+
+def test_find_git_dir(history_repo):
+    nested = history_repo.workspace / "nested"
+    nested.mkdir()
+
+    assert git_objects.find_git_dir(nested) == history_repo.workspace / ".git"
+
+
+def test_find_git_dir_not_a_repository(tmp_path):
+    with pytest.raises(git_objects.UnsupportedRepositoryError):
+        git_objects.find_git_dir(tmp_path)
+
+
+def test_parse_commit():
+    data = (
+        b"tree 1111\n"
+        b"parent 2222\n"
+        b"parent 3333\n"
+        b"author A U Thor <a@example.com> 1700000000 +0000\n"
+        b"committer C O Mitter <c@example.com> 1700000100 +0100\n"
+        b"\n"
+        b"feat: Subject\n\nBody\n"
+    )
+
+    assert git_objects.parse_commit("4444", data) == git_objects.Commit(
+        sha="4444",
+        parents=["2222", "3333"],
+        timestamp=1700000100,
+        message="feat: Subject\n\nBody\n",
+    )
+
+
+def test_apply_delta():
+    base = b"hello world"
+    # source size 11, target size 12, copy 6 bytes from offset 0, insert "there!"
+    delta = bytes([11, 12, 0x80 | 0x10, 6, 6]) + b"there!"
+
+    assert git_objects.apply_delta(base, delta) == b"hello there!"
+
+
+def test_native_logs_benchmark(git_repo):
+    for i in range(100):
+        commit(git_repo, f"fix: change {i}")
+    git_repo.run("git tag v0.0.1")
+    for i in range(20):
+        commit(git_repo, f"fix: change after {i}")
+
+    def bench(git_cls):
+        start = time.perf_counter()
+        for _ in range(10):
+            git_cls().get_logs("v0.0.1")
+        return time.perf_counter() - start
+
+    # No fork/exec of git for status, rev-parse or log.
+    assert bench(NativeGit) < bench(Git)
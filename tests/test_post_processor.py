@@ -1,4 +1,10 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 
 import httpx
@@ -25,7 +31,7 @@ class TestMakeClient:
         monkeypatch.setenv("MY_API_AUTH", "fake_auth@domain:hex_api_key")
         cfg = PostProcessConfig(auth_env="MY_API_AUTH", headers={"content-type": "application/json"})
 
-        client = post_processor.make_client(cfg)
+        client = post_processor.make_async_client(cfg)
 
         assert client.headers["content-type"] == "application/json"
         assert client.auth._auth_header == "Basic ZmFrZV9hdXRoQGRvbWFpbjpoZXhfYXBpX2tleQ=="
@@ -34,15 +40,16 @@ class TestMakeClient:
         monkeypatch.setenv("AUTH_TOKEN", "hex_api_key")
         cfg = PostProcessConfig(auth_env="AUTH_TOKEN", headers={"content-type": "application/json"}, auth_type="bearer")
 
-        client = post_processor.make_client(cfg)
+        client = post_processor.make_async_client(cfg)
 
+        assert isinstance(client, httpx.AsyncClient)
         assert client.headers["content-type"] == "application/json"
         assert client.auth.token == "Bearer hex_api_key"
 
     def test_create_client_without_auth_token(self):
         cfg = PostProcessConfig(headers={"content-type": "application/json"})
 
-        client = post_processor.make_client(cfg)
+        client = post_processor.make_async_client(cfg)
 
         assert client.headers["content-type"] == "application/json"
         assert client.auth is None
@@ -57,7 +64,7 @@ class TestMakeClient:
         cfg = PostProcessConfig(auth_env="MY_API_AUTH")
 
         with pytest.raises(typer.Exit):
-            post_processor.make_client(cfg)
+            post_processor.make_async_client(cfg)
 
         assert post_processor.logger.error.call_args == mock.call(
             'Missing environment variable "%s"',
@@ -82,7 +89,7 @@ class TestMakeClient:
         cfg = PostProcessConfig(auth_env="MY_API_AUTH")
 
         with pytest.raises(typer.Exit):
-            post_processor.make_client(cfg)
+            post_processor.make_async_client(cfg)
 
         assert post_processor.logger.error.call_args == mock.call(
             "Unexpected content in %s, need '{username}:{api_key}' for basic auth",
@@ -102,8 +109,8 @@ class TestPerIssuePostPrequest:
     def test_one_client_regardless_of_issue_count(self, monkeypatch, httpx_mock, cfg_verb, issue_refs):
         monkeypatch.setattr(
             post_processor,
-            "make_client",
-            mock.Mock(return_value=httpx.Client()),
+            "make_async_client",
+            mock.Mock(return_value=httpx.AsyncClient()),
         )
         cfg = PostProcessConfig(
             verb=cfg_verb,
@@ -118,7 +125,7 @@ class TestPerIssuePostPrequest:
 
         post_processor.per_issue_post_process(cfg, issue_refs, "1.0.0")
 
-        assert post_processor.make_client.call_args_list == [
+        assert post_processor.make_async_client.call_args_list == [
             mock.call(cfg),
         ]
 
@@ -264,3 +271,336 @@ class TestPerIssuePostPrequest:
         )
 
         assert post_processor.logger.warning.call_args_list == []
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    delay = 0.05
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.delay)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *_args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    # Default backlog of 5 drops concurrent connections, forcing 1s SYN retries.
+    request_queue_size = 64
+
+
+@pytest.fixture()
+def stub_server():
+    server = StubServer(("127.0.0.1", 0), SlowHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestConcurrency:
+    def _timed_post_process(self, url, max_concurrency, issue_refs):
+        cfg = PostProcessConfig(url=f"{url}/issues/::issue_ref::", max_concurrency=max_concurrency)
+        start = time.perf_counter()
+        post_processor.per_issue_post_process(cfg, issue_refs, "1.0.0")
+        return time.perf_counter() - start
+
+    def test_wall_time_scales_with_concurrency(self, stub_server):
+        issue_refs = [str(i) for i in range(20)]
+
+        sequential = self._timed_post_process(stub_server, 1, issue_refs)
+        concurrent = self._timed_post_process(stub_server, 10, issue_refs)
+
+        # 20 requests at 50ms each, ~1s sequentially vs ~0.1s with 10 in flight.
+        assert sequential >= len(issue_refs) * SlowHandler.delay
+        assert concurrent < sequential / 3
+
+    def test_concurrent_requests_logged_per_issue(self, stub_server, monkeypatch):
+        monkeypatch.setattr(post_processor, "logger", mock.Mock())
+        issue_refs = [str(i) for i in range(5)]
+
+        self._timed_post_process(stub_server, 5, issue_refs)
+
+        calls = post_processor.logger.info.call_args_list
+        assert len(calls) == 2 * len(issue_refs)
+        for request, response in zip(calls[::2], calls[1::2]):
+            assert request.args[0] == "  Request: %s %s"
+            assert response == mock.call("    Response: %s", "OK")
+        assert sorted(c.args[2].rsplit("/", 1)[1] for c in calls[::2]) == issue_refs
+
+
+class TestRetries:
+    url = "https://my-api.github.com/comments/1"
+
+    @pytest.fixture(autouse=True)
+    def _logger(self, monkeypatch):
+        monkeypatch.setattr(post_processor, "logger", mock.Mock())
+
+    @pytest.mark.parametrize(
+        "status_code",
+        [
+            HTTPStatus.TOO_MANY_REQUESTS,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        ],
+    )
+    def test_retryable_status_retried(self, httpx_mock, status_code):
+        httpx_mock.add_response(method="POST", url=self.url, status_code=status_code)
+        httpx_mock.add_response(method="POST", url=self.url, status_code=HTTPStatus.OK)
+        cfg = PostProcessConfig(url="https://my-api.github.com/comments/::issue_ref::", retries=2, backoff_factor=0)
+
+        post_processor.per_issue_post_process(cfg, ["1"], "1.0.0")
+
+        assert len(httpx_mock.get_requests()) == 2  # noqa: PLR2004
+        assert post_processor.logger.error.call_args_list == []
+        assert post_processor.logger.info.call_args_list[-1] == mock.call("    Response: %s", "OK")
+
+    def test_retries_exhausted_reports_failure(self, httpx_mock):
+        httpx_mock.add_response(method="POST", url=self.url, status_code=HTTPStatus.SERVICE_UNAVAILABLE, text="down")
+        cfg = PostProcessConfig(url="https://my-api.github.com/comments/::issue_ref::", retries=2, backoff_factor=0)
+
+        post_processor.per_issue_post_process(cfg, ["1"], "1.0.0")
+
+        assert len(httpx_mock.get_requests()) == 3  # noqa: PLR2004
+        assert post_processor.logger.error.call_args_list == [mock.call("Post process request failed.")]
+        assert post_processor.logger.warning.call_args_list[-1] == mock.call("  %s", "down")
+
+    def test_client_errors_not_retried(self, httpx_mock):
+        httpx_mock.add_response(method="POST", url=self.url, status_code=HTTPStatus.NOT_FOUND)
+        cfg = PostProcessConfig(url="https://my-api.github.com/comments/::issue_ref::", retries=2, backoff_factor=0)
+
+        post_processor.per_issue_post_process(cfg, ["1"], "1.0.0")
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_transport_error_retried(self, httpx_mock):
+        httpx_mock.add_exception(httpx.ConnectError("Connection refused"), method="POST", url=self.url)
+        httpx_mock.add_response(method="POST", url=self.url, status_code=HTTPStatus.OK)
+        cfg = PostProcessConfig(url="https://my-api.github.com/comments/::issue_ref::", retries=1, backoff_factor=0)
+
+        post_processor.per_issue_post_process(cfg, ["1"], "1.0.0")
+
+        assert len(httpx_mock.get_requests()) == 2  # noqa: PLR2004
+
+    def test_transport_error_raised_when_retries_exhausted(self, httpx_mock):
+        httpx_mock.add_exception(httpx.ConnectError("Connection refused"), method="POST", url=self.url)
+        cfg = PostProcessConfig(url="https://my-api.github.com/comments/::issue_ref::")
+
+        with pytest.raises(httpx.ConnectError):
+            post_processor.per_issue_post_process(cfg, ["1"], "1.0.0")
+
+    def test_retry_after_honoured(self, httpx_mock, monkeypatch):
+        sleep = mock.AsyncMock()
+        monkeypatch.setattr(post_processor.asyncio, "sleep", sleep)
+        httpx_mock.add_response(
+            method="POST",
+            url=self.url,
+            status_code=HTTPStatus.TOO_MANY_REQUESTS,
+            headers={"Retry-After": "3"},
+        )
+        httpx_mock.add_response(method="POST", url=self.url, status_code=HTTPStatus.OK)
+        cfg = PostProcessConfig(url="https://my-api.github.com/comments/::issue_ref::", retries=1)
+
+        post_processor.per_issue_post_process(cfg, ["1"], "1.0.0")
+
+        assert sleep.call_args_list == [mock.call(3.0)]
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, None),
+        ({"Retry-After": "5"}, 5.0),
+        ({"Retry-After": "-5"}, 0),
+        ({"Retry-After": "not a date"}, None),
+        ({"Retry-After": format_datetime(datetime(2000, 1, 1, tzinfo=timezone.utc), usegmt=True)}, 0),
+    ],
+)
+def test_retry_after(headers, expected):
+    assert post_processor.retry_after(httpx.Response(HTTPStatus.TOO_MANY_REQUESTS, headers=headers)) == expected
+
+
+def test_retry_after_http_date():
+    when = datetime.now(timezone.utc) + timedelta(seconds=60)
+    r = httpx.Response(HTTPStatus.TOO_MANY_REQUESTS, headers={"Retry-After": format_datetime(when, usegmt=True)})
+
+    assert 55 < post_processor.retry_after(r) <= 60  # noqa: PLR2004
+
+
+def test_retry_after_http_date_unknown_zone():
+    when = datetime.now(timezone.utc) + timedelta(seconds=60)
+    value = format_datetime(when.replace(tzinfo=None))
+    assert value.endswith("-0000")
+    r = httpx.Response(HTTPStatus.TOO_MANY_REQUESTS, headers={"Retry-After": value})
+
+    assert 55 < post_processor.retry_after(r) <= 60  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("attempt", "upper"),
+    [
+        (0, 0.5),
+        (1, 1.0),
+        (3, 4.0),
+        (10, 30.0),
+    ],
+)
+def test_backoff_bounds(monkeypatch, attempt, upper):
+    uniform = mock.Mock(return_value=0.1)
+    monkeypatch.setattr(post_processor.random, "uniform", uniform)
+
+    assert post_processor.backoff(PostProcessConfig(), attempt) == 0.1  # noqa: PLR2004
+    assert uniform.call_args == mock.call(0, upper)
+
+
+def test_token_bucket_limits_rate():
+    async def acquire_all(bucket, count):
+        for _ in range(count):
+            await bucket.acquire()
+
+    bucket = post_processor.TokenBucket(rate=50, capacity=1)
+    start = time.perf_counter()
+    asyncio.run(acquire_all(bucket, 11))
+
+    # First token is available immediately, remaining 10 at 50/s.
+    assert time.perf_counter() - start >= 0.18  # noqa: PLR2004
+
+
+class TestJournal:
+    @pytest.fixture()
+    def journal(self, tmp_path):
+        return post_processor.Journal(tmp_path / "changelog_gen" / "post_process.jsonl")
+
+    def test_empty_journal(self, journal):
+        assert journal.completed("1.0.0") == set()
+        assert journal.outstanding("1.0.0") == []
+
+    def test_outstanding_and_completed(self, journal):
+        journal.plan("1.0.0", ["1", "2", "3"])
+        journal.plan("0.9.0", ["4"])
+        journal.record("1.0.0", "2", "https://my-api/2")
+        journal.record("0.9.0", "4", "https://my-api/4")
+
+        assert journal.completed("1.0.0") == {("2", "https://my-api/2")}
+        assert journal.outstanding("1.0.0") == ["1", "3"]
+        assert journal.outstanding("0.9.0") == []
+
+    def test_truncated_lines_ignored(self, journal):
+        journal.plan("1.0.0", ["1", "2"])
+        with journal.path.open("a") as f:
+            f.write('{"event": "done", "vers')
+
+        assert journal.outstanding("1.0.0") == ["1", "2"]
+
+    def test_successful_requests_recorded(self, journal, httpx_mock):
+        cfg = PostProcessConfig(url="https://my-api.github.com/comments/::issue_ref::")
+        httpx_mock.add_response(method="POST", url=cfg.url.replace("::issue_ref::", "1"), status_code=HTTPStatus.OK)
+        httpx_mock.add_response(
+            method="POST",
+            url=cfg.url.replace("::issue_ref::", "2"),
+            status_code=HTTPStatus.NOT_FOUND,
+        )
+
+        post_processor.per_issue_post_process(cfg, ["1", "2"], "1.0.0", journal=journal)
+
+        assert journal.completed("1.0.0") == {("1", "https://my-api.github.com/comments/1")}
+        assert journal.outstanding("1.0.0") == ["2"]
+
+    def test_completed_requests_skipped(self, journal, httpx_mock):
+        cfg = PostProcessConfig(url="https://my-api.github.com/comments/::issue_ref::")
+        journal.record("1.0.0", "1", "https://my-api.github.com/comments/1")
+        httpx_mock.add_response(method="POST", url=cfg.url.replace("::issue_ref::", "2"), status_code=HTTPStatus.OK)
+
+        post_processor.per_issue_post_process(cfg, ["1", "2"], "1.0.0", journal=journal)
+
+        assert [str(r.url) for r in httpx_mock.get_requests()] == ["https://my-api.github.com/comments/2"]
+        assert journal.outstanding("1.0.0") == []
+
+    def test_dry_run_not_recorded(self, journal):
+        cfg = PostProcessConfig(url="https://my-api.github.com/comments/::issue_ref::")
+
+        post_processor.per_issue_post_process(cfg, ["1"], "1.0.0", dry_run=True, journal=journal)
+
+        assert not journal.path.exists()
+
+
+class TestBatchPostProcess:
+    def test_batches_issue_refs(self, httpx_mock):
+        cfg = PostProcessConfig(
+            url="https://my-api.github.com/release/::version::",
+            body='{"issues": ::issue_refs::}',
+            batch=True,
+            batch_size=2,
+        )
+        httpx_mock.add_response(method="POST", url="https://my-api.github.com/release/1.0.0")
+
+        post_processor.batch_post_process(cfg, ["1", "2", "3", "4", "5"], "1.0.0")
+
+        assert sorted(r.content for r in httpx_mock.get_requests()) == [
+            b'{"issues": ["1", "2"]}',
+            b'{"issues": ["3", "4"]}',
+            b'{"issues": ["5"]}',
+        ]
+
+    def test_issue_refs_in_url(self, httpx_mock):
+        cfg = PostProcessConfig(url="https://my-api.github.com/release?issues=::issue_refs::", batch=True)
+        httpx_mock.add_response(method="POST", url="https://my-api.github.com/release?issues=1,2,3")
+
+        post_processor.batch_post_process(cfg, ["1", "2", "3"], "1.0.0")
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_uses_client_auth(self, httpx_mock, monkeypatch):
+        monkeypatch.setenv("AUTH_TOKEN", "hex_api_key")
+        cfg = PostProcessConfig(
+            url="https://my-api.github.com/release",
+            batch=True,
+            auth_env="AUTH_TOKEN",
+            auth_type="bearer",
+        )
+        httpx_mock.add_response(method="POST", url=cfg.url, match_headers={"Authorization": "Bearer hex_api_key"})
+
+        post_processor.batch_post_process(cfg, ["1", "2"], "1.0.0")
+
+    def test_dry_run(self, monkeypatch):
+        monkeypatch.setattr(post_processor, "logger", mock.Mock())
+        cfg = PostProcessConfig(
+            url="https://my-api.github.com/release",
+            body='{"issues": ::issue_refs::, "version": "::version::"}',
+            batch=True,
+            batch_size=2,
+        )
+
+        post_processor.batch_post_process(cfg, ["1", "2", "3"], "1.0.0", dry_run=True)
+
+        assert post_processor.logger.warning.call_args_list == [
+            mock.call("Post processing (batch):"),
+            mock.call("  Would request: %s %s %s", "POST", cfg.url, '{"issues": ["1", "2"], "version": "1.0.0"}'),
+            mock.call("  Would request: %s %s %s", "POST", cfg.url, '{"issues": ["3"], "version": "1.0.0"}'),
+        ]
+
+    def test_journal_records_and_skips(self, httpx_mock, tmp_path):
+        journal = post_processor.Journal(tmp_path / "post_process.jsonl")
+        journal.record("1.0.0", "1", "https://my-api.github.com/release")
+        cfg = PostProcessConfig(url="https://my-api.github.com/release", body="::issue_refs::", batch=True)
+        httpx_mock.add_response(method="POST", url=cfg.url)
+
+        post_processor.batch_post_process(cfg, ["1", "2", "3"], "1.0.0", journal=journal)
+
+        assert [r.content for r in httpx_mock.get_requests()] == [b'["2", "3"]']
+        assert journal.outstanding("1.0.0") == []
+
+    def test_no_url_ignored(self, monkeypatch):
+        monkeypatch.setattr(post_processor, "logger", mock.Mock())
+
+        post_processor.batch_post_process(PostProcessConfig(batch=True), ["1"], "1.0.0")
+
+        assert post_processor.logger.warning.call_args_list == []
@@ -0,0 +1,77 @@
+import json
+import subprocess
+
+import pytest
+
+from changelog_gen.profiler import Profiler
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+
+    with profiler.span("phase"):
+        pass
+
+    assert profiler.spans == []
+
+
+def test_span_records_duration():
+    profiler = Profiler(enabled=True)
+
+    with profiler.span("first"):
+        pass
+    with profiler.span("second"):
+        pass
+
+    assert [span.name for span in profiler.spans] == ["first", "second"]
+    assert all(span.duration >= 0 for span in profiler.spans)
+    assert profiler.spans[0].start <= profiler.spans[1].start
+
+
+def test_span_counts_subprocesses():
+    profiler = Profiler(enabled=True)
+
+    with profiler.span("git"):
+        subprocess.run(["git", "--version"], check=True, capture_output=True)  # noqa: S603, S607
+        subprocess.run(["git", "--version"], check=True, capture_output=True)  # noqa: S603, S607
+    subprocess.run(["git", "--version"], check=True, capture_output=True)  # noqa: S603, S607
+    with profiler.span("none"):
+        pass
+
+    assert [span.subprocesses for span in profiler.spans] == [2, 0]
+
+
+def test_span_records_on_error():
+    profiler = Profiler(enabled=True)
+
+    with pytest.raises(ValueError), profiler.span("failing"):  # noqa: PT011
+        raise ValueError
+
+    assert [span.name for span in profiler.spans] == ["failing"]
+
+
+def test_table():
+    profiler = Profiler(enabled=True)
+
+    with profiler.span("extract"):
+        pass
+
+    lines = profiler.table().splitlines()
+    assert lines[0].split() == ["phase", "wall", "(ms)", "subprocesses"]
+    assert lines[1].split()[0] == "extract"
+    assert lines[2].split()[0] == "total"
+
+
+def test_write_json(tmp_path):
+    profiler = Profiler(enabled=True)
+
+    with profiler.span("extract"):
+        pass
+
+    path = tmp_path / "trace.json"
+    profiler.write_json(path, "1.2.3")
+
+    data = json.loads(path.read_text())
+    assert data["version"] == "1.2.3"
+    assert data["spans"][0]["name"] == "extract"
+    assert data["spans"][0]["subprocesses"] == 0
@@ -1,9 +1,12 @@
+import asyncio
 import subprocess
+import time
+from collections.abc import Iterator
 from unittest import mock
 
 import pytest
 
-from changelog_gen import errors
+from changelog_gen import errors, vcs
 from changelog_gen.vcs import Git
 
 
@@ -76,17 +79,140 @@ def test_get_current_info_dirty(multiversion_repo):
     assert info["dirty"] is True
 
 
+def test_get_current_info_untracked(multiversion_repo):
+    path = multiversion_repo.workspace
+    f = path / "untracked.txt"
+
+    f.write_text("untracked")
+
+    assert Git().get_current_info()["dirty"] is True
+    assert Git().get_current_info(untracked_files="no")["dirty"] is False
+
+
+def test_get_current_info_detached(multiversion_repo):
+    multiversion_repo.run("git checkout -q 0.0.1")
+
+    info = Git().get_current_info()
+
+    assert info["branch"] == "HEAD"
+
+
+def test_get_current_info_ahead_behind(multiversion_repo):
+    multiversion_repo.run("git branch -q upstream 0.0.1")
+    multiversion_repo.run("git branch -q --set-upstream-to=upstream")
+
+    info = Git().get_current_info()
+
+    assert info["ahead"] == 1
+    assert info["behind"] == 0
+
+
+@pytest.mark.usefixtures("multiversion_repo")
+def test_get_current_info_no_upstream():
+    info = Git().get_current_info()
+
+    assert info["ahead"] == 0
+    assert info["behind"] == 0
+
+
+@pytest.mark.usefixtures("multiversion_repo")
+def test_get_current_info_single_call(monkeypatch):
+    monkeypatch.setattr(vcs.subprocess, "check_output", mock.Mock(wraps=vcs.subprocess.check_output))
+
+    Git().get_current_info()
+
+    assert vcs.subprocess.check_output.call_count == 1
+
+
+def test_get_current_info_async(multiversion_repo):
+    path = multiversion_repo.workspace
+    f = path / "hello.txt"
+    f.write_text("hello world! v3")
+
+    git = Git()
+
+    assert asyncio.run(git.get_current_info_async()) == git.get_current_info()
+
+
+@pytest.mark.usefixtures("cwd")
+def test_get_current_info_async_raises_if_status_fails():
+    with pytest.raises(errors.VcsError, match="Unable to get current git status: fatal: not a git repository"):
+        asyncio.run(Git().get_current_info_async())
+
+
+@pytest.mark.usefixtures("multiversion_repo")
+def test_tag_index_async():
+    git = Git()
+
+    index = asyncio.run(git.tag_index_async())
+
+    assert git.tag_index() is index
+    assert index.find("0.0.2").name == "0.0.2"
+
+
 @pytest.mark.usefixtures("git_repo")
-def test_get_current_info_raises_if_rev_parse_fails(monkeypatch):
+def test_get_current_info_raises_if_status_fails(monkeypatch):
     monkeypatch.setattr(
         subprocess,
         "check_output",
-        mock.Mock(side_effect=[b"", subprocess.CalledProcessError(returncode=1, cmd="")]),
+        mock.Mock(side_effect=subprocess.CalledProcessError(returncode=1, cmd="")),
     )
     with pytest.raises(errors.VcsError) as ex:
         Git().get_current_info()
 
-    assert str(ex.value) == "Unable to get current git branch."
+    assert str(ex.value) == "Unable to get current git status."
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [
+        (
+            "# branch.oid abc\x00# branch.head main\x00",
+            {"dirty": False, "branch": "main", "ahead": 0, "behind": 0},
+        ),
+        (
+            "# branch.oid abc\x00# branch.head main\x00# branch.upstream origin/main\x00# branch.ab +2 -3\x00",
+            {"dirty": False, "branch": "main", "ahead": 2, "behind": 3},
+        ),
+        (
+            "# branch.oid (initial)\x00# branch.head (detached)\x00",
+            {"dirty": False, "branch": "HEAD", "ahead": 0, "behind": 0},
+        ),
+        (
+            "# branch.head main\x001 .M N... 100644 100644 100644 abc abc hello.txt\x00",
+            {"dirty": True, "branch": "main", "ahead": 0, "behind": 0},
+        ),
+        (
+            "# branch.head main\x00? untracked.txt\x00",
+            {"dirty": True, "branch": "main", "ahead": 0, "behind": 0},
+        ),
+        (
+            "# branch.head main\x00! ignored.txt\x00",
+            {"dirty": False, "branch": "main", "ahead": 0, "behind": 0},
+        ),
+    ],
+)
+def test_parse_status(status, expected):
+    assert vcs.parse_status(status) == expected
+
+
+def test_get_git_dir(multiversion_repo):
+    assert Git().get_git_dir() == multiversion_repo.workspace / ".git"
+
+
+def test_unreachable_commits(multiversion_repo):
+    reachable = str(multiversion_repo.api.head.commit)
+    multiversion_repo.run("git checkout -q -b side")
+    multiversion_repo.api.index.commit("side commit")
+    unreachable = str(multiversion_repo.api.head.commit)
+    multiversion_repo.run("git checkout -q master")
+
+    assert Git().unreachable_commits([reachable, unreachable, "0" * 40]) == {unreachable}
+
+
+@pytest.mark.usefixtures("multiversion_repo")
+def test_unreachable_commits_empty():
+    assert Git().unreachable_commits([]) == set()
 
 
 @pytest.mark.usefixtures("multiversion_repo")
@@ -110,6 +236,132 @@ def test_get_find_tag_vtag():
     assert tag == "v0.0.2"
 
 
+def test_get_find_tag_multiple_matches(multiversion_repo):
+    multiversion_repo.api.create_tag("10.0.2")
+
+    assert Git().find_tag("0.0.2") == "0.0.2"
+    assert Git().find_tag("10.0.2") == "10.0.2"
+
+
+def test_get_find_tag_prefers_exact_match(multiversion_repo):
+    multiversion_repo.api.create_tag("v0.0.2")
+
+    assert Git().find_tag("0.0.2") == "0.0.2"
+
+
+def test_get_find_tag_custom_prefix(multiversion_repo):
+    multiversion_repo.api.create_tag("release-0.0.3")
+    multiversion_repo.api.create_tag("pkg-10.0.4")
+    multiversion_repo.api.create_tag("1.0.0.4")
+
+    assert Git().find_tag("0.0.3") == "release-0.0.3"
+    assert Git().find_tag("0.0.4") is None
+    assert Git().find_tag("0.0.2") == "0.0.2"
+
+
+@pytest.mark.usefixtures("multiversion_repo")
+def test_find_tag_reuses_index(monkeypatch):
+    monkeypatch.setattr(vcs.subprocess, "check_output", mock.Mock(wraps=vcs.subprocess.check_output))
+    git = Git()
+
+    assert git.find_tag("0.0.1") == "0.0.1"
+    assert git.find_tag("0.0.2") == "0.0.2"
+
+    # Only `git rev-parse --absolute-git-dir`, tags are read from the ref files.
+    assert vcs.subprocess.check_output.call_count == 1
+
+
+def tag_commits(repo):
+    output = repo.run(
+        "git for-each-ref --format='%(refname:strip=2) %(*objectname) %(objectname)' refs/tags",
+        capture=True,
+    )
+    return {
+        name: peeled or object_name for name, peeled, object_name in (line.split(" ") for line in output.splitlines())
+    }
+
+
+def test_tag_index_loose_refs(multiversion_repo):
+    multiversion_repo.run("git tag -a v0.0.3 -m 'annotated'")
+
+    index = vcs.TagIndex.build(Git().get_git_dir())
+
+    assert {name: tag.commit for name, tag in index.tags.items()} == tag_commits(multiversion_repo)
+    assert index.find("0.0.3") == vcs.Tag("v0.0.3", str(multiversion_repo.api.head.commit))
+
+
+def test_tag_index_packed_refs(multiversion_repo):
+    multiversion_repo.run("git tag -a v0.0.3 -m 'annotated'")
+    multiversion_repo.run("git pack-refs --all")
+
+    index = vcs.TagIndex.build(Git().get_git_dir())
+
+    assert not (multiversion_repo.workspace / ".git" / "refs" / "tags" / "v0.0.3").exists()
+    assert {name: tag.commit for name, tag in index.tags.items()} == tag_commits(multiversion_repo)
+
+
+def test_tag_index_reads_packed_objects(multiversion_repo, monkeypatch):
+    multiversion_repo.run("git tag -a v0.0.3 -m 'annotated'")
+    # Pack objects but leave refs loose, tag objects are read from the pack.
+    multiversion_repo.run("git repack -adq")
+    monkeypatch.setattr(vcs.TagIndex, "from_git", mock.Mock(wraps=vcs.TagIndex.from_git))
+
+    index = vcs.TagIndex.build(Git().get_git_dir())
+
+    assert vcs.TagIndex.from_git.call_count == 0
+    assert {name: tag.commit for name, tag in index.tags.items()} == tag_commits(multiversion_repo)
+
+
+def test_tag_index_falls_back_to_git(multiversion_repo, monkeypatch):
+    multiversion_repo.run("git tag -a v0.0.3 -m 'annotated'")
+    multiversion_repo.run("git pack-refs --all")
+    # Strip the peeled trait, annotated tags can't be resolved from packed-refs.
+    packed_refs = multiversion_repo.workspace / ".git" / "packed-refs"
+    packed_refs.write_text("".join(packed_refs.read_text().splitlines(keepends=True)[1:]))
+    monkeypatch.setattr(vcs.TagIndex, "from_git", mock.Mock(wraps=vcs.TagIndex.from_git))
+
+    index = vcs.TagIndex.build(Git().get_git_dir())
+
+    assert vcs.TagIndex.from_git.call_count == 1
+    assert {name: tag.commit for name, tag in index.tags.items()} == tag_commits(multiversion_repo)
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("", {}),
+        (
+            "# pack-refs with: peeled fully-peeled sorted \n"
+            "1111 refs/heads/main\n"
+            "2222 refs/tags/0.0.1\n"
+            "3333 refs/tags/v0.0.2\n"
+            "^4444\n",
+            {"0.0.1": "2222", "v0.0.2": "4444"},
+        ),
+    ],
+)
+def test_parse_packed_refs(content, expected):
+    assert vcs._parse_packed_refs(content) == expected
+
+
+def test_parse_packed_refs_unpeeled():
+    with pytest.raises(vcs.UnresolvedRefError):
+        vcs._parse_packed_refs("2222 refs/tags/0.0.1\n")
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("0.0.1", "0.0.1"),
+        ("v0.0.1", "0.0.1"),
+        ("v1.2.3rc0", "1.2.3rc0"),
+        ("version", "version"),
+    ],
+)
+def test_normalize_tag(name, expected):
+    assert vcs.normalize_tag(name) == expected
+
+
 def test_add_path_stages_changes_for_commit(multiversion_repo):
     path = multiversion_repo.workspace
     f = path / "hello.txt"
@@ -198,9 +450,9 @@ Formatted
 
     logs = Git().get_logs("0.0.2")
     assert logs == [
-        [hash3[:7], hash3, "Commit message 3\n\nFormatted\n"],
-        [hash2[:7], hash2, "commit log 2: electric boogaloo"],
-        [hash1[:7], hash1, "commit log"],
+        (hash3[:7], hash3, "Commit message 3\n\nFormatted\n"),
+        (hash2[:7], hash2, "commit log 2: electric boogaloo"),
+        (hash1[:7], hash1, "commit log"),
     ]
 
 
@@ -213,6 +465,260 @@ def test_get_logs_no_tag():
     ]
 
 
+def test_iter_logs_streams_records_across_chunks(multiversion_repo, monkeypatch):
+    monkeypatch.setattr(vcs, "LOG_CHUNK_SIZE", 8)
+    path = multiversion_repo.workspace
+    f = path / "hello.txt"
+    f.write_text("hello world! v3")
+    multiversion_repo.run("git add hello.txt")
+    multiversion_repo.api.index.commit("A much longer commit message\n\nWith: a body")
+    hash1 = str(multiversion_repo.api.head.commit)
+
+    logs = Git().iter_logs("0.0.1")
+
+    assert isinstance(logs, Iterator)
+    assert list(logs) == [
+        (hash1[:7], hash1, "A much longer commit message\n\nWith: a body"),
+        (mock.ANY, mock.ANY, "update"),
+    ]
+
+
+@pytest.fixture()
+def long_history_repo(multiversion_repo):
+    f = multiversion_repo.workspace / "CHANGELOG.md"
+    f.write_text("# Changelog\n")
+    multiversion_repo.run("git add CHANGELOG.md")
+    multiversion_repo.run("git commit -q -m 'Update CHANGELOG'")
+    changelog_commit = multiversion_repo.run("git rev-parse HEAD", capture=True).strip()
+
+    for i in range(5):
+        multiversion_repo.run(f"git commit -q --allow-empty -m 'change {i}'")
+
+    return changelog_commit
+
+
+@pytest.mark.usefixtures("long_history_repo")
+def test_iter_logs_max_count():
+    assert [log[2] for log in Git().iter_logs(None, max_count=2)] == ["change 4\n", "change 3\n"]
+
+
+@pytest.mark.usefixtures("long_history_repo")
+def test_iter_logs_since():
+    # Test repository commits are all authored and committed now.
+    assert len(Git().get_logs(None, since="1 day ago")) == 8  # noqa: PLR2004
+    assert Git().get_logs(None, since="2099-01-01") == []
+
+
+def test_iter_logs_stop_at(long_history_repo):
+    logs = Git().get_logs(None, stop_at=long_history_repo)
+
+    assert [log[2] for log in logs] == [f"change {i}\n" for i in reversed(range(5))]
+
+
+def test_last_commit(long_history_repo):
+    assert Git().last_commit("CHANGELOG.*") == long_history_repo
+    assert Git().last_commit("missing.txt") is None
+
+
+@pytest.mark.usefixtures("multiversion_repo")
+def test_read_notes():
+    git = Git()
+    initial, update = git.rev_parse("0.0.1"), git.rev_parse("0.0.2")
+    git.add_note("refs/notes/test", initial, "same")
+    git.add_note("refs/notes/test", update, "same")
+    git.add_note("refs/notes/other", update, "multi\nline\n")
+
+    assert git.read_notes("refs/notes/test") == {initial: "same\n", update: "same\n"}
+    assert git.read_notes("refs/notes/other") == {update: "multi\nline\n"}
+    assert git.read_notes("refs/notes/missing") == {}
+
+
+@pytest.fixture()
+def blobs(multiversion_repo):
+    names = []
+    for i, content in enumerate([b"", b"short", b"x" * 100, "unicode \u2603\n".encode()]):
+        f = multiversion_repo.workspace / f"blob{i}"
+        f.write_bytes(content)
+        names.append(multiversion_repo.run(f"git hash-object -w blob{i}", capture=True).strip())
+    return names
+
+
+@pytest.mark.parametrize("chunk_size", [1, 8, 64 * 1024])
+def test_batch_reader(blobs, monkeypatch, chunk_size):
+    monkeypatch.setattr(vcs, "LOG_CHUNK_SIZE", chunk_size)
+    missing = "0" * 40
+
+    with Git().batch_reader() as reader:
+        objects = [
+            (name, object_type, bytes(content or b"")) for name, object_type, content in reader.read([*blobs, missing])
+        ]
+
+    assert objects == [
+        *(
+            (name, "blob", subprocess.check_output(["git", "cat-file", "blob", name]))  # noqa: S603, S607
+            for name in blobs
+        ),
+        (missing, None, b""),
+    ]
+
+
+def test_batch_reader_single_process(blobs, monkeypatch):
+    popen = mock.Mock(wraps=subprocess.Popen)
+    monkeypatch.setattr(vcs.subprocess, "Popen", popen)
+
+    with Git().batch_reader() as reader:
+        # Stop part way, the remaining responses are discarded.
+        for _ in reader.read(blobs):
+            break
+        objects = list(reader.read(reversed(blobs)))
+
+    assert [name for name, _, _ in objects] == list(reversed(blobs))
+    assert popen.call_count == 1
+
+
+def test_batch_reader_returns_views(blobs):
+    with Git().batch_reader() as reader:
+        _, _, content = next(iter(reader.read(blobs[1:2])))
+
+    assert isinstance(content, memoryview)
+    assert content == b"short"
+
+
+def test_batch_reader_benchmark(multiversion_repo):
+    names = []
+    for i in range(50):
+        f = multiversion_repo.workspace / "bench"
+        f.write_text(f"content {i}")
+        names.append(multiversion_repo.run("git hash-object -w bench", capture=True).strip())
+
+    start = time.perf_counter()
+    expected = [subprocess.check_output(["git", "cat-file", "blob", name]) for name in names]  # noqa: S603, S607
+    per_object = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with Git().batch_reader() as reader:
+        contents = [bytes(content) for _, _, content in reader.read(names)]
+    batched = time.perf_counter() - start
+
+    assert contents == expected
+    assert batched < per_object
+
+
+@pytest.mark.usefixtures("multiversion_repo")
+def test_iter_logs_raises_on_git_failure():
+    with pytest.raises(subprocess.CalledProcessError):
+        list(Git().iter_logs("unknown-tag"))
+
+
+def test_iter_tagged_logs(multiversion_repo):
+    multiversion_repo.api.create_tag("a-random-tag")
+
+    logs = list(Git().iter_tagged_logs())
+
+    assert [(sorted(tags), message) for _, _, _, tags, _, message in logs] == [
+        (["0.0.2", "a-random-tag"], "update"),
+        (["0.0.1"], "initial commit"),
+    ]
+    assert logs[0][1] == str(multiversion_repo.api.head.commit)
+    assert logs[0][2] == [logs[1][1]]
+    assert logs[1][2] == []
+    assert logs[0][4] == multiversion_repo.api.head.commit.committed_date
+
+
+@pytest.fixture()
+def monorepo(git_repo):
+    def commit(path, message):
+        f = git_repo.workspace / path
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.write_text(f"{f.read_text() if f.exists() else ''}{message}\n")
+        git_repo.run(f"git add {path}")
+        git_repo.run(f"git commit -q -m '{message}'")
+        return git_repo.run("git rev-parse HEAD", capture=True).strip()
+
+    commit("core/a.txt", "core initial")
+    commit("utils/a.txt", "utils initial")
+    git_repo.run("git tag core-0.0.1")
+    shared = commit("utils/b.txt", "utils change")
+    git_repo.run("git tag utils-0.0.1")
+    git_repo.run("git checkout -q -b feature")
+    feature = commit("core/b.txt", "core feature")
+    git_repo.run("git checkout -q master")
+    both = commit("core/a.txt", "core and utils")
+    git_repo.run("git merge -q --no-ff feature -m 'Merge feature'")
+    merge = git_repo.run("git rev-parse HEAD", capture=True).strip()
+
+    return {"shared": shared, "feature": feature, "both": both, "merge": merge}
+
+
+def test_iter_changed_logs(monorepo):
+    logs = list(Git().iter_changed_logs(["HEAD"], ["utils-0.0.1"]))
+
+    assert sorted((message, commit_hash, files) for _, commit_hash, _, files, message in logs) == [
+        ("Merge feature\n", monorepo["merge"], []),
+        ("core and utils\n", monorepo["both"], ["core/a.txt"]),
+        ("core feature\n", monorepo["feature"], ["core/b.txt"]),
+    ]
+    assert logs[0][2] == [monorepo["both"], monorepo["feature"]]
+
+
+def test_partition_logs(monorepo):
+    partitions = Git().partition_logs({"core": "core-0.0.1", "utils": "utils-0.0.1", "all": None})
+
+    assert {log[1] for log in partitions["core"]} == {
+        monorepo["merge"],
+        monorepo["both"],
+        monorepo["feature"],
+        monorepo["shared"],
+    }
+    assert {log[1] for log in partitions["utils"]} == {monorepo["merge"], monorepo["both"], monorepo["feature"]}
+    assert len(partitions["all"]) == 6  # noqa: PLR2004
+    files = {log[1]: log[2] for log in partitions["core"]}
+    assert files[monorepo["shared"]] == ["utils/b.txt"]
+    assert files[monorepo["merge"]] == []
+
+
+def test_partition_logs_stops_untagged_keys(monorepo):
+    partitions = Git().partition_logs({"core": "core-0.0.1", "all": None}, stop_at={"all": monorepo["shared"]})
+
+    assert {log[1] for log in partitions["all"]} == {monorepo["merge"], monorepo["both"], monorepo["feature"]}
+    assert {log[1] for log in partitions["core"]} == {
+        monorepo["merge"],
+        monorepo["both"],
+        monorepo["feature"],
+        monorepo["shared"],
+    }
+
+
+@pytest.mark.usefixtures("monorepo")
+def test_partition_logs_bounds_walk():
+    partitions = Git().partition_logs({"all": None}, max_count=2)
+
+    assert len(partitions["all"]) == 2  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("monorepo")
+def test_partition_logs_single_walk(monkeypatch):
+    popen = mock.Mock(wraps=subprocess.Popen)
+    monkeypatch.setattr(vcs.subprocess, "Popen", popen)
+
+    Git().partition_logs({"core": "core-0.0.1", "utils": "utils-0.0.1"})
+
+    logs = [c for c in popen.call_args_list if c.args[0][:2] == ["git", "log"]]
+    assert len(logs) == 1
+    # History shared by every tag is not walked.
+    assert logs[0].args[0][-3:] == ["--not", Git().rev_parse("core-0.0.1"), "--"]
+
+
+@pytest.mark.usefixtures("monorepo")
+def test_find_tag_with_prefix():
+    index = Git().tag_index()
+
+    assert index.find("0.0.1", "core-").name == "core-0.0.1"
+    assert index.find("0.0.2", "core-") is None
+    # Without a prefix, any prefixed tag is found, the first by name.
+    assert index.find("0.0.1").name == "core-0.0.1"
+
+
 def test_commit(multiversion_repo):
     path = multiversion_repo.workspace
     f = path / "hello.txt"
@@ -254,6 +760,21 @@ def test_revert(multiversion_repo):
     assert multiversion_repo.api.head.commit.message == "commit log"
 
 
+def test_revert_to_commit_deletes_discarded_tags(multiversion_repo):
+    base = multiversion_repo.run("git rev-parse HEAD", capture=True).strip()
+    f = multiversion_repo.workspace / "hello.txt"
+    for i in range(2):
+        f.write_text(f"hello world! v{i}")
+        multiversion_repo.run("git add hello.txt")
+        multiversion_repo.api.index.commit(f"release {i}")
+        multiversion_repo.api.create_tag(f"pkg{i}-1.0.0")
+
+    Git().revert(base)
+
+    assert multiversion_repo.run("git rev-parse HEAD", capture=True).strip() == base
+    assert sorted(multiversion_repo.run("git tag", capture=True).split()) == ["0.0.1", "0.0.2"]
+
+
 def test_revert_dry_run(multiversion_repo):
     path = multiversion_repo.workspace
     f = path / "hello.txt"
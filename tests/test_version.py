@@ -1,3 +1,4 @@
+import asyncio
 from unittest import mock
 
 import pytest
@@ -126,6 +127,73 @@ parts.release.optional_value = "final"
 
         assert version.BumpVersion().get_version_info(semver) == {"current": current_version, "new": new_version}
 
+    @pytest.mark.skipif(version.bump_library == "bump2version", reason="bump2version installed")
+    def test_get_version_info_in_process(self, cwd, monkeypatch):
+        p = cwd / "pyproject.toml"
+        p.write_text(
+            """
+[tool.bumpversion]
+current_version = "1.2.3"
+commit = false
+tag = false
+        """.strip(),
+        )
+        monkeypatch.setattr(version.subprocess, "check_output", mock.Mock(side_effect=AssertionError))
+        monkeypatch.setattr(version, "version_candidates", mock.Mock(wraps=version.version_candidates))
+
+        bv = version.BumpVersion()
+        assert bv.get_version_info("patch") == {"current": "1.2.3", "new": "1.2.4"}
+        assert bv.get_version_info("minor") == {"current": "1.2.3", "new": "1.3.0"}
+        assert bv.get_version_info("major") == {"current": "1.2.3", "new": "2.0.0"}
+
+        assert version.version_candidates.call_count == 1
+        assert version.subprocess.check_output.call_count == 0
+
+    @pytest.mark.skipif(version.bump_library == "bump2version", reason="bump2version installed")
+    def test_get_version_info_package_path(self, cwd):
+        (cwd / "pyproject.toml").write_text('[tool.bumpversion]\ncurrent_version = "0.1.0"')
+        package = cwd / "packages" / "core"
+        package.mkdir(parents=True)
+        (package / ".bumpversion.toml").write_text('[tool.bumpversion]\ncurrent_version = "1.2.3"')
+
+        assert version.BumpVersion(path=package).get_version_info("minor") == {"current": "1.2.3", "new": "1.3.0"}
+        assert version.BumpVersion().get_version_info("minor") == {"current": "0.1.0", "new": "0.2.0"}
+
+    @pytest.mark.skipif(version.bump_library == "bump2version", reason="bump2version installed")
+    def test_get_version_info_async(self, cwd):
+        p = cwd / "pyproject.toml"
+        p.write_text(
+            """
+[tool.bumpversion]
+current_version = "1.2.3"
+commit = false
+tag = false
+        """.strip(),
+        )
+
+        bv = version.BumpVersion()
+        assert asyncio.run(bv.get_version_info_async("minor")) == {"current": "1.2.3", "new": "1.3.0"}
+
+    @pytest.mark.usefixtures("cwd")
+    def test_get_version_info_async_errors_wrapped(self):
+        with pytest.raises(errors.VersionDetectionError):
+            asyncio.run(version.BumpVersion().get_version_info_async("patch"))
+
+    @pytest.mark.skipif(version.bump_library == "bump2version", reason="bump2version installed")
+    def test_get_version_info_invalid_part(self, cwd):
+        p = cwd / "pyproject.toml"
+        p.write_text(
+            """
+[tool.bumpversion]
+current_version = "1.2.3"
+commit = false
+tag = false
+        """.strip(),
+        )
+
+        with pytest.raises(errors.VersionDetectionError, match="Unable to bump version part 'build'."):
+            version.BumpVersion().get_version_info("build")
+
     @pytest.mark.skipif(version.bump_library == "bump2version", reason="bump2version installed")
     @pytest.mark.parametrize(
         ("kwargs", "expected_command_args"),
@@ -142,6 +210,7 @@ parts.release.optional_value = "final"
         assert version.subprocess.check_output.call_args == mock.call(
             ["bump-my-version", "bump", "patch", "--new-version", "1.2.3"] + expected_command_args,  # noqa: RUF005
             stderr=version.subprocess.STDOUT,
+            cwd=None,
         )
 
     @pytest.mark.usefixtures("cwd")
@@ -234,4 +303,5 @@ values =
         assert version.subprocess.check_output.call_args == mock.call(
             ["bumpversion", "patch", "--new-version", "1.2.3"] + expected_command_args,  # noqa: RUF005
             stderr=version.subprocess.STDOUT,
+            cwd=None,
         )
@@ -1,3 +1,4 @@
+import io
 from unittest import mock
 
 import pytest
@@ -62,12 +63,15 @@ class TestBaseWriter:
         assert w.content == []
         assert w.dry_run is True
 
-    def test_init_no_existing_entries(self, changelog, cfg):
+    def test_copy_existing_no_entries(self, changelog, cfg):
         w = writer.BaseWriter(changelog, cfg)
+        output = io.BytesIO()
 
-        assert w.existing == []
+        w._copy_existing(output)
 
-    def test_init_stores_existing_changelog(self, changelog, cfg):
+        assert output.getvalue() == b""
+
+    def test_copy_existing_entries(self, changelog, cfg):
         changelog.write_text(
             """
 ## 0.0.1
@@ -80,17 +84,11 @@ class TestBaseWriter:
 """,
         )
         w = writer.BaseWriter(changelog, cfg)
+        output = io.BytesIO()
 
-        assert w.existing == [
-            "## 0.0.1",
-            "",
-            "### header",
-            "",
-            "- line1",
-            "- line2",
-            "- line3",
-            "",
-        ]
+        w._copy_existing(output)
+
+        assert output.getvalue() == b"\n## 0.0.1\n\n### header\n\n- line1\n- line2\n- line3\n"
 
     def test_content_as_str(self, changelog, cfg):
         w = writer.BaseWriter(changelog, cfg)
@@ -176,12 +174,15 @@ class TestMdWriter:
         assert w.content == []
         assert w.dry_run is True
 
-    def test_init_no_existing_entries(self, changelog_md, cfg):
+    def test_copy_existing_no_entries(self, changelog_md, cfg):
         w = writer.MdWriter(changelog_md, cfg)
+        output = io.BytesIO()
+
+        w._copy_existing(output)
 
-        assert w.existing == []
+        assert output.getvalue() == b""
 
-    def test_init_stores_existing_changelog(self, changelog_md, cfg):
+    def test_copy_existing_entries(self, changelog_md, cfg):
         changelog_md.write_text(
             """# Changelog
 
@@ -196,17 +197,11 @@ class TestMdWriter:
         )
 
         w = writer.MdWriter(changelog_md, cfg)
+        output = io.BytesIO()
 
-        assert w.existing == [
-            "## 0.0.1",
-            "",
-            "### header",
-            "",
-            "- line1",
-            "- line2",
-            "- line3",
-            "",
-        ]
+        w._copy_existing(output)
+
+        assert output.getvalue() == b"\n## 0.0.1\n\n### header\n\n- line1\n- line2\n- line3\n"
 
     def test_add_version(self, changelog_md, cfg):
         w = writer.MdWriter(changelog_md, cfg)
@@ -359,6 +354,48 @@ class TestMdWriter:
 """
         )
 
+    def test_write_streams_existing_content_in_chunks(self, changelog_md, cfg, monkeypatch):
+        monkeypatch.setattr(writer, "COPY_CHUNK_SIZE", 7)
+        existing = "".join(f"## 0.0.{i}\n\n### header\n\n- line{i}\n\n" for i in range(100))
+        changelog_md.write_text(f"# Changelog\n\n{existing}")
+
+        w = writer.MdWriter(changelog_md, cfg)
+        w.add_version("0.1.0")
+        w.add_section("header", {"1": Change("1", "line", "fix")})
+        w.write()
+
+        assert changelog_md.read_text() == f"# Changelog\n\n## 0.1.0\n\n### header\n\n- line [#1]\n\n{existing}"
+
+    def test_write_failure_leaves_changelog_untouched(self, changelog_md, cfg, monkeypatch):
+        changelog_md.write_text("# Changelog\n\n## 0.0.1\n")
+        monkeypatch.setattr(writer.shutil, "copyfileobj", mock.Mock(side_effect=OSError("disk full")))
+
+        w = writer.MdWriter(changelog_md, cfg)
+        w.add_version("0.0.2")
+        with pytest.raises(OSError, match="disk full"):
+            w.write()
+
+        assert changelog_md.read_text() == "# Changelog\n\n## 0.0.1\n"
+        assert [p.name for p in changelog_md.parent.iterdir()] == ["CHANGELOG.md"]
+
+    def test_write_preserves_file_mode(self, changelog_md, cfg):
+        changelog_md.chmod(0o640)
+
+        w = writer.MdWriter(changelog_md, cfg)
+        w.add_version("0.0.1")
+        w.write()
+
+        assert changelog_md.stat().st_mode & 0o777 == 0o640  # noqa: PLR2004
+
+    def test_write_creates_new_file(self, tmp_path, cfg):
+        changelog = tmp_path / "CHANGELOG.md"
+
+        w = writer.MdWriter(changelog, cfg)
+        w.write()
+
+        assert changelog.read_text() == "# Changelog\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["CHANGELOG.md"]
+
 
 class TestRstWriter:
     def test_init(self, changelog_rst, cfg):
@@ -373,12 +410,15 @@ class TestRstWriter:
         assert w.content == []
         assert w.dry_run is True
 
-    def test_init_no_existing_entries(self, changelog_rst, cfg):
+    def test_copy_existing_no_entries(self, changelog_rst, cfg):
         w = writer.RstWriter(changelog_rst, cfg)
+        output = io.BytesIO()
+
+        w._copy_existing(output)
 
-        assert w.existing == []
+        assert output.getvalue() == b""
 
-    def test_init_stores_existing_changelog(self, changelog_rst, cfg):
+    def test_copy_existing_entries(self, changelog_rst, cfg):
         changelog_rst.write_text(
             """=========
 Changelog
@@ -399,21 +439,11 @@ header
         )
 
         w = writer.RstWriter(changelog_rst, cfg)
+        output = io.BytesIO()
 
-        assert w.existing == [
-            "0.0.1",
-            "=====",
-            "",
-            "header",
-            "------",
-            "",
-            "* line1",
-            "",
-            "* line2",
-            "",
-            "* line3",
-            "",
-        ]
+        w._copy_existing(output)
+
+        assert output.getvalue() == b"\n0.0.1\n=====\n\nheader\n------\n\n* line1\n\n* line2\n\n* line3\n"
 
     def test_add_version(self, changelog_rst, cfg):
         w = writer.RstWriter(changelog_rst, cfg)